@@ -6,7 +6,8 @@ from spice_rack._bases import (
     _dispatchable as dispatchable,
     _special_str as special_str,
     _settings as settings,
-    _exception as exceptions
+    _exception as exceptions,
+    _raw_json as raw_json
 )
 
 
@@ -3,6 +3,8 @@ import typing as t
 
 import pydantic
 
+from spice_rack._bases import _raw_json
+
 
 __all__ = (
     "BASE_MODEL_CONFIG",
@@ -60,6 +62,14 @@ class PydanticBase(pydantic.BaseModel):
 
         return self
 
+    def model_dump_json(self, **pydantic_kwargs) -> str:
+        """
+        same as pydantic's, except values whose serializer already has them encoded as json, e.g. polars
+        dataframes, are embedded directly rather than going through python objects first.
+        """
+        with _raw_json.collect_raw_json() as substitute:
+            return substitute(super().model_dump_json(**pydantic_kwargs))
+
     def json_dict(
             self,
             use_str_fallback: bool = True,
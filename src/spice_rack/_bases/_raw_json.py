@@ -0,0 +1,75 @@
+from __future__ import annotations
+import contextlib
+import contextvars
+import re
+import typing as t
+import uuid
+
+
+__all__ = (
+    "raw_json_enabled",
+    "embed_raw_json",
+    "collect_raw_json",
+)
+
+
+class _Fragments:
+    """the raw json fragments of a single dump, keyed by the placeholder we serialized in their place"""
+    __slots__ = ("token", "fragments", "pattern")
+
+    def __init__(self):
+        self.token = f"__spice_rack_raw_json_{uuid.uuid4().hex}_"
+        self.fragments: t.List[str] = []
+        self.pattern = re.compile(f'"{self.token}(\\d+)"')
+
+    def add(self, raw_json: str) -> str:
+        self.fragments.append(raw_json)
+        return f"{self.token}{len(self.fragments) - 1}"
+
+    def substitute(self, dumped_json: str) -> str:
+        if not self.fragments:
+            return dumped_json
+        return self.pattern.sub(lambda match: self.fragments[int(match.group(1))], dumped_json)
+
+
+_active_fragments: contextvars.ContextVar[t.Optional[_Fragments]] = contextvars.ContextVar(
+    "_active_fragments", default=None
+)
+
+
+def raw_json_enabled() -> bool:
+    """True while dumping to a json string, i.e. a serializer may hand over already encoded json"""
+    return _active_fragments.get() is not None
+
+
+def embed_raw_json(raw_json: str) -> str:
+    """
+    register already encoded json for the active dump, return the placeholder the serializer should
+    return instead. The placeholder is swapped for the raw json once the dump finishes, so the value
+    is never decoded into python objects and encoded again.
+
+    Raises:
+        RuntimeError: if we are not inside 'collect_raw_json', check 'raw_json_enabled' first
+    """
+    fragments = _active_fragments.get()
+    if fragments is None:
+        raise RuntimeError("raw json can only be embedded while dumping to a json string")
+    return fragments.add(raw_json)
+
+
+@contextlib.contextmanager
+def collect_raw_json() -> t.Iterator[t.Callable[[str], str]]:
+    """
+    enable raw json fragments for the duration of the block. Yields the function that swaps the
+    placeholders in the dumped json string for the fragments.
+
+    Examples:
+        with collect_raw_json() as substitute:
+            dumped = substitute(model.__pydantic_serializer__.to_json(model).decode())
+    """
+    fragments = _Fragments()
+    reset_token = _active_fragments.set(fragments)
+    try:
+        yield fragments.substitute
+    finally:
+        _active_fragments.reset(reset_token)
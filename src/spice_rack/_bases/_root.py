@@ -2,6 +2,8 @@ from __future__ import annotations
 import typing as t
 import pydantic
 
+from spice_rack._bases import _raw_json
+
 
 __all__ = (
     "RootModel",
@@ -61,6 +63,14 @@ class RootModel(pydantic.RootModel[RootTV], t.Generic[RootTV]):
         self._post_init_validation()
         return self
 
+    def model_dump_json(self, **pydantic_kwargs) -> str:
+        """
+        same as pydantic's, except values whose serializer already has them encoded as json, e.g. polars
+        dataframes, are embedded directly rather than going through python objects first.
+        """
+        with _raw_json.collect_raw_json() as substitute:
+            return substitute(super().model_dump_json(**pydantic_kwargs))
+
     def json_dict(
             self,
             use_str_fallback: bool = True,
@@ -1,12 +1,19 @@
 from spice_rack._fs_ops import (
     _fs_models as fs_models,
     _file_info as file_info,
+    _file_stat as file_stat,
     _file_systems as file_systems,
     _path_strs as path_strs,
     _exceptions as exceptions,
-    _constraints as constraints
+    _constraints as constraints,
+    _read_cache as read_cache,
+    _resilience as resilience,
+    _io_stats as io_stats
 )
 
 # maintain simplify imports
 from spice_rack._fs_ops._fs_models import *  # ruff: noqa: SLF001
 from spice_rack._fs_ops._file_info import *
+from spice_rack._fs_ops._file_stat import *
+from spice_rack._fs_ops._read_cache import ReadCacheConfig
+from spice_rack._fs_ops._resilience import RetryPolicy
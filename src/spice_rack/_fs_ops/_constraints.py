@@ -1,5 +1,7 @@
 from __future__ import annotations
+import threading
 import typing as t
+from concurrent import futures
 import pydantic
 import pydantic_core
 
@@ -11,21 +13,171 @@ if t.TYPE_CHECKING:
 
 __all__ = (
     "ExistsConstraint",
+    "ExistsCheckBatch",
+    "validate_with_batched_exists_checks",
     "FileExtConstraint",
 )
 
 
+_T = t.TypeVar("_T")
+
+
 # these cannot be pydantic models themselves
 
 
+class ExistsCheckBatch:
+    """
+    collects the existence checks of every ExistsConstraint hit while validating, so they can run
+    as one concurrent batch instead of one round trip per path. Check results are cached on the
+    batch, so reusing a batch across validations doesn't repeat checks.
+
+    Pass it to validation with 'as_context', or use 'validate_with_batched_exists_checks'
+    which handles both validation passes.
+    """
+    context_key: t.ClassVar[str] = "spice_rack_exists_check_batch"
+    """the key we look for the batch under in the pydantic validation context"""
+
+    def __init__(self, max_workers: int = 32):
+        self._max_workers = max_workers
+        self._pending: t.Dict[t.Tuple[t.Any, str], _fs_models.FileOrDirPathT] = {}
+        self._results: t.Dict[t.Tuple[t.Any, str], bool] = {}
+        self._lock = threading.Lock()
+        self.collecting = True
+        """if True, constraints register their checks, if False they use the cached results"""
+
+    @staticmethod
+    def _get_key(fs_obj: _fs_models.FileOrDirPathT) -> t.Tuple[t.Any, str]:
+        return fs_obj.file_system, str(fs_obj.path)
+
+    @classmethod
+    def from_context(cls, context: t.Optional[t.Dict[str, t.Any]]) -> t.Optional[ExistsCheckBatch]:
+        """the batch in the validation context, if there is one"""
+        if isinstance(context, dict):
+            batch = context.get(cls.context_key)
+            if isinstance(batch, ExistsCheckBatch):
+                return batch
+        return None
+
+    def as_context(self) -> t.Dict[str, t.Any]:
+        """the validation context to pass to 'model_validate' or 'validate_python'"""
+        return {self.context_key: self}
+
+    def register(self, fs_obj: _fs_models.FileOrDirPathT) -> None:
+        """add the path to the pending checks, unless it was checked already"""
+        key = self._get_key(fs_obj)
+        with self._lock:
+            if key not in self._results:
+                self._pending[key] = fs_obj
+
+    def get_result(self, fs_obj: _fs_models.FileOrDirPathT) -> t.Optional[bool]:
+        """the cached existence of the path, None if it wasn't checked yet"""
+        with self._lock:
+            return self._results.get(self._get_key(fs_obj))
+
+    def run(self) -> t.List[_fs_models.FileOrDirPathT]:
+        """
+        run the pending checks concurrently.
+
+        Returns:
+            the paths among the pending checks that don't exist
+        """
+        with self._lock:
+            pending = list(self._pending.items())
+            self._pending.clear()
+        if not pending:
+            return []
+
+        max_workers = min(self._max_workers, len(pending))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda item: item[1].exists(), pending))
+
+        missing = []
+        with self._lock:
+            for (key_i, fs_obj_i), exists_i in zip(pending, results):
+                self._results[key_i] = exists_i
+                if not exists_i:
+                    missing.append(fs_obj_i)
+        return missing
+
+
+def validate_with_batched_exists_checks(
+        validator: t.Union[t.Type[pydantic.BaseModel], pydantic.TypeAdapter],
+        data: t.Any,
+        *,
+        batch: t.Optional[ExistsCheckBatch] = None,
+        context: t.Optional[t.Dict[str, t.Any]] = None,
+) -> t.Any:
+    """
+    validate the data, running the existence checks of every ExistsConstraint in one concurrent batch.
+
+    The first pass only collects the paths to check. If any of them don't exist, we validate a
+    second time against the cached results, which raises the usual pydantic errors without making
+    any more calls to the file systems.
+
+    Args:
+        validator: the model class or type adapter to validate with
+        data: the raw data
+        batch: the batch to use, pass the same one to reuse cached results across validations
+        context: any other validation context
+
+    Returns:
+        the validated model or value
+
+    Raises:
+        ValidationError: if the data is invalid, including any paths that don't exist
+    """
+    batch = batch if batch is not None else ExistsCheckBatch()
+    context = {**(context or {}), **batch.as_context()}
+
+    def _validate() -> t.Any:
+        if isinstance(validator, pydantic.TypeAdapter):
+            return validator.validate_python(data, context=context)
+        return validator.model_validate(data, context=context)
+
+    batch.collecting = True
+    res = _validate()
+    missing = batch.run()
+    if not missing:
+        return res
+
+    batch.collecting = False
+    try:
+        return _validate()
+    finally:
+        batch.collecting = True
+
+
 class ExistsConstraint:
-    """ensures the fs obj path exists"""
+    """
+    ensures the fs obj path exists.
+
+    By default, each path is checked when it's validated. If the validation context holds an
+    ExistsCheckBatch, see 'validate_with_batched_exists_checks', the checks are batched instead.
+    """
 
     @staticmethod
-    def _get_func() -> pydantic_core.core_schema.NoInfoValidatorFunction:
-        def _func(fs_obj: _fs_models.FileOrDirPathT) -> _fs_models.FileOrDirPathT:
+    def _get_func() -> pydantic_core.core_schema.WithInfoValidatorFunction:
+        def _func(
+                fs_obj: _fs_models.FileOrDirPathT,
+                info: pydantic_core.core_schema.ValidationInfo
+        ) -> _fs_models.FileOrDirPathT:
+            batch = ExistsCheckBatch.from_context(info.context)
             try:
-                fs_obj.ensure_exists()
+                if batch is None:
+                    fs_obj.ensure_exists()
+
+                elif batch.collecting:
+                    batch.register(fs_obj)
+
+                else:
+                    exists = batch.get_result(fs_obj)
+                    if exists is None:
+                        fs_obj.ensure_exists()
+                    elif not exists:
+                        raise _exceptions.NonExistentPathException(
+                            file_system=fs_obj.file_system,
+                            path=fs_obj.path,
+                        )
 
             except _exceptions.NonExistentPathException as e:
                 raise e.as_pydantic_error()
@@ -45,7 +197,7 @@ class ExistsConstraint:
 
         # todo: add info to the schema
         schema = __handler(__source)
-        schema = pydantic_core.core_schema.no_info_after_validator_function(
+        schema = pydantic_core.core_schema.with_info_after_validator_function(
             function=val_func,
             schema=schema
         )
@@ -7,7 +7,9 @@ from spice_rack import _bases
 
 __all__ = (
     "FileExt",
-    "MimeType"
+    "MimeType",
+    "sniff_mime_type",
+    "get_sniff_header_size",
 )
 
 
@@ -39,6 +41,16 @@ class FileExt(_bases.special_str.SpecialStrBase):
 _FILE_EXTENSIONS_SET = set(mimetypes.types_map.keys())
 _MIME_TYPES_SET = set(mimetypes.types_map.values())
 
+_FILE_EXT_TO_MIME_TYPE: t.Dict[str, str] = {
+    file_ext[1:]: mime_type for file_ext, mime_type in mimetypes.types_map.items()
+}
+"""forward index, file extension without the dot to mime type"""
+
+_MIME_TYPE_TO_FILE_EXTS: t.Dict[str, t.Tuple[str, ...]] = {}
+"""reverse index, mime type to every file extension with the dot, in the order of 'mimetypes.types_map'"""
+for _file_ext, _mime_type in mimetypes.types_map.items():
+    _MIME_TYPE_TO_FILE_EXTS[_mime_type] = _MIME_TYPE_TO_FILE_EXTS.get(_mime_type, ()) + (_file_ext,)
+
 
 class MimeType(_bases.special_str.SpecialStrBase):
     """
@@ -83,14 +95,17 @@ class MimeType(_bases.special_str.SpecialStrBase):
         Returns: the mime type if it is found, value error if nothing found
         """
         if file_ext_or_dot_file_ext.startswith("."):
-            file_ext = file_ext_or_dot_file_ext[1:]
+            file_ext = str(file_ext_or_dot_file_ext[1:])
         else:
-            file_ext = file_ext_or_dot_file_ext
+            file_ext = str(file_ext_or_dot_file_ext)
+
+        mime_type = _FILE_EXT_TO_MIME_TYPE.get(file_ext) or _FILE_EXT_TO_MIME_TYPE.get(file_ext.lower())
 
-        # make placeholder path-like str for the stdlib lookup func.
+        # fall back to the stdlib lookup func, for types added after import
         # https://docs.python.org/3/library/mimetypes.html#mimetypes.guess_type
-        path_like = f"x.{file_ext}"
-        mime_type, content_encoding = mimetypes.guess_type(url=path_like, strict=True)
+        if mime_type is None:
+            path_like = f"x.{file_ext}"
+            mime_type, content_encoding = mimetypes.guess_type(url=path_like, strict=True)
         if mime_type is None:
             raise ValueError(
                 f"failed to find mimetype for file ext: '{file_ext_or_dot_file_ext}'"
@@ -100,8 +115,110 @@ class MimeType(_bases.special_str.SpecialStrBase):
 
     def get_possible_file_extensions(self) -> list[FileExt]:
         """return the list of file extensions for this file mimetype"""
-        res = []
-        for file_ext, mime_type in mimetypes.types_map.items():
-            if mime_type == str(self):
-                res.append(FileExt(file_ext))
-        return res
+        return [FileExt(file_ext) for file_ext in _MIME_TYPE_TO_FILE_EXTS.get(str(self), ())]
+
+
+_SNIFF_HEADER_SIZE = 512
+"""the number of leading bytes we need to match every signature"""
+
+_MAGIC_SIGNATURES: t.Tuple[t.Tuple[int, bytes, str], ...] = (
+    # (offset, signature, mime type)
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"II*\x00", "image/tiff"),
+    (0, b"MM\x00*", "image/tiff"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"PK\x05\x06", "application/zip"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"\x28\xb5\x2f\xfd", "application/zstd"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"PAR1", "application/vnd.apache.parquet"),
+    (0, b"ARROW1", "application/vnd.apache.arrow.file"),
+    (0, b"Obj\x01", "application/avro"),
+    (0, b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (257, b"ustar", "application/x-tar"),
+)
+"""binary formats, identified by the bytes at an offset"""
+
+_BZIP2_BLOCK_MAGICS = (b"1AY&SY", b"\x17rE8P\x90")
+"""what follows the 'BZh' + block size header, the first block, or the end of an empty stream"""
+
+_RIFF_SUBTYPES: t.Dict[bytes, str] = {
+    b"WEBP": "image/webp",
+    b"WAVE": "audio/x-wav",
+    b"AVI ": "video/x-msvideo",
+}
+
+
+def get_sniff_header_size() -> int:
+    """the number of leading bytes 'sniff_mime_type' needs to check every signature"""
+    return _SNIFF_HEADER_SIZE
+
+
+def sniff_mime_type(header: bytes) -> t.Optional[MimeType]:
+    """
+    detect the mime type from the leading bytes of a file's content, matching the magic signatures of
+    common binary formats, then checking for json, xml, html, csv and plain text.
+
+    Args:
+        header: the leading bytes of the file, see 'get_sniff_header_size' for how many to pass
+
+    Returns:
+        the detected mime type, None if nothing matched
+    """
+    for offset, signature, mime_type in _MAGIC_SIGNATURES:
+        if header.startswith(signature, offset):
+            return MimeType(mime_type)
+
+    if header.startswith(b"RIFF"):
+        riff_mime_type = _RIFF_SUBTYPES.get(header[8:12])
+        if riff_mime_type:
+            return MimeType(riff_mime_type)
+
+    # the 3 byte magics also start plain text, so we check what follows them
+    if header.startswith(b"BZh") and header[3:4] in b"123456789" and header[4:10] in _BZIP2_BLOCK_MAGICS:
+        return MimeType("application/x-bzip2")
+
+    text_mime_type = _sniff_text_mime_type(header)
+    if text_mime_type is None and header.startswith(b"ORC"):
+        return MimeType("application/vnd.apache.orc")
+    return text_mime_type
+
+
+def _sniff_text_mime_type(header: bytes) -> t.Optional[MimeType]:
+    if not header or b"\x00" in header:
+        return None
+    try:
+        text = header.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        # the header can cut a multibyte character in half
+        if e.start < len(header) - 3:
+            return None
+        text = header[:e.start].decode("utf-8-sig")
+
+    stripped = text.lstrip()
+    lowered = stripped[:64].lower()
+    if stripped.startswith(("{", "[")):
+        return MimeType("application/json")
+    if lowered.startswith(("<!doctype html", "<html")):
+        return MimeType("text/html")
+    if lowered.startswith("<?xml"):
+        return MimeType("text/xml")
+
+    # drop the last line if it might be cut off
+    lines = text.splitlines()
+    if not text.endswith("\n"):
+        lines = lines[:-1]
+    lines = [line for line in lines if line]
+    if len(lines) >= 2:
+        for delimiter in (",", "\t", "|", ";"):
+            counts = {line.count(delimiter) for line in lines}
+            if len(counts) == 1 and counts.pop() > 0:
+                if delimiter == "\t":
+                    return MimeType("text/tab-separated-values")
+                return MimeType("text/csv")
+    return MimeType("text/plain")
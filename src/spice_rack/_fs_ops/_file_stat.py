@@ -0,0 +1,40 @@
+from __future__ import annotations
+import typing as t
+import datetime as dt
+import pydantic
+
+from spice_rack import _bases
+from spice_rack._fs_ops import _path_strs
+
+
+__all__ = (
+    "FileStat",
+)
+
+
+class FileStat(_bases.ValueModelBase):
+    """
+    the listing metadata for a single file, normalized across file systems.
+    Anything the underlying file system doesn't report is left as None.
+    """
+    path: _path_strs.AbsoluteFilePathStr = pydantic.Field(
+        description="the absolute path of the file, without the file system-specific prefix"
+    )
+    size: t.Optional[int] = pydantic.Field(
+        description="the size of the file in bytes",
+        default=None
+    )
+    mtime: t.Optional[dt.datetime] = pydantic.Field(
+        description="when the file was last modified, tz-aware",
+        default=None
+    )
+    hash: t.Optional[str] = pydantic.Field(
+        description="a content hash reported by the file system, e.g. the md5 hash on gcs",
+        default=None
+    )
+
+    @pydantic.field_validator("mtime", mode="after")
+    def _ensure_tz_aware(cls, mtime: t.Optional[dt.datetime]) -> t.Optional[dt.datetime]:
+        if mtime is not None and mtime.tzinfo is None:
+            mtime = mtime.replace(tzinfo=dt.timezone.utc)
+        return mtime
@@ -1,11 +1,18 @@
 from __future__ import annotations
 from abc import abstractmethod
+import collections
+import datetime as dt
+import hashlib
+import os
+import threading
+import time
 import typing as t
+from concurrent import futures
 from fsspec.spec import AbstractFileSystem as AbstractFsSpecFileSystem
 import pydantic
 
 from spice_rack import _bases, _logging
-from spice_rack._fs_ops import _path_strs, _open_modes, _exceptions
+from spice_rack._fs_ops import _path_strs, _open_modes, _exceptions, _file_stat, _read_cache, _resilience, _io_stats
 
 
 __all__ = (
@@ -13,11 +20,66 @@ __all__ = (
 )
 
 
+_T = t.TypeVar("_T")
+
+
+def _stream_file_content(source_f: t.BinaryIO, dest_f: t.BinaryIO, chunk_size: int = 8 * 2 ** 20) -> int:
+    """
+    copy the content of one open file to another, 'chunk_size' bytes at a time
+
+    Returns:
+        the number of bytes copied
+    """
+    num_bytes = 0
+    for chunk in iter(lambda: source_f.read(chunk_size), b""):
+        dest_f.write(chunk)
+        num_bytes += len(chunk)
+    return num_bytes
+
+
+_OptionalDatetimeTypeAdapter: pydantic.TypeAdapter[t.Optional[dt.datetime]] = pydantic.TypeAdapter(
+    t.Optional[dt.datetime]
+)
+
+
 class AbstractFileSystem(
     _bases.dispatchable.DispatchableValueModelBase,
     _logging.log_extra.LoggableObjMixin
 ):
     """base class for all fsspec file system wrappers"""
+    read_block_size: t.Optional[int] = pydantic.Field(
+        description="the block size used when reading files on this file system instance. "
+                    "If not set, we fall back to the file system's class default.",
+        default=None,
+        gt=0
+    )
+    read_cache_type: t.Optional[_read_cache.CacheTypeT] = pydantic.Field(
+        description="the cache type used when reading files on this file system instance. "
+                    "If not set, we fall back to the file system's class default.",
+        default=None
+    )
+    retry_max_attempts: t.Optional[int] = pydantic.Field(
+        description="the max number of attempts of an operation failing with a transient error. "
+                    "If not set, we fall back to the file system's class default.",
+        default=None,
+        ge=1
+    )
+    op_timeout: t.Optional[float] = pydantic.Field(
+        description="the max number of seconds we wait for a single attempt of an operation. "
+                    "If not set, we fall back to the file system's class default.",
+        default=None,
+        gt=0
+    )
+    hedge_reads: t.Optional[bool] = pydantic.Field(
+        description="if True, slow reads are hedged with a duplicate read. "
+                    "If not set, we fall back to the file system's class default.",
+        default=None
+    )
+
+    _retry_policy: t.Optional[_resilience.RetryPolicy] = pydantic.PrivateAttr(default=None)
+    """resolved on first use, the fields are frozen so it can't go stale"""
+    _pickle_args: t.Optional[t.Tuple[str, str]] = pydantic.PrivateAttr(default=None)
+    """the config fingerprint and json, built on first pickle"""
 
     @abstractmethod
     def build_fsspec_file_system(self) -> AbstractFsSpecFileSystem:
@@ -44,11 +106,15 @@ class AbstractFileSystem(
 
         This is the inverse of 'contextualize_abs_path'.
         """
-        cleaned_path = __raw_path.replace(
-            cls.get_fs_specific_prefix(),
-            "/",
-            1
-        )
+        prefix = cls.get_fs_specific_prefix()
+        if __raw_path.startswith(prefix):
+            cleaned_path = __raw_path.replace(prefix, "/", 1)
+
+        # some fsspec implementations, e.g. gcsfs, return listed paths without the protocol
+        elif not __raw_path.startswith("/"):
+            cleaned_path = "/" + __raw_path
+        else:
+            cleaned_path = __raw_path
         return _path_strs.FileOrDirAbsPathTypeAdapter.validate_python(
             cleaned_path
         )
@@ -68,6 +134,14 @@ class AbstractFileSystem(
     def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
         ...
 
+    def get_polars_storage_options(self) -> t.Optional[t.Dict[str, str]]:
+        """
+        the storage options polars' native readers need to read paths on this file system directly,
+        with predicate and projection pushdown. None if polars can't read this file system itself,
+        then we read through the fsspec file system instead.
+        """
+        return None
+
     def __hash__(self) -> int:
         return hash(
             self.contextualize_abs_path(self.get_home_dir())
@@ -82,12 +156,127 @@ class AbstractFileSystem(
     def special_repr(self) -> str:
         return f"FileSystem[{self.class_id}]"
 
+    def _get_pickle_args(self) -> t.Tuple[str, str]:
+        # straight through the private dict, pydantic's attribute hooks are slow enough to show up here
+        private = self.__pydantic_private__
+        pickle_args = private.get("_pickle_args")
+        if pickle_args is None:
+            config_json = self.model_dump_json()
+            fingerprint = hashlib.sha256(config_json.encode()).hexdigest()
+            pickle_args, _ = _register_file_system(fingerprint, config_json, self)
+            private["_pickle_args"] = pickle_args
+        return pickle_args
+
+    def get_config_fingerprint(self) -> str:
+        """a hash of this instance's config, equal configs have equal fingerprints"""
+        return self._get_pickle_args()[0]
+
+    def __reduce__(self) -> t.Tuple[t.Callable[..., AbstractFileSystem], t.Tuple[str, str]]:
+        """
+        pickle as the config fingerprint and json. Unpickling reuses the process' instance with the same
+        fingerprint, so we validate each config and build its fsspec client once per process.
+        Instances with the same config share the args tuple, so pickle writes it once per payload.
+        """
+        return _restore_file_system, self._get_pickle_args()
+
     def __get_logger_data__(self) -> t.Dict:
         return {
             "file_system_type": self.class_id,
             "file_system_home_dir": self.contextualize_abs_path(self.get_home_dir())
         }
 
+    @classmethod
+    def get_default_retry_policy(cls) -> _resilience.RetryPolicy:
+        """the retry, timeout and hedging defaults for this file system type, overwrite this to customize it"""
+        return _resilience.RetryPolicy()
+
+    def get_retry_policy(self) -> _resilience.RetryPolicy:
+        """the class default retry policy, updated with the values set on this instance"""
+        if self._retry_policy is None:
+            self._retry_policy = self.get_default_retry_policy().merge(
+                _resilience.RetryPolicy(
+                    max_attempts=self.retry_max_attempts,
+                    timeout=self.op_timeout,
+                    hedge_reads=self.hedge_reads,
+                )
+            ).with_defaults()
+        return self._retry_policy
+
+    def _is_transient_error(self, error: BaseException) -> bool:
+        """
+        returns True if the operation that raised the error is worth retrying.
+        Overwrite this to add the transient errors specific to a file system.
+        """
+        return isinstance(error, (TimeoutError, ConnectionError))
+
+    def _run_fs_op(
+            self,
+            op_name: str,
+            func: t.Callable[..., _T],
+            *args: t.Any,
+            hedge: bool = False,
+            **kwargs: t.Any
+    ) -> _T:
+        """
+        run a single call against the fsspec file system, applying the retry policy and recording
+        the call to the io stats under this file system's class id.
+
+        Args:
+            op_name: the name of the operation, e.g. 'exists' or 'read'
+            func: the fsspec method to call
+            *args: positional args passed to the method
+            hedge: if True, the call is idempotent and can be hedged when the policy enables it
+            **kwargs: keyword args passed to the method
+
+        Returns:
+            the return value of the fsspec method
+        """
+        latency_tracker = None
+        if hedge:
+            latency_tracker = _resilience.get_latency_tracker(self._get_cache_namespace(), op_name)
+
+        start = time.perf_counter()
+        error = False
+        try:
+            return _resilience.call_with_retries(
+                lambda: func(*args, **kwargs),
+                policy=self.get_retry_policy(),
+                is_transient=self._is_transient_error,
+                latency_tracker=latency_tracker,
+                hedge=hedge,
+            )
+        except BaseException as e:
+            error = True
+            raise e
+        finally:
+            if _io_stats.io_stats_enabled():
+                _io_stats.get_io_stats().record_call(
+                    str(self.class_id), op_name, time.perf_counter() - start, error=error
+                )
+
+    def _record_bytes(self, op_name: str, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        """add the bytes transferred by an operation to the io stats"""
+        if _io_stats.io_stats_enabled():
+            _io_stats.get_io_stats().record_bytes(
+                str(self.class_id), op_name, bytes_read=bytes_read, bytes_written=bytes_written
+            )
+
+    def _wrap_opened_file(
+            self,
+            opened_file: _open_modes.OpenFileT,
+            count_reads: bool = True
+    ) -> _open_modes.OpenFileT:
+        """
+        count the bytes read and written through the opened file, if io stats are enabled. The
+        wrapper passes everything through, so callers still get the file-like interface.
+        """
+        if _io_stats.io_stats_enabled():
+            return t.cast(
+                _open_modes.OpenFileT,
+                _io_stats.CountingFile(opened_file, str(self.class_id), count_reads=count_reads)
+            )
+        return opened_file
+
     @pydantic.validate_call
     def exists(self, __path: _path_strs.FileOrDirAbsPathT) -> bool:
         """
@@ -95,7 +284,7 @@ class AbstractFileSystem(
         """
 
         # todo: what if perms issue not existence issue?
-        return self.fsspec_obj.exists(self.contextualize_abs_path(__path))
+        return self._run_fs_op("exists", self.fsspec_obj.exists, self.contextualize_abs_path(__path))
 
     @pydantic.validate_call
     def ensure_exists(self, __path: _path_strs.FileOrDirAbsPathT) -> None:
@@ -142,11 +331,61 @@ class AbstractFileSystem(
         else:
             return
 
+    @classmethod
+    def get_default_read_cache_config(cls) -> _read_cache.ReadCacheConfig:
+        """the read buffering defaults for this file system type, overwrite this to customize it"""
+        return _read_cache.ReadCacheConfig()
+
+    def _get_cache_namespace(self) -> str:
+        """
+        identifies the storage this file system points to, used to key the shared block cache.
+        Overwrite this if the same contextualized path can point to different objects.
+        """
+        return str(self.class_id)
+
+    def _build_read_open_kwargs(
+            self,
+            path: _path_strs.AbsoluteFilePathStr,
+            raw_info: t.Dict[str, t.Any],
+            config: _read_cache.ReadCacheConfig
+    ) -> t.Dict[str, t.Any]:
+        """build the fsspec open kwargs for reading from the object's info record and the cache config"""
+        open_kwargs: t.Dict[str, t.Any] = {}
+
+        # passing the size along saves fsspec from making another info request
+        size = raw_info.get("size")
+        if isinstance(size, int):
+            open_kwargs["size"] = size
+
+        if config.block_size is not None:
+            open_kwargs["block_size"] = config.block_size
+
+        version = None
+        for version_key in ("generation", "mtime", "updated", "ETag", "created"):
+            version = raw_info.get(version_key)
+            if version is not None:
+                break
+
+        # without a version, a rewritten object could serve stale blocks, so we don't share them
+        if config.cache_type == "shared" and version is not None:
+            open_kwargs["cache_type"] = _read_cache.SharedBlockCache.name
+            open_kwargs["cache_options"] = {
+                "key": f"{self._get_cache_namespace()}|{path}|{size}|{version}"
+            }
+        elif config.cache_type is not None and config.cache_type != "shared":
+            open_kwargs["cache_type"] = config.cache_type
+            if config.cache_type == "blockcache" and config.max_blocks is not None:
+                open_kwargs["cache_options"] = {"maxblocks": config.max_blocks}
+        return open_kwargs
+
     @pydantic.validate_call
     def open_file(
             self,
             __path: _path_strs.AbsoluteFilePathStr,
-            mode: _open_modes.SupportedOpenModesT
+            mode: _open_modes.SupportedOpenModesT,
+            *,
+            block_size: t.Optional[int] = None,
+            cache_type: t.Optional[_read_cache.CacheTypeT] = None,
     ) -> _open_modes.OpenFileT:
         """
         return a readable open file object. todo: revisit type annotations of the return type here
@@ -154,15 +393,149 @@ class AbstractFileSystem(
         Args:
             __path: the file path str
             mode: the mode we are opening in
+            block_size: when reading, the number of bytes requested from the file system at a time
+            cache_type: when reading, how we cache the bytes we read. see 'CacheTypeT'
 
         Returns:
             the readable open file object
+
+        Raises:
+            NonExistentPathException: if reading or appending and the file doesn't exist
+        """
+        if mode != "rb":
+            if mode != "wb":
+                self.ensure_exists(__path)
+            return self._wrap_opened_file(
+                self._run_fs_op(
+                    "open", self.fsspec_obj.open, path=self.contextualize_abs_path(__path), mode=mode
+                )
+            )
+
+        config = self.get_default_read_cache_config().merge(
+            _read_cache.ReadCacheConfig(block_size=self.read_block_size, cache_type=self.read_cache_type)
+        ).merge(
+            _read_cache.ReadCacheConfig(block_size=block_size, cache_type=cache_type)
+        )
+        fsspec_obj = self.fsspec_obj
+        contextualized_path = self.contextualize_abs_path(__path)
+
+        # the info request doubles as the existence check
+        try:
+            raw_info = self._run_fs_op("info", fsspec_obj.info, contextualized_path)
+        except FileNotFoundError as e:
+            raise _exceptions.NonExistentPathException(
+                file_system=self,
+                path=__path,
+            ) from e
+
+        opened_file = self._run_fs_op(
+            "open",
+            fsspec_obj.open,
+            path=contextualized_path,
+            mode=mode,
+            **self._build_read_open_kwargs(__path, raw_info, config)
+        )
+
+        # buffered remote files fetch byte ranges through their cache, we route those through the retry
+        # policy too. Local files are read directly.
+        cache = getattr(opened_file, "cache", None)
+        fetcher = getattr(cache, "fetcher", None)
+        if fetcher is not None:
+            def _fetch(start: int, end: int) -> bytes:
+                data = self._run_fs_op("read", fetcher, start, end, hedge=True)
+                self._record_bytes("read", bytes_read=len(data))
+                return data
+
+            cache.fetcher = _fetch
+        # the fetched bytes are already recorded under 'read'
+        return self._wrap_opened_file(opened_file, count_reads=fetcher is None)
+
+    @pydantic.validate_call
+    def read_bytes(
+            self,
+            __path: _path_strs.AbsoluteFilePathStr,
+            *,
+            start: t.Optional[int] = None,
+            end: t.Optional[int] = None
+    ) -> bytes:
+        """
+        read the file's bytes between start and end in a single ranged request, without opening a
+        buffered file.
+
+        Args:
+            __path: the file path str
+            start: the first byte to read, from the start of the file if not specified
+            end: the byte to stop before, until the end of the file if not specified
+
+        Returns:
+            the bytes in the range
+
+        Raises:
+            NonExistentPathException: if the file doesn't exist
+        """
+        try:
+            data = self._run_fs_op(
+                "read",
+                self.fsspec_obj.cat_file,
+                self.contextualize_abs_path(__path),
+                start=start,
+                end=end,
+                hedge=True
+            )
+        except FileNotFoundError as e:
+            raise _exceptions.NonExistentPathException(file_system=self, path=__path) from e
+        self._record_bytes("read", bytes_read=len(data))
+        return data
+
+    @pydantic.validate_call
+    def copy_file(
+            self,
+            __source_path: _path_strs.AbsoluteFilePathStr,
+            __dest_path: _path_strs.AbsoluteFilePathStr,
+    ) -> _path_strs.AbsoluteFilePathStr:
+        """
+        copy the file to another path on this file system, without moving the data through this process
+        where the file system supports it. File systems without a server-side copy, e.g. sftp, stream
+        the content through this process instead.
+
+        Raises:
+            NonExistentPathException: if the source file doesn't exist
+        """
+        self.ensure_exists(__source_path)
+        try:
+            self._run_fs_op(
+                "copy",
+                self.fsspec_obj.cp_file,
+                self.contextualize_abs_path(__source_path),
+                self.contextualize_abs_path(__dest_path)
+            )
+        except NotImplementedError:
+            with self.open_file(__source_path, "rb") as source_f, self.open_file(__dest_path, "wb") as dest_f:
+                _stream_file_content(source_f, dest_f)
+        return __dest_path
+
+    @pydantic.validate_call
+    def move_file(
+            self,
+            __source_path: _path_strs.AbsoluteFilePathStr,
+            __dest_path: _path_strs.AbsoluteFilePathStr,
+    ) -> _path_strs.AbsoluteFilePathStr:
+        """
+        move the file to another path on this file system, replacing the destination. Readers of the
+        destination see either the old file or the whole new one where the file system renames, e.g.
+        local and sftp, or where it writes objects in one step, e.g. gcs, which copies and deletes.
+
+        Raises:
+            NonExistentPathException: if the source file doesn't exist
         """
-        if mode != "wb":
-            self.ensure_exists(__path)
-        return self.fsspec_obj.open(
-            path=self.contextualize_abs_path(__path), mode=mode
+        self.ensure_exists(__source_path)
+        self._run_fs_op(
+            "move",
+            self.fsspec_obj.mv,
+            self.contextualize_abs_path(__source_path),
+            self.contextualize_abs_path(__dest_path)
         )
+        return __dest_path
 
     @pydantic.validate_call
     def delete_file(
@@ -181,7 +554,9 @@ class AbstractFileSystem(
 
         else:
             # what if perms issue not existence issue?
-            self.fsspec_obj.delete(path=self.contextualize_abs_path(__path), recursive=True)
+            self._run_fs_op(
+                "delete", self.fsspec_obj.delete, path=self.contextualize_abs_path(__path), recursive=True
+            )
         return
 
     @pydantic.validate_call
@@ -202,7 +577,9 @@ class AbstractFileSystem(
 
         else:
             # what if perms issue not existence issue?
-            self.fsspec_obj.delete(path=self.contextualize_abs_path(__path), recursive=recursive)
+            self._run_fs_op(
+                "delete", self.fsspec_obj.delete, path=self.contextualize_abs_path(__path), recursive=recursive
+            )
         return
 
     @pydantic.validate_call
@@ -211,8 +588,8 @@ class AbstractFileSystem(
             __path: _path_strs.AbsoluteDirPathStr,
     ) -> t.Iterator[_path_strs.FileOrDirAbsPathT]:
         """iterate over the top level dir contents"""
-        for raw_info_rec_i in self.fsspec_obj.listdir(
-            self.contextualize_abs_path(__path)
+        for raw_info_rec_i in self._run_fs_op(
+            "list", self.fsspec_obj.listdir, self.contextualize_abs_path(__path)
         ):
             raw_path_i = raw_info_rec_i.get("name")
             if raw_path_i is None:
@@ -269,7 +646,7 @@ class AbstractFileSystem(
             elif isinstance(path_i, _path_strs.AbsoluteDirPathStr):
                 if recursive:
                     for path_ij in self.iter_dir_contents_files_only(
-                        path=path_i,
+                        path_i,
                         recursive=recursive,
                     ):
                         yield path_ij
@@ -278,6 +655,88 @@ class AbstractFileSystem(
             else:
                 raise ValueError(type(path_i))
 
+    def _build_file_stat(self, raw_info: t.Dict[str, t.Any]) -> _file_stat.FileStat:
+        """
+        build a FileStat from a raw fsspec info record. Overwrite this when the file system
+        reports the modified time or hash under different keys.
+        """
+        return _file_stat.FileStat(
+            path=_path_strs.AbsoluteFilePathStr(self.clean_raw_path_str(raw_info["name"])),
+            size=raw_info.get("size"),
+            mtime=raw_info.get("mtime"),
+            hash=raw_info.get("md5Hash") or raw_info.get("ETag"),
+        )
+
+    @pydantic.validate_call
+    def get_file_stat(self, __path: _path_strs.AbsoluteFilePathStr) -> _file_stat.FileStat:
+        """
+        get the listing metadata for a single file
+
+        Raises:
+            NonExistentPathException: if the file doesn't exist
+        """
+        try:
+            raw_info = self._run_fs_op("info", self.fsspec_obj.info, self.contextualize_abs_path(__path))
+        except FileNotFoundError as e:
+            raise _exceptions.NonExistentPathException(file_system=self, path=__path) from e
+        return self._build_file_stat(raw_info)
+
+    @pydantic.validate_call
+    def iter_file_stats(
+            self,
+            __path: _path_strs.AbsoluteDirPathStr,
+            *,
+            recursive: bool = True
+    ) -> t.Iterator[_file_stat.FileStat]:
+        """
+        iterate over the stats of every file in the directory, recursing into subdirectories
+        if recursive is True.
+
+        The recursive listing is a single fsspec 'find' call rather than a walk directory by directory,
+        which on object stores is one flat prefix listing.
+        """
+        from spice_rack._fs_ops._helpers import is_placeholder_file_path
+
+        raw_infos: t.Iterable[t.Dict[str, t.Any]]
+        if recursive:
+            raw_infos = self._run_fs_op(
+                "list", self.fsspec_obj.find, self.contextualize_abs_path(__path), detail=True
+            ).values()
+        else:
+            raw_infos = self._run_fs_op(
+                "list", self.fsspec_obj.ls, self.contextualize_abs_path(__path), detail=True
+            )
+
+        for raw_info_i in raw_infos:
+            if raw_info_i.get("type") != "file":
+                continue
+            file_stat_i = self._build_file_stat(raw_info_i)
+            if is_placeholder_file_path(file_stat_i.path):
+                continue
+            yield file_stat_i
+
+    @pydantic.validate_call
+    def iter_sub_dir_mtimes(
+            self,
+            __path: _path_strs.AbsoluteDirPathStr,
+    ) -> t.Iterator[t.Tuple[_path_strs.AbsoluteDirPathStr, t.Optional[dt.datetime]]]:
+        """
+        iterate over the directories directly inside the directory, with their modified times from
+        the same single listing. The modified time is None where the file system doesn't report one,
+        e.g. the prefixes on gcs.
+        """
+        raw_infos = self._run_fs_op("list", self.fsspec_obj.ls, self.contextualize_abs_path(__path), detail=True)
+        for raw_info_i in raw_infos:
+            if raw_info_i.get("type") != "directory":
+                continue
+            dir_path = _path_strs.AbsoluteDirPathStr(self.clean_raw_path_str(raw_info_i["name"]) + "/")
+            mtime = _OptionalDatetimeTypeAdapter.validate_python(
+                raw_info_i.get("mtime") or raw_info_i.get("updated")
+            )
+            if mtime is not None and mtime.tzinfo is None:
+                mtime = mtime.replace(tzinfo=dt.timezone.utc)
+            yield dir_path, mtime
+
     @pydantic.validate_call
     def make_dir(
             self,
@@ -300,7 +759,9 @@ class AbstractFileSystem(
                 return
 
         else:
-            self.fsspec_obj.mkdir(
+            self._run_fs_op(
+                "mkdir",
+                self.fsspec_obj.mkdir,
                 path=self.contextualize_abs_path(__path),
                 create_parents=create_parents
             )
@@ -324,10 +785,13 @@ class AbstractFileSystem(
         local_path = __local_dest_dir.joinpath(
             _path_strs.RelFilePathStr(__source_path.get_name(include_suffixes=True))
         )
-        self.fsspec_obj.download(
+        self._run_fs_op(
+            "download",
+            self.fsspec_obj.download,
             lpath=local_fs.contextualize_abs_path(local_path),
             rpath=self.contextualize_abs_path(__source_path)
         )
+        self._record_bytes("download", bytes_read=_get_local_size(str(local_path)))
         return local_path
 
     @pydantic.validate_call
@@ -350,11 +814,14 @@ class AbstractFileSystem(
         local_path = __local_dest_dir.joinpath(
             _path_strs.RelDirPathStr(__source_dir.get_name())
         )
-        self.fsspec_obj.download(
+        self._run_fs_op(
+            "download",
+            self.fsspec_obj.download,
             lpath=local_fs.contextualize_abs_path(local_path),
             rpath=self.contextualize_abs_path(__source_dir),
             recursive=True
         )
+        self._record_bytes("download", bytes_read=_get_local_size(str(local_path)))
 
         # remove possible placeholder files
         for local_path_i in local_fs.iter_dir_contents_files_only(local_path):
@@ -363,3 +830,172 @@ class AbstractFileSystem(
                     local_path_i, if_non_existent="return"
                 )
         return local_path
+
+    @classmethod
+    def get_default_max_transfer_workers(cls) -> int:
+        """the default number of files we transfer concurrently, overwrite this to customize it"""
+        return 8
+
+    def _put_file(
+            self,
+            local_source_path: _path_strs.AbsoluteFilePathStr,
+            dest_path: _path_strs.AbsoluteFilePathStr
+    ) -> None:
+        """
+        upload a single local file to the path on this file system. Overwrite this to customize
+        how large files are uploaded.
+        """
+        self._run_fs_op(
+            "upload",
+            self.fsspec_obj.put_file,
+            str(local_source_path),
+            self.contextualize_abs_path(dest_path)
+        )
+        self._record_bytes("upload", bytes_written=os.path.getsize(str(local_source_path)))
+
+    def _make_parent_dirs(self, dir_paths: t.Iterable[_path_strs.AbsoluteDirPathStr]) -> None:
+        """
+        make sure the parent directories exist before uploading files into them.
+        Overwrite this for file systems where directories don't need to exist before writing into them.
+        """
+        for dir_path_i in dir_paths:
+            self.make_dir(dir_path_i, if_exists="return", create_parents=True)
+
+    @pydantic.validate_call
+    def upload_file_from_local(
+            self,
+            __local_source_path: _path_strs.AbsoluteFilePathStr,
+            __dest_dir: _path_strs.AbsoluteDirPathStr
+    ) -> _path_strs.AbsoluteFilePathStr:
+        """
+        upload file from the local file system into the current file system.
+
+        the uploaded file will have the same name as the local file, inside the
+        specified directory. This is the inverse of 'download_file_locally'.
+        """
+        from spice_rack._fs_ops._file_systems import _local
+        _local.LocalFileSystem().ensure_exists(__local_source_path)
+
+        dest_path = __dest_dir.joinpath(
+            _path_strs.RelFilePathStr(__local_source_path.get_name(include_suffixes=True))
+        )
+        self._make_parent_dirs([__dest_dir])
+        self._put_file(__local_source_path, dest_path)
+        return dest_path
+
+    @pydantic.validate_call
+    def upload_dir_from_local(
+            self,
+            __local_source_dir: _path_strs.AbsoluteDirPathStr,
+            __dest_dir: _path_strs.AbsoluteDirPathStr,
+            *,
+            max_workers: t.Optional[int] = None,
+    ) -> _path_strs.AbsoluteDirPathStr:
+        """
+        upload directory from the local file system into the current file system, transferring
+        up to 'max_workers' files concurrently. This is the inverse of 'download_dir_locally'.
+
+        the uploaded directory will have the same name as the local directory, inside the
+        specified directory. Placeholder files in the local directory are not uploaded.
+
+        Args:
+            __local_source_dir: the local directory to upload
+            __dest_dir: the directory on this file system we upload into
+            max_workers: the max number of files transferred at once, if not specified we use
+                'get_default_max_transfer_workers'
+
+        Returns:
+            AbsoluteDirPathStr: the uploaded directory on this file system
+        """
+        from spice_rack._fs_ops._file_systems import _local
+        from spice_rack._fs_ops._helpers import is_placeholder_file_path
+        local_fs = _local.LocalFileSystem()
+        local_fs.ensure_exists(__local_source_dir)
+
+        dest_root = __dest_dir.joinpath(
+            _path_strs.RelDirPathStr(__local_source_dir.get_name())
+        )
+
+        transfers: t.List[t.Tuple[_path_strs.AbsoluteFilePathStr, _path_strs.AbsoluteFilePathStr]] = []
+        dest_dirs: t.Set[_path_strs.AbsoluteDirPathStr] = {dest_root}
+        for local_path_i in local_fs.iter_dir_contents_files_only(__local_source_dir, recursive=True):
+            if is_placeholder_file_path(local_path_i):
+                continue
+            rel_path_i = _path_strs.RelFilePathStr(str(local_path_i)[len(__local_source_dir):])
+            dest_path_i = dest_root.joinpath(rel_path_i)
+            transfers.append((local_path_i, dest_path_i))
+            dest_dirs.add(dest_path_i.get_parent())
+
+        self._make_parent_dirs(sorted(dest_dirs))
+
+        max_workers = max_workers if max_workers else self.get_default_max_transfer_workers()
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = [
+                executor.submit(self._put_file, local_path_i, dest_path_i)
+                for local_path_i, dest_path_i in transfers
+            ]
+            for future_i in futures.as_completed(pending):
+                # re-raises the first failure, remaining queued uploads are cancelled on exit
+                try:
+                    future_i.result()
+                except Exception as e:
+                    for future_j in pending:
+                        future_j.cancel()
+                    raise e
+        return dest_root
+
+
+_FILE_SYSTEM_CACHE_MAX_SIZE = 256
+"""the max number of file system configs we keep an instance of per process, the least recently used go first"""
+
+_file_system_cache: collections.OrderedDict[str, t.Tuple[t.Tuple[str, str], AbstractFileSystem]] = (
+    collections.OrderedDict()
+)
+_file_system_cache_lock = threading.Lock()
+
+
+def _register_file_system(
+        fingerprint: str,
+        config_json: str,
+        file_system: AbstractFileSystem
+) -> t.Tuple[t.Tuple[str, str], AbstractFileSystem]:
+    """
+    add the file system to the per-process cache unless it has one with the same config, return the
+    cached pickle args and instance
+    """
+    with _file_system_cache_lock:
+        cached = _file_system_cache.get(fingerprint)
+        if cached is None:
+            cached = ((fingerprint, config_json), file_system)
+            _file_system_cache[fingerprint] = cached
+            if len(_file_system_cache) > _FILE_SYSTEM_CACHE_MAX_SIZE:
+                _file_system_cache.popitem(last=False)
+        else:
+            _file_system_cache.move_to_end(fingerprint)
+        return cached
+
+
+def _restore_file_system(fingerprint: str, config_json: str) -> AbstractFileSystem:
+    """the per-process instance with the fingerprint, built from the config json on first use"""
+    with _file_system_cache_lock:
+        cached = _file_system_cache.get(fingerprint)
+        if cached is not None:
+            _file_system_cache.move_to_end(fingerprint)
+            return cached[1]
+
+    from spice_rack._fs_ops._file_systems import AnyFileSystemTypeAdapter
+    file_system = AnyFileSystemTypeAdapter.validate_json(config_json)
+    pickle_args, cached_file_system = _register_file_system(fingerprint, config_json, file_system)
+    file_system._pickle_args = pickle_args
+    return cached_file_system
+
+
+def _get_local_size(local_path: str) -> int:
+    """the size of the local file, or the total size of the files under the local directory"""
+    if os.path.isfile(local_path):
+        return os.path.getsize(local_path)
+    return sum(
+        os.path.getsize(os.path.join(dir_path_i, file_name_j))
+        for dir_path_i, _, file_names_i in os.walk(local_path)
+        for file_name_j in file_names_i
+    )
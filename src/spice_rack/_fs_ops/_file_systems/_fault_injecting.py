@@ -0,0 +1,654 @@
+from __future__ import annotations
+import collections
+import os
+import random
+import threading
+import time
+import typing as t
+import weakref
+from concurrent import futures
+import fsspec
+from fsspec.spec import AbstractFileSystem as AbstractFsSpecFileSystem, AbstractBufferedFile
+import polars as pl
+import pydantic
+
+from spice_rack import _bases
+from spice_rack._fs_ops import _path_strs
+from spice_rack._fs_ops._file_systems import _base
+
+
+__all__ = (
+    "FaultInjectingFileSystem",
+    "SimulatedRemoteFileSystem",
+    "InjectedFaultError",
+    "TraceEvent",
+    "OpTrace",
+)
+
+
+FaultOpT = t.Literal[
+    "exists", "info", "list", "open", "read", "write", "mkdir", "delete", "upload", "download", "copy"
+]
+
+
+class InjectedFaultError(ConnectionError):
+    """the transient error raised by the FaultInjectingFileSystem"""
+
+
+class TraceEvent(_bases.ValueModelBase):
+    """a single round trip against the fault injecting file system"""
+    op: FaultOpT = pydantic.Field(description="the operation")
+    path: str = pydantic.Field(description="the path on the fault injecting file system")
+    start_seconds: float = pydantic.Field(description="when the operation started, since the trace started")
+    duration_seconds: float = pydantic.Field(description="how long the operation took, injected delays included")
+    num_bytes: int = pydantic.Field(description="the number of bytes transferred", default=0)
+    offset: t.Optional[int] = pydantic.Field(description="the offset of a ranged read or write", default=None)
+    source_path: t.Optional[str] = pydantic.Field(description="the source path of a copy", default=None)
+    recursive: bool = pydantic.Field(description="if the delete was recursive", default=False)
+    error: bool = pydantic.Field(description="if the operation raised", default=False)
+
+
+class OpTrace(_bases.ValueModelBase):
+    """the operations recorded by a FaultInjectingFileSystem, in the order they started"""
+    events: t.Tuple[TraceEvent, ...] = pydantic.Field(description="the recorded events", default=())
+
+    def get_op_counts(self) -> t.Dict[str, int]:
+        """the number of round trips per operation"""
+        res: t.Dict[str, int] = {}
+        for event_i in self.events:
+            res[event_i.op] = res.get(event_i.op, 0) + 1
+        return res
+
+    def get_num_round_trips(self) -> int:
+        return len(self.events)
+
+    def get_total_bytes(self) -> int:
+        return sum(event_i.num_bytes for event_i in self.events)
+
+    def to_df(self) -> pl.DataFrame:
+        """the events as a DataFrame, one row per event"""
+        return pl.DataFrame(
+            [event_i.model_dump() for event_i in self.events],
+            schema={
+                "op": pl.Utf8,
+                "path": pl.Utf8,
+                "start_seconds": pl.Float64,
+                "duration_seconds": pl.Float64,
+                "num_bytes": pl.Int64,
+                "offset": pl.Int64,
+                "source_path": pl.Utf8,
+                "recursive": pl.Boolean,
+                "error": pl.Boolean,
+            }
+        )
+
+    def replay(
+            self,
+            file_system: _base.AbstractFileSystem,
+            *,
+            max_workers: int = 1,
+            preserve_timing: bool = False,
+    ) -> float:
+        """
+        send the same requests to another file system, writes are replayed with zero-filled payloads
+        of the recorded size. Use this to compare the same workload across file systems or settings.
+
+        Args:
+            file_system: the file system we replay the trace against
+            max_workers: the max number of events replayed concurrently
+            preserve_timing: if True, each event is started at its recorded start time rather than as
+                soon as a worker is free
+
+        Returns:
+            the number of seconds the replay took
+
+        Raises:
+            Exception: the first error raised by an event that didn't fail when it was recorded
+        """
+        fsspec_obj = file_system.fsspec_obj
+        prefix = file_system.get_fs_specific_prefix()
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = []
+            for event_i in sorted(self.events, key=lambda event: event.start_seconds):
+                if preserve_timing:
+                    wait_seconds = start + event_i.start_seconds - time.perf_counter()
+                    if wait_seconds > 0:
+                        time.sleep(wait_seconds)
+                pending.append(executor.submit(_replay_event, fsspec_obj, prefix, event_i))
+            for future_i in pending:
+                future_i.result()
+        return time.perf_counter() - start
+
+
+def _replay_event(fsspec_obj: AbstractFsSpecFileSystem, prefix: str, event: TraceEvent) -> None:
+    path = prefix + event.path.lstrip("/")
+    try:
+        if event.op in ("exists", "open"):
+            fsspec_obj.exists(path)
+        elif event.op == "info":
+            fsspec_obj.info(path)
+        elif event.op == "list":
+            fsspec_obj.ls(path, detail=True)
+        elif event.op == "read":
+            start = event.offset or 0
+            fsspec_obj.cat_file(path, start=start, end=start + event.num_bytes)
+        elif event.op == "download":
+            fsspec_obj.cat_file(path)
+        elif event.op in ("write", "upload"):
+            fsspec_obj.pipe_file(path, bytes(event.num_bytes))
+        elif event.op == "mkdir":
+            fsspec_obj.makedirs(path, exist_ok=True)
+        elif event.op == "delete":
+            fsspec_obj.rm(path, recursive=event.recursive)
+        elif event.op == "copy":
+            fsspec_obj.cp_file(prefix + (event.source_path or "").lstrip("/"), path)
+        else:
+            raise ValueError(f"unexpected op: '{event.op}'")
+    except Exception as e:
+        if not event.error:
+            raise e
+
+
+@t.final
+class FaultInjectingFileSystem(_base.AbstractFileSystem, class_id="fault_injecting"):
+    """
+    wraps another file system, the local one by default, and makes it behave like a remote one:
+    every operation is a round trip with a configurable latency, transfers share a bandwidth cap,
+    and we can inject stalls and transient failures. Every round trip is recorded to a trace we can
+    inspect and replay. Use this to test and benchmark how code behaves against a slow or flaky
+    remote file system, without one, or to add latency and faults to a real one.
+
+    Reads go through a buffered file fetching byte ranges, and writes upload a round trip per flushed
+    block, the same way they do on remote file systems.
+
+    The trace, the bandwidth cap, the random draws and the injected fault count belong to this
+    instance and its copies, and are shared across threads. Instances with the same 'trace_id'
+    share them too, e.g. to trace one workload across several configs.
+
+    Examples:
+        file_system = FaultInjectingFileSystem.wrap(gcs_file_system, latency=0.03, bandwidth=50e6)
+        ...
+        file_system.get_trace().get_op_counts()
+    """
+    wrapped: t.Optional[t.Dict[str, t.Any]] = pydantic.Field(
+        description="the data of the wrapped file system, dispatched on its 'class_id'",
+        default=None
+    )
+    wrapped_protocol: t.Optional[str] = pydantic.Field(
+        description="the fsspec protocol of the wrapped file system, e.g. 'memory', instead of 'wrapped'. "
+                    "Paths are passed to it as they are. The local file system if neither is specified",
+        default=None
+    )
+    latency: float = pydantic.Field(
+        description="the number of seconds added to every operation",
+        default=0.0,
+        ge=0
+    )
+    op_latencies: t.Dict[FaultOpT, float] = pydantic.Field(
+        description="per-operation latencies, taking precedence over 'latency'",
+        default_factory=dict
+    )
+    jitter: float = pydantic.Field(
+        description="latencies are drawn uniformly within this fraction of their value either way",
+        default=0.0,
+        ge=0,
+        le=1
+    )
+    bandwidth: t.Optional[float] = pydantic.Field(
+        description="the bytes per second shared by every transfer, unlimited if not specified",
+        default=None,
+        gt=0
+    )
+    stall_rate: float = pydantic.Field(
+        description="the probability an operation stalls for 'stall_seconds' on top of the latency",
+        default=0.0,
+        ge=0,
+        le=1
+    )
+    stall_seconds: float = pydantic.Field(
+        description="the number of seconds a stalled operation takes",
+        default=0.0,
+        ge=0
+    )
+    failure_rate: float = pydantic.Field(
+        description="the probability an operation raises an InjectedFaultError",
+        default=0.0,
+        ge=0,
+        le=1
+    )
+    max_faults: t.Optional[int] = pydantic.Field(
+        description="once this many stalls and failures were injected, we stop injecting them",
+        default=None,
+        ge=0
+    )
+    fault_ops: t.Optional[t.Tuple[FaultOpT, ...]] = pydantic.Field(
+        description="the operations we inject faults into, all of them if not specified",
+        default=None
+    )
+    seed: t.Optional[int] = pydantic.Field(
+        description="seeds the random draws, so a run can be reproduced",
+        default=None
+    )
+    max_trace_events: int = pydantic.Field(
+        description="the max number of events kept in the trace, the oldest are dropped first",
+        default=100_000,
+        gt=0
+    )
+    trace_id: t.Optional[str] = pydantic.Field(
+        description="instances with the same trace id share the trace, the bandwidth cap, the random draws "
+                    "and the injected fault count. If not specified, they belong to this instance",
+        default=None
+    )
+
+    _fsspec_file_system: t.Optional[_FaultInjectingFsspecFileSystem] = pydantic.PrivateAttr(default=None)
+    """built on first use, it holds the state and is safe to use across threads"""
+
+    @pydantic.field_validator("wrapped", mode="before")
+    @classmethod
+    def _validate_wrapped(cls, v: t.Any) -> t.Optional[t.Dict[str, t.Any]]:
+        from spice_rack._fs_ops._file_systems import AnyFileSystemTypeAdapter
+        if v is None:
+            return None
+        if isinstance(v, _base.AbstractFileSystem):
+            file_system = v
+        else:
+            file_system = AnyFileSystemTypeAdapter.validate_python(v)
+        if isinstance(file_system, FaultInjectingFileSystem):
+            raise ValueError("can't wrap a fault injecting file system")
+        return file_system.model_dump(mode="json")
+
+    @pydantic.model_validator(mode="after")
+    def _check_single_wrapped(self) -> FaultInjectingFileSystem:
+        if self.wrapped is not None and self.wrapped_protocol is not None:
+            raise ValueError("specify either 'wrapped' or 'wrapped_protocol', not both")
+        return self
+
+    @classmethod
+    def wrap(cls, file_system: _base.AbstractFileSystem, **kwargs: t.Any) -> FaultInjectingFileSystem:
+        """build a fault injecting file system around the file system"""
+        return cls(wrapped=file_system, **kwargs)
+
+    def get_wrapped(self) -> t.Optional[_base.AbstractFileSystem]:
+        """the wrapped file system, None if we wrap an fsspec protocol or the local file system"""
+        from spice_rack._fs_ops._file_systems import AnyFileSystemTypeAdapter
+        if self.wrapped is None:
+            return None
+        return AnyFileSystemTypeAdapter.validate_python(self.wrapped)
+
+    def build_fsspec_file_system(self) -> _FaultInjectingFsspecFileSystem:
+        with _build_lock:
+            if self._fsspec_file_system is None:
+                if self.trace_id is None:
+                    state = _FaultInjectionState(self.seed, self.max_trace_events)
+                else:
+                    state = _get_shared_fault_injection_state(self.trace_id, self.seed, self.max_trace_events)
+                self._fsspec_file_system = self._build_fsspec_file_system(state)
+            return self._fsspec_file_system
+
+    def _build_fsspec_file_system(self, state: _FaultInjectionState) -> _FaultInjectingFsspecFileSystem:
+        return _FaultInjectingFsspecFileSystem(
+            wrapped_file_system=self.get_wrapped(),
+            wrapped_protocol=self.wrapped_protocol,
+            latency=self.latency,
+            op_latencies=self.op_latencies,
+            jitter=self.jitter,
+            bandwidth=self.bandwidth,
+            stall_rate=self.stall_rate,
+            stall_seconds=self.stall_seconds,
+            failure_rate=self.failure_rate,
+            max_faults=self.max_faults,
+            fault_ops=self.fault_ops,
+            state=state,
+        )
+
+    @classmethod
+    def get_fs_specific_prefix(cls) -> str:
+        return "/"
+
+    def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
+        return _path_strs.AbsoluteDirPathStr("/")
+
+    def _get_cache_namespace(self) -> str:
+        return f"{self.class_id}|{self.model_dump_json()}"
+
+    def get_trace(self) -> OpTrace:
+        """the round trips recorded since the trace was last reset"""
+        return self.build_fsspec_file_system().get_trace()
+
+    def reset_trace(self) -> None:
+        """clear the recorded round trips and restart the trace clock"""
+        self.build_fsspec_file_system().reset_trace()
+
+
+SimulatedRemoteFileSystem = FaultInjectingFileSystem
+"""
+alias of FaultInjectingFileSystem, the name it goes by when it's used to simulate a remote file system
+without faults, e.g. 'SimulatedRemoteFileSystem.wrap(LocalFileSystem(), latency=0.03, bandwidth=50e6)'
+"""
+
+
+class _FaultInjectionState:
+    """the mutable state of a FaultInjectingFileSystem, shared by its copies and across threads"""
+    def __init__(self, seed: t.Optional[int], max_events: int):
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.num_faults = 0
+        self.link_free_at = 0.0
+        self.trace_start = time.perf_counter()
+        self.events: t.Deque[TraceEvent] = collections.deque(maxlen=max_events)
+
+
+_build_lock = threading.Lock()
+
+_shared_fault_injection_states: weakref.WeakValueDictionary[str, _FaultInjectionState] = (
+    weakref.WeakValueDictionary()
+)
+"""the states by trace id, dropped once no file system holds them"""
+
+
+def _get_shared_fault_injection_state(
+        trace_id: str,
+        seed: t.Optional[int],
+        max_events: int
+) -> _FaultInjectionState:
+    """the settings of the first instance with the trace id apply"""
+    state = _shared_fault_injection_states.get(trace_id)
+    if state is None:
+        state = _FaultInjectionState(seed, max_events)
+        _shared_fault_injection_states[trace_id] = state
+    return state
+
+
+class _FaultInjectingFsspecFileSystem(AbstractFsSpecFileSystem):
+    """the fsspec implementation behind FaultInjectingFileSystem"""
+    protocol = "spice_rack_fault_injecting"
+    root_marker = "/"
+    # each FaultInjectingFileSystem holds its own instance, caching them would keep their states alive
+    cachable = False
+
+    def __init__(
+            self,
+            wrapped_file_system: t.Optional[_base.AbstractFileSystem],
+            wrapped_protocol: t.Optional[str],
+            latency: float,
+            op_latencies: t.Dict[str, float],
+            jitter: float,
+            bandwidth: t.Optional[float],
+            stall_rate: float,
+            stall_seconds: float,
+            failure_rate: float,
+            max_faults: t.Optional[int],
+            fault_ops: t.Optional[t.Tuple[str, ...]],
+            state: _FaultInjectionState,
+            **storage_options
+    ):
+        super().__init__(**storage_options)
+        self.wrapped_file_system = wrapped_file_system
+        if wrapped_file_system is None:
+            self.wrapped_prefix = None
+            self._wrapped_by_protocol = fsspec.filesystem(wrapped_protocol or "file")
+        else:
+            self.wrapped_prefix = wrapped_file_system.get_fs_specific_prefix()
+        self.latency = latency
+        self.op_latencies = dict(op_latencies)
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.failure_rate = failure_rate
+        self.max_faults = max_faults
+        self.fault_ops = fault_ops
+        self.state = state
+
+    @property
+    def wrapped(self) -> AbstractFsSpecFileSystem:
+        """the wrapped fsspec implementation, for the current thread"""
+        if self.wrapped_file_system is None:
+            return self._wrapped_by_protocol
+        return self.wrapped_file_system.fsspec_obj
+
+    def to_wrapped_path(self, path: str) -> str:
+        if self.wrapped_prefix is None:
+            return path
+        return self.wrapped_prefix + self._strip_protocol(path).lstrip("/")
+
+    def from_wrapped_path(self, raw_path: str) -> str:
+        if self.wrapped_file_system is None:
+            return raw_path
+        path = str(self.wrapped_file_system.clean_raw_path_str(raw_path))
+        return path.rstrip("/") or "/"
+
+    def _from_wrapped_info(self, info: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        return {**info, "name": self.from_wrapped_path(info["name"])}
+
+    def get_trace(self) -> OpTrace:
+        with self.state.lock:
+            events = sorted(self.state.events, key=lambda event: event.start_seconds)
+        return OpTrace(events=tuple(events))
+
+    def reset_trace(self) -> None:
+        with self.state.lock:
+            self.state.events.clear()
+            self.state.trace_start = time.perf_counter()
+
+    def _draw_delay(self, op_name: str) -> t.Tuple[float, bool]:
+        """the seconds the operation takes before it runs, and if it fails"""
+        latency = self.op_latencies.get(op_name, self.latency)
+        stall = False
+        fail = False
+        with self.state.lock:
+            if self.jitter and latency:
+                latency *= self.state.random.uniform(1 - self.jitter, 1 + self.jitter)
+            if self.fault_ops is None or op_name in self.fault_ops:
+                if self.max_faults is None or self.state.num_faults < self.max_faults:
+                    stall = self.state.random.random() < self.stall_rate
+                    fail = not stall and self.state.random.random() < self.failure_rate
+                    if stall or fail:
+                        self.state.num_faults += 1
+        return latency + (self.stall_seconds if stall else 0.0), fail
+
+    def _reserve_transfer(self, num_bytes: int) -> float:
+        """book the transfer on the shared link, returning the seconds until it finishes"""
+        if not self.bandwidth or not num_bytes:
+            return 0.0
+        with self.state.lock:
+            now = time.perf_counter()
+            self.state.link_free_at = max(now, self.state.link_free_at) + num_bytes / self.bandwidth
+            return self.state.link_free_at - now
+
+    def round_trip(
+            self,
+            op_name: str,
+            path: str,
+            func: t.Callable[[], t.Any],
+            *,
+            num_bytes: t.Optional[int] = None,
+            count_bytes: t.Optional[t.Callable[[t.Any], int]] = None,
+            **event_fields: t.Any
+    ) -> t.Any:
+        """
+        run the operation on the wrapped file system as a single round trip, with the latency, the
+        transfer time and maybe a stall or failure injected, and record it to the trace.
+
+        Args:
+            op_name: the operation, recorded to the trace
+            path: the path on this file system, recorded to the trace
+            func: calls the wrapped file system
+            num_bytes: the number of bytes transferred, if known before the call
+            count_bytes: counts the bytes transferred from the return value, if num_bytes isn't known
+            **event_fields: extra fields of the trace event
+
+        Returns:
+            the return value of func
+
+        Raises:
+            InjectedFaultError: if we injected a failure
+        """
+        start = time.perf_counter()
+        error = False
+        transferred = num_bytes or 0
+        try:
+            delay, fail = self._draw_delay(op_name)
+            if delay:
+                time.sleep(delay)
+            if fail:
+                raise InjectedFaultError(f"injected failure in '{op_name}'")
+            res = func()
+            if count_bytes is not None:
+                transferred = count_bytes(res)
+            transfer_seconds = self._reserve_transfer(transferred)
+            if transfer_seconds:
+                time.sleep(transfer_seconds)
+            return res
+        except BaseException as e:
+            error = True
+            raise e
+        finally:
+            end = time.perf_counter()
+            with self.state.lock:
+                self.state.events.append(
+                    TraceEvent(
+                        op=op_name,
+                        path=self._strip_protocol(path) or "/",
+                        start_seconds=start - self.state.trace_start,
+                        duration_seconds=end - start,
+                        num_bytes=transferred,
+                        error=error,
+                        **event_fields
+                    )
+                )
+
+    def exists(self, path, **kwargs) -> bool:
+        # the base implementation swallows every error, which would hide the injected failures
+        return self.round_trip("exists", path, lambda: self.wrapped.exists(self.to_wrapped_path(path), **kwargs))
+
+    def info(self, path, **kwargs) -> t.Dict[str, t.Any]:
+        return self._from_wrapped_info(
+            self.round_trip("info", path, lambda: self.wrapped.info(self.to_wrapped_path(path), **kwargs))
+        )
+
+    def ls(self, path, detail=True, **kwargs) -> t.List:
+        raw_infos = self.round_trip(
+            "list", path, lambda: self.wrapped.ls(self.to_wrapped_path(path), detail=True, **kwargs)
+        )
+        infos = [self._from_wrapped_info(raw_info_i) for raw_info_i in raw_infos]
+        if detail:
+            return infos
+        return [info_i["name"] for info_i in infos]
+
+    def mkdir(self, path, create_parents=True, **kwargs) -> None:
+        return self.round_trip(
+            "mkdir",
+            path,
+            lambda: self.wrapped.mkdir(self.to_wrapped_path(path), create_parents=create_parents, **kwargs)
+        )
+
+    def makedirs(self, path, exist_ok=False) -> None:
+        return self.round_trip(
+            "mkdir", path, lambda: self.wrapped.makedirs(self.to_wrapped_path(path), exist_ok=exist_ok)
+        )
+
+    def rm(self, path, recursive=False, maxdepth=None) -> None:
+        if isinstance(path, list):
+            for path_i in path:
+                self.rm(path_i, recursive=recursive, maxdepth=maxdepth)
+            return
+        return self.round_trip(
+            "delete",
+            path,
+            lambda: self.wrapped.rm(self.to_wrapped_path(path), recursive=recursive, maxdepth=maxdepth),
+            recursive=recursive
+        )
+
+    def rm_file(self, path) -> None:
+        return self.round_trip("delete", path, lambda: self.wrapped.rm_file(self.to_wrapped_path(path)))
+
+    def cat_file(self, path, start=None, end=None, **kwargs) -> bytes:
+        return self.round_trip(
+            "read",
+            path,
+            lambda: self.wrapped.cat_file(self.to_wrapped_path(path), start=start, end=end, **kwargs),
+            count_bytes=len,
+            offset=start
+        )
+
+    def pipe_file(self, path, value, **kwargs) -> None:
+        return self.round_trip(
+            "write",
+            path,
+            lambda: self.wrapped.pipe_file(self.to_wrapped_path(path), value, **kwargs),
+            num_bytes=len(value),
+            offset=0
+        )
+
+    def put_file(self, lpath, rpath, **kwargs) -> None:
+        def _put() -> None:
+            wrapped_path = self.to_wrapped_path(rpath)
+            self.wrapped.makedirs(self.wrapped._parent(wrapped_path), exist_ok=True)
+            self.wrapped.put_file(lpath, wrapped_path, **kwargs)
+
+        return self.round_trip("upload", rpath, _put, num_bytes=os.path.getsize(lpath))
+
+    def get_file(self, rpath, lpath, **kwargs) -> None:
+        if self.isdir(rpath):
+            os.makedirs(lpath, exist_ok=True)
+            return None
+        return self.round_trip(
+            "download",
+            rpath,
+            lambda: self.wrapped.get_file(self.to_wrapped_path(rpath), lpath, **kwargs),
+            count_bytes=lambda _: os.path.getsize(lpath)
+        )
+
+    def cp_file(self, path1, path2, **kwargs) -> None:
+        return self.round_trip(
+            "copy",
+            path2,
+            lambda: self.wrapped.cp_file(self.to_wrapped_path(path1), self.to_wrapped_path(path2), **kwargs),
+            source_path=self._strip_protocol(path1)
+        )
+
+    def _open(
+            self,
+            path,
+            mode="rb",
+            block_size=None,
+            autocommit=True,
+            cache_options=None,
+            **kwargs
+    ):
+        if mode in ("rb", "wb"):
+            return _FaultInjectingFile(
+                self,
+                path,
+                mode=mode,
+                block_size=block_size or "default",
+                autocommit=autocommit,
+                cache_options=cache_options,
+                **kwargs
+            )
+        return self.round_trip("open", path, lambda: self.wrapped.open(self.to_wrapped_path(path), mode=mode))
+
+
+class _FaultInjectingFile(AbstractBufferedFile):
+    """
+    buffered file where every byte range fetch is a 'read' round trip and every flushed block is
+    a 'write' round trip, the way a resumable upload works
+    """
+    fs: _FaultInjectingFsspecFileSystem
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        return self.fs.cat_file(self.path, start=start, end=end)
+
+    def _initiate_upload(self) -> None:
+        self._parts: t.List[bytes] = []
+
+    def _upload_chunk(self, final: bool = False) -> bool:
+        data = self.buffer.getvalue()
+        self.fs.round_trip(
+            "write", self.path, lambda: self._parts.append(data), num_bytes=len(data), offset=self.offset
+        )
+        if final:
+            self.fs.wrapped.pipe_file(self.fs.to_wrapped_path(self.path), b"".join(self._parts))
+        return True
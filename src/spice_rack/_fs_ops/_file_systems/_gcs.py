@@ -1,11 +1,16 @@
 from __future__ import annotations
+import json
+import math
+import os
 import typing as t
+from concurrent import futures
 import gcsfs  # noqa
+import gcsfs.retry
 import pydantic
 
-from spice_rack._fs_ops import _path_strs, _helpers
+from spice_rack._fs_ops import _path_strs, _helpers, _file_stat, _read_cache, _resilience, _exceptions
 from spice_rack._fs_ops._file_systems import _base
-from spice_rack import _gcp_auth
+from spice_rack import _gcp_auth, _guid_service
 
 
 __all__ = (
@@ -20,11 +25,45 @@ class GcsFileSystem(_base.AbstractFileSystem, class_id="gcs"):
         description="the credentials we use to authenticate to the gcs bucket",
         default_factory=_gcp_auth.AnyGcpAuthStrat.init_default
     )
+    composite_upload_threshold: int = pydantic.Field(
+        description="files at least this many bytes are uploaded as parts in parallel, then composed "
+                    "into the final object. Composite objects have a crc32c hash but no md5 hash.",
+        default=150 * 2 ** 20,
+        gt=0
+    )
+    composite_upload_part_size: int = pydantic.Field(
+        description="the min size of each part of a composite upload",
+        default=32 * 2 ** 20,
+        gt=0
+    )
+    dir_mode: t.Literal["placeholder", "virtual"] = pydantic.Field(
+        description="how we create directories. 'placeholder' writes a placeholder object into each new "
+                    "directory, so empty directories exist. 'virtual' treats directories purely as prefixes, "
+                    "so 'make_dir' makes no requests, and a directory only exists once an object is written "
+                    "under it. Placeholders already in the bucket are skipped in both modes.",
+        default="placeholder"
+    )
 
     @classmethod
     def get_fs_specific_prefix(cls) -> str:
         return "gs://"
 
+    @classmethod
+    def get_default_read_cache_config(cls) -> _read_cache.ReadCacheConfig:
+        """larger blocks than the gcsfs default, each range request has a high fixed latency"""
+        return _read_cache.ReadCacheConfig(block_size=8 * 2 ** 20, cache_type="readahead")
+
+    @classmethod
+    def get_default_retry_policy(cls) -> _resilience.RetryPolicy:
+        """
+        gcsfs already retries failed http requests, on top of that we retry failed operations
+        and hedge reads stalling past the p95 latency
+        """
+        return _resilience.RetryPolicy(max_attempts=3, hedge_reads=True, hedge_quantile=0.95)
+
+    def _is_transient_error(self, error: BaseException) -> bool:
+        return super()._is_transient_error(error) or gcsfs.retry.is_retriable(error)
+
     def _get_gcsfs_token(
             self,
     ) -> t.Union[str, dict]:
@@ -54,6 +93,21 @@ class GcsFileSystem(_base.AbstractFileSystem, class_id="gcs"):
         else:
             raise ValueError(f"unexpected auth strategy type: {type(self.creds,)}")
 
+    def get_polars_storage_options(self) -> t.Optional[t.Dict[str, str]]:
+        """
+        the object_store config for polars' native gcs reader, built from the same credentials.
+        object_store has no anonymous mode, so anonymous reads go through gcsfs.
+        """
+        token = self._get_gcsfs_token()
+        if token == "anon":
+            return None
+        elif token == "google_default":
+            return {}
+        elif isinstance(token, dict):
+            return {"google_service_account_key": json.dumps(token)}
+        else:
+            return {"google_service_account": token}
+
     def build_fsspec_file_system(self) -> gcsfs.GCSFileSystem:
         token = self._get_gcsfs_token()
         return gcsfs.GCSFileSystem(
@@ -68,16 +122,67 @@ class GcsFileSystem(_base.AbstractFileSystem, class_id="gcs"):
             if_exists: t.Literal["raise", "return"] = "return",
             create_parents: bool = True
     ) -> None:
+        """
+        creating cloud dir doesn't work like local bc how they treat directories. In 'placeholder'
+        mode we create a placeholder file when making a directory to imitate this, in 'virtual' mode
+        there is nothing to create. Parent directories are prefixes either way, so 'create_parents'
+        only matters for a bucket.
+        """
+        is_bucket = len(str(__path).strip("/").split("/")) == 1
+        if is_bucket:
+            super().make_dir(__path, if_exists=if_exists, create_parents=create_parents)
+            return
 
-        # creating cloud dir doesn't work like local bc how
-        # they treat directories. We create a placeholder
-        # file when making a directory to imitate this.
-        super().make_dir(__path, if_exists=if_exists, create_parents=create_parents)
-        if not self.exists(__path):
+        if self.dir_mode == "virtual" and if_exists == "return":
+            return
+
+        if self.exists(__path):
+            if if_exists == "raise":
+                raise _exceptions.PathAlreadyExistsException(
+                    file_system=self,
+                    path=__path,
+                    extra_info={
+                        "action_attempted": "make_dir"
+                    }
+                )
+            return
+
+        if self.dir_mode == "placeholder":
             placeholder_path = __path.joinpath(rel_path=_helpers.get_placeholder_rel_path())
             with self.open_file(placeholder_path, "wb") as f:
                 f.write("placeholder text".encode())
 
+    @pydantic.validate_call
+    def strip_placeholders(self, __path: _path_strs.AbsoluteDirPathStr) -> int:
+        """
+        delete every placeholder object under the directory, e.g. to move a tree created in
+        'placeholder' mode to 'virtual' mode. We list the tree once and delete the placeholders
+        in batched requests. Directories that only held a placeholder stop existing.
+
+        Returns:
+            int: the number of placeholders we deleted
+        """
+        placeholder_paths = self._find_placeholders(__path)[1]
+        if placeholder_paths:
+            self._run_fs_op(
+                "delete",
+                self.fsspec_obj.rm,
+                [self.contextualize_abs_path(path_i) for path_i in placeholder_paths]
+            )
+        return len(placeholder_paths)
+
+    def _find_placeholders(
+            self,
+            path: _path_strs.AbsoluteDirPathStr
+    ) -> t.Tuple[t.List[_path_strs.AbsoluteFilePathStr], t.List[_path_strs.AbsoluteFilePathStr]]:
+        """list the tree once, splitting the file paths into the data files and the placeholders"""
+        raw_paths = self._run_fs_op("list", self.fsspec_obj.find, self.contextualize_abs_path(path))
+        paths = _path_strs.PathStrArray.from_strs(
+            ["/" + raw_path_i.lstrip("/") for raw_path_i in raw_paths]
+        )
+        is_placeholder = paths.is_placeholder()
+        return paths.filter(~is_placeholder).to_list(), paths.filter(is_placeholder).to_list()
+
     @pydantic.validate_call
     def iter_dir_contents(
             self,
@@ -92,5 +197,105 @@ class GcsFileSystem(_base.AbstractFileSystem, class_id="gcs"):
             else:
                 yield path_i
 
+    def _build_file_stat(self, raw_info: t.Dict[str, t.Any]) -> _file_stat.FileStat:
+        """gcsfs reports the modified time as 'updated'"""
+        return _file_stat.FileStat(
+            path=_path_strs.AbsoluteFilePathStr(self.clean_raw_path_str(raw_info["name"])),
+            size=raw_info.get("size"),
+            mtime=raw_info.get("updated") or raw_info.get("mtime"),
+            hash=raw_info.get("md5Hash") or raw_info.get("crc32c"),
+        )
+
+    def _make_parent_dirs(self, dir_paths: t.Iterable[_path_strs.AbsoluteDirPathStr]) -> None:
+        """objects can be written under any prefix, so there is nothing to create"""
+        return
+
+    @pydantic.validate_call
+    def download_dir_locally(
+            self,
+            __source_dir: _path_strs.AbsoluteDirPathStr,
+            __local_dest_dir: _path_strs.AbsoluteDirPathStr
+    ) -> _path_strs.AbsoluteDirPathStr:
+        """
+        same as the base class, except we list the tree once and never download the placeholders.
+        The directories that held a placeholder are still created locally.
+        """
+        local_path = __local_dest_dir.joinpath(
+            _path_strs.RelDirPathStr(__source_dir.get_name())
+        )
+        file_paths, placeholder_paths = self._find_placeholders(__source_dir)
+        root_len = len(__source_dir)
+
+        os.makedirs(str(local_path), exist_ok=True)
+        for placeholder_path_i in placeholder_paths:
+            os.makedirs(str(local_path) + str(placeholder_path_i.get_parent())[root_len:], exist_ok=True)
+
+        if file_paths:
+            local_file_paths = [str(local_path) + str(path_i)[root_len:] for path_i in file_paths]
+            self._run_fs_op(
+                "download",
+                self.fsspec_obj.get,
+                [self.contextualize_abs_path(path_i) for path_i in file_paths],
+                local_file_paths,
+            )
+            self._record_bytes("download", bytes_read=sum(map(os.path.getsize, local_file_paths)))
+        return local_path
+
+    def _put_file(
+            self,
+            local_source_path: _path_strs.AbsoluteFilePathStr,
+            dest_path: _path_strs.AbsoluteFilePathStr
+    ) -> None:
+        """
+        large files are uploaded as a parallel composite upload, i.e. we upload the parts concurrently
+        and compose them into the destination object. Each part upload, the compose and each part
+        delete is a separate operation under the retry policy, and the parts are deleted whether or
+        not the upload succeeded.
+        """
+        size = os.path.getsize(str(local_source_path))
+        if size < self.composite_upload_threshold:
+            return super()._put_file(local_source_path, dest_path)
+
+        fsspec_obj = self.fsspec_obj
+        dest_path_str = self.contextualize_abs_path(dest_path)
+        part_size = max(self.composite_upload_part_size, math.ceil(size / _MAX_COMPOSE_COMPONENTS))
+        offsets = list(range(0, size, part_size))
+        part_token = _guid_service.gen_str_guid()
+        part_paths = [f"{dest_path_str}.{part_token}.part{i}" for i in range(len(offsets))]
+
+        def _write_part(part_path: str, offset: int) -> None:
+            remaining = min(part_size, size - offset)
+            with open(str(local_source_path), "rb") as local_f, fsspec_obj.open(part_path, "wb") as remote_f:
+                local_f.seek(offset)
+                while remaining > 0:
+                    chunk = local_f.read(min(remaining, _UPLOAD_CHUNK_SIZE))
+                    remote_f.write(chunk)
+                    remaining -= len(chunk)
+
+        def _upload_part(part_path: str, offset: int) -> None:
+            self._run_fs_op("upload", _write_part, part_path, offset)
+            self._record_bytes("upload", bytes_written=min(part_size, size - offset))
+
+        def _delete_part(part_path: str) -> None:
+            try:
+                self._run_fs_op("delete", fsspec_obj.rm_file, part_path)
+            except FileNotFoundError:
+                pass
+
+        try:
+            max_workers = min(len(part_paths), self.get_default_max_transfer_workers())
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_upload_part, part_paths, offsets))
+            self._run_fs_op("upload", fsspec_obj.merge, dest_path_str, part_paths)
+        finally:
+            for part_path_i in part_paths:
+                _delete_part(part_path_i)
+
     def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
         return _path_strs.AbsoluteDirPathStr("/")
+
+
+_MAX_COMPOSE_COMPONENTS = 32
+"""gcs compose accepts at most 32 source objects"""
+
+_UPLOAD_CHUNK_SIZE = 8 * 2 ** 20
@@ -1,10 +1,15 @@
 from __future__ import annotations
+import errno
+import os
+import shutil
+import typing as t
 from typing import final
 from pathlib import Path
 from fsspec.implementations.local import LocalFileSystem as FsSpecLocalFileSystem
+import pydantic
 
 from spice_rack._fs_ops._file_systems import _base
-from spice_rack._fs_ops import _path_strs
+from spice_rack._fs_ops import _path_strs, _file_stat, _helpers
 
 
 __all__ = (
@@ -14,7 +19,12 @@ __all__ = (
 
 @final
 class LocalFileSystem(_base.AbstractFileSystem, class_id="local"):
-    """file system implementation for the local file system"""
+    """
+    file system implementation for the local file system.
+
+    Listing and copying skip fsspec, listing uses os.scandir, which knows the entry types without
+    a stat call per entry, and copies use os.copy_file_range where the kernel supports it.
+    """
 
     def build_fsspec_file_system(self) -> FsSpecLocalFileSystem:
         return FsSpecLocalFileSystem()
@@ -23,5 +33,155 @@ class LocalFileSystem(_base.AbstractFileSystem, class_id="local"):
     def get_fs_specific_prefix(cls) -> str:
         return "/"
 
+    def get_polars_storage_options(self) -> t.Optional[t.Dict[str, str]]:
+        """polars reads local paths natively, no options needed"""
+        return {}
+
     def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
         return _path_strs.AbsoluteDirPathStr(str(Path().home()))
+
+    @pydantic.validate_call
+    def iter_dir_contents(
+            self,
+            __path: _path_strs.AbsoluteDirPathStr,
+    ) -> t.Iterator[_path_strs.FileOrDirAbsPathT]:
+        """
+        iterate over the top level dir contents. Entries that are neither files nor directories,
+        e.g. broken symlinks, are skipped.
+        """
+        for entry_path, is_dir in self._run_fs_op("list", _scan_dir, str(__path)):
+            if is_dir:
+                yield _path_strs.AbsoluteDirPathStr(entry_path + "/")
+            else:
+                yield _path_strs.AbsoluteFilePathStr(entry_path)
+
+    @pydantic.validate_call
+    def iter_dir_contents_files_only(
+            self,
+            __path: _path_strs.AbsoluteDirPathStr,
+            *,
+            recursive: bool = True
+    ) -> t.Iterator[_path_strs.AbsoluteFilePathStr]:
+        """iterate over every file in a directory, recursing into subdirectories if
+        recursive is True"""
+        for entry_path, is_dir in self._run_fs_op("list", _scan_dir, str(__path)):
+            if not is_dir:
+                yield _path_strs.AbsoluteFilePathStr(entry_path)
+            elif recursive:
+                yield from self.iter_dir_contents_files_only(
+                    _path_strs.AbsoluteDirPathStr(entry_path + "/"), recursive=True
+                )
+
+    @pydantic.validate_call
+    def iter_file_stats(
+            self,
+            __path: _path_strs.AbsoluteDirPathStr,
+            *,
+            recursive: bool = True
+    ) -> t.Iterator[_file_stat.FileStat]:
+        """
+        iterate over the stats of every file in the directory, recursing into subdirectories
+        if recursive is True. Each directory is listed as it is reached, so the first stats are
+        yielded before the rest of the tree is walked.
+        """
+        pending = [str(__path)]
+        while pending:
+            file_stats, sub_dir_paths = self._run_fs_op("list", _scan_dir_stats, pending.pop())
+            for entry_path, size, mtime in file_stats:
+                file_path = _path_strs.AbsoluteFilePathStr(entry_path)
+                if _helpers.is_placeholder_file_path(file_path):
+                    continue
+                yield _file_stat.FileStat(path=file_path, size=size, mtime=mtime)
+            if recursive:
+                # reversed, so the sub directories are walked in sorted order
+                pending.extend(reversed(sub_dir_paths))
+
+    @pydantic.validate_call
+    def copy_file(
+            self,
+            __source_path: _path_strs.AbsoluteFilePathStr,
+            __dest_path: _path_strs.AbsoluteFilePathStr,
+    ) -> _path_strs.AbsoluteFilePathStr:
+        """
+        copy the file within the local file system, in the kernel where possible.
+        The parent directory of the destination is created if needed.
+        """
+        self.ensure_exists(__source_path)
+        os.makedirs(str(__dest_path.get_parent()), exist_ok=True)
+        num_bytes = self._run_fs_op("copy", _copy_local_file, str(__source_path), str(__dest_path))
+        self._record_bytes("copy", bytes_read=num_bytes, bytes_written=num_bytes)
+        return __dest_path
+
+    @pydantic.validate_call
+    def move_file(
+            self,
+            __source_path: _path_strs.AbsoluteFilePathStr,
+            __dest_path: _path_strs.AbsoluteFilePathStr,
+    ) -> _path_strs.AbsoluteFilePathStr:
+        """
+        move the file within the local file system, an atomic rename when both are on the same device.
+        The parent directory of the destination is created if needed.
+        """
+        self.ensure_exists(__source_path)
+        os.makedirs(str(__dest_path.get_parent()), exist_ok=True)
+        self._run_fs_op("move", shutil.move, str(__source_path), str(__dest_path))
+        return __dest_path
+
+
+def _scan_dir(dir_path: str) -> t.List[t.Tuple[str, bool]]:
+    """list the entries as (path, is_dir) pairs, the entry type comes from the directory listing itself"""
+    res = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                res.append((entry.path, True))
+            elif entry.is_file():
+                res.append((entry.path, False))
+    return res
+
+
+def _scan_dir_stats(dir_path: str) -> t.Tuple[t.List[t.Tuple[str, int, float]], t.List[str]]:
+    """list a single directory, its files as sorted (path, size, mtime) records, and its sorted sub directories"""
+    file_stats = []
+    sub_dir_paths = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                sub_dir_paths.append(entry.path)
+            elif entry.is_file():
+                stat = entry.stat()
+                file_stats.append((entry.path, stat.st_size, stat.st_mtime))
+    file_stats.sort()
+    sub_dir_paths.sort()
+    return file_stats, sub_dir_paths
+
+
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+"""copy_file_range fails with these when the kernel or file system doesn't support it for the files"""
+
+
+def _copy_local_file(source_path: str, dest_path: str) -> int:
+    """
+    copy the file with os.copy_file_range, which can share extents on file systems with reflinks,
+    falling back to shutil, which uses sendfile on linux.
+
+    Returns:
+        the number of bytes copied
+    """
+    if hasattr(os, "copy_file_range"):
+        with open(source_path, "rb") as source_f, open(dest_path, "wb") as dest_f:
+            size = os.fstat(source_f.fileno()).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    num_bytes = os.copy_file_range(source_f.fileno(), dest_f.fileno(), size - copied)
+                    if num_bytes == 0:
+                        break
+                    copied += num_bytes
+                return copied
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS or copied:
+                    raise e
+
+    shutil.copyfile(source_path, dest_path)
+    return os.path.getsize(dest_path)
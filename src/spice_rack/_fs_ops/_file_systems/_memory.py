@@ -0,0 +1,37 @@
+from __future__ import annotations
+import typing as t
+from fsspec.implementations.memory import MemoryFileSystem as FsSpecMemoryFileSystem
+
+from spice_rack._fs_ops import _path_strs, _file_stat
+from spice_rack._fs_ops._file_systems import _base
+
+
+__all__ = (
+    "MemoryFileSystem",
+)
+
+
+@t.final
+class MemoryFileSystem(_base.AbstractFileSystem, class_id="memory"):
+    """
+    file system implementation for fsspec's in-memory file system. Every instance shares the same
+    process-wide store, use this for tests and benchmarks that shouldn't touch the disk.
+    """
+
+    def build_fsspec_file_system(self) -> FsSpecMemoryFileSystem:
+        return FsSpecMemoryFileSystem()
+
+    @classmethod
+    def get_fs_specific_prefix(cls) -> str:
+        return "memory://"
+
+    def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
+        return _path_strs.AbsoluteDirPathStr("/")
+
+    def _build_file_stat(self, raw_info: t.Dict[str, t.Any]) -> _file_stat.FileStat:
+        """fsspec's memory files are written whole, it reports when as 'created'"""
+        return _file_stat.FileStat(
+            path=_path_strs.AbsoluteFilePathStr(self.clean_raw_path_str(raw_info["name"])),
+            size=raw_info.get("size"),
+            mtime=raw_info.get("created"),
+        )
@@ -1,12 +1,16 @@
 from __future__ import annotations
+import contextlib
+import threading
 import typing as t
+import weakref
 from pydantic import Field, validate_call
 from fsspec.implementations import sftp
 from paramiko.sftp_file import SFTPFile as ParamikoSftpFile
 from paramiko.sftp_client import SFTPClient as ParamikoSftpClient
+from paramiko.ssh_exception import SSHException as ParamikoSshException
 
-from spice_rack._fs_ops import _path_strs
-from spice_rack._fs_ops._file_systems import _base
+from spice_rack._fs_ops import _path_strs, _resilience
+from spice_rack._fs_ops._file_systems import _base, _sftp_pool
 
 
 __all__ = (
@@ -27,30 +31,53 @@ class SftpFileSystem(_base.AbstractFileSystem, class_id="sftp"):
     def get_fs_specific_prefix(cls) -> str:
         return "/"
 
-    def build_fsspec_file_system(self) -> sftp.SFTPFileSystem:
-        kwargs = {
-            "host": self.host
-        }
-        if self.username:
-            kwargs["username"] = self.username
-
-        if self.password:
-            kwargs["password"] = self.password
+    max_connections: int = Field(
+        description="the max number of ssh connections we open to this server at once, shared by "
+                    "every file system inst with the same host, port, username and password",
+        default=2,
+        ge=1
+    )
+    max_channels_per_connection: int = Field(
+        description="the max number of sftp channels multiplexed over a single ssh connection",
+        default=8,
+        ge=1
+    )
+    keepalive_seconds: int = Field(
+        description="the interval of the keepalive packets on idle connections, 0 disables them",
+        default=30,
+        ge=0
+    )
+
+    def get_connection_pool(self) -> _sftp_pool.SftpConnectionPool:
+        """the process-wide connection pool for this server and these credentials"""
+        return _sftp_pool.get_sftp_connection_pool(
+            self.host,
+            self.port,
+            self.username,
+            self.password,
+            max_connections=self.max_connections,
+            max_channels_per_connection=self.max_channels_per_connection,
+            keepalive_seconds=self.keepalive_seconds,
+        )
 
-        if self.port:
-            kwargs["port"] = self.port
+    def build_fsspec_file_system(self) -> sftp.SFTPFileSystem:
+        return _PooledFsspecSftpFileSystem(self.get_connection_pool(), host=self.host)
 
-        fs = sftp.SFTPFileSystem(
-            **kwargs,
+    @classmethod
+    def get_default_max_transfer_workers(cls) -> int:
+        """transfers share the pooled connections, one channel each"""
+        return 4
 
-            # missing_host_key_policy=AutoAddPolicy()
+    @classmethod
+    def get_default_retry_policy(cls) -> _resilience.RetryPolicy:
+        """reads share the few pooled connections, so hedging them doesn't help"""
+        return _resilience.RetryPolicy(max_attempts=3, hedge_reads=False)
 
-        )
-        # hacky thing to make sure it isn't closed
-        if fs.ftp.sock.closed():
-            fs._connect()  # noqa
+    def _is_transient_error(self, error: BaseException) -> bool:
+        return super()._is_transient_error(error) or isinstance(error, (ParamikoSshException, EOFError))
 
-        return fs
+    def _get_cache_namespace(self) -> str:
+        return f"sftp://{self.username}@{self.host}:{self.port}"
 
     def get_home_dir(self) -> _path_strs.AbsoluteDirPathStr:
         # todo: revisit this
@@ -69,14 +96,12 @@ class SftpFileSystem(_base.AbstractFileSystem, class_id="sftp"):
             _path_strs.RelFilePathStr(path.get_name(include_suffixes=True))
         )
 
-        fsspec_inst = self.build_fsspec_file_system()
-        paramiko_client: ParamikoSftpClient = fsspec_inst.ftp
-
-        _paramiko_sftp_get(
-            sftp_client=paramiko_client,
-            sftp_file=self.contextualize_abs_path(path),
-            local_file=str(local_path),
-        )
+        with self.get_connection_pool().lease() as paramiko_client:
+            _paramiko_sftp_get(
+                sftp_client=paramiko_client,
+                sftp_file=self.contextualize_abs_path(path),
+                local_file=str(local_path),
+            )
         return local_path
 
     @validate_call
@@ -106,6 +131,108 @@ class SftpFileSystem(_base.AbstractFileSystem, class_id="sftp"):
         return local_path
 
 
+class _PooledFsspecSftpFileSystem(sftp.SFTPFileSystem):
+    """
+    fsspec's sftp file system, with every call leasing a channel from the connection pool instead of
+    holding its own connection. 'ftp' is the channel leased by the current thread's call.
+    """
+    def __init__(self, pool: _sftp_pool.SftpConnectionPool, host: str, **kwargs):
+        if self._cached:
+            return
+        super(sftp.SFTPFileSystem, self).__init__(**kwargs)
+        self.temppath = kwargs.pop("temppath", "/tmp")
+        self.host = host
+        self.ssh_kwargs = kwargs
+        self._pool = pool
+        self._local = threading.local()
+
+    def _connect(self) -> None:
+        # connections are opened by the pool
+        return
+
+    @property
+    def ftp(self) -> ParamikoSftpClient:
+        channel = getattr(self._local, "channel", None)
+        if channel is None:
+            raise ValueError("the sftp channel is only available within a call")
+        return channel
+
+    @contextlib.contextmanager
+    def _leased(self) -> t.Iterator[ParamikoSftpClient]:
+        """lease a channel for the current thread, nested calls reuse the outer call's channel"""
+        channel = getattr(self._local, "channel", None)
+        if channel is not None:
+            yield channel
+            return
+        with self._pool.lease() as channel:
+            self._local.channel = channel
+            try:
+                yield channel
+            finally:
+                self._local.channel = None
+
+    def mkdir(self, path, create_parents=True, mode=511):
+        with self._leased():
+            return super().mkdir(path, create_parents=create_parents, mode=mode)
+
+    def makedirs(self, path, exist_ok=False, mode=511):
+        with self._leased():
+            return super().makedirs(path, exist_ok=exist_ok, mode=mode)
+
+    def rmdir(self, path):
+        with self._leased():
+            return super().rmdir(path)
+
+    def info(self, path, **kwargs):
+        with self._leased():
+            return super().info(path)
+
+    def ls(self, path, detail=False, **kwargs):
+        with self._leased():
+            return super().ls(path, detail=detail)
+
+    def put(self, lpath, rpath, callback=None, **kwargs):
+        with self._leased():
+            return super().put(lpath, rpath, callback=callback, **kwargs)
+
+    def get_file(self, rpath, lpath, **kwargs):
+        with self._leased():
+            return super().get_file(rpath, lpath, **kwargs)
+
+    def _rm(self, path):
+        with self._leased():
+            return super()._rm(path)
+
+    def mv(self, old, new, **kwargs):
+        with self._leased():
+            return super().mv(old, new)
+
+    def _open(self, path, mode="rb", block_size=None, **kwargs):
+        """the opened file keeps its channel leased until it is closed or garbage collected"""
+        channel = self._pool.acquire()
+        outer_channel = getattr(self._local, "channel", None)
+        self._local.channel = channel
+        try:
+            opened_file = super()._open(path, mode=mode, block_size=block_size, **kwargs)
+        except BaseException as e:
+            self._pool.release(channel, discard=isinstance(e, (ParamikoSshException, EOFError)))
+            raise e
+        finally:
+            self._local.channel = outer_channel
+
+        release = weakref.finalize(opened_file, self._pool.release, channel)
+        close = opened_file.close
+
+        def _close() -> None:
+            try:
+                close()
+            finally:
+                release()
+
+        opened_file.close = _close
+        return opened_file
+
+
 # copied from here: https://github.com/paramiko/paramiko/issues/151#issuecomment-1076144423
 # read through issue for full context, but tldr: paramiko fails on large files
 
@@ -0,0 +1,314 @@
+from __future__ import annotations
+import contextlib
+import hashlib
+import threading
+import time
+import typing as t
+import paramiko
+
+
+__all__ = (
+    "SftpConnectionPool",
+    "get_sftp_connection_pool",
+    "close_sftp_connection_pools",
+)
+
+
+_ConnectFuncT = t.Callable[[], paramiko.SSHClient]
+
+
+class _PooledConnection:
+    """a single ssh connection, i.e. one login, and the number of sftp channels open on it"""
+    __slots__ = ("client", "num_channels")
+
+    def __init__(self, client: paramiko.SSHClient):
+        self.client = client
+        self.num_channels = 0
+
+    def is_healthy(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+
+def _is_channel_open(channel: paramiko.SFTPClient) -> bool:
+    raw_channel = channel.get_channel()
+    return raw_channel is not None and not raw_channel.closed
+
+
+def _close_quietly(closable: t.Any) -> None:
+    """close the channel or connection, it is usually already broken so errors are expected"""
+    try:
+        closable.close()
+    except Exception:  # noqa
+        pass
+
+
+class SftpConnectionPool:
+    """
+    thread-safe pool of ssh connections to a single server, where each connection multiplexes
+    several sftp channels. We only log in again when every open connection is at its channel
+    limit, or when a connection died, so concurrent transfers don't trip the server's login
+    rate limits.
+
+    Channels are checked before they are handed out, broken ones are dropped along with their
+    connection once it has no channels left, and the next lease transparently reconnects.
+    """
+    def __init__(
+            self,
+            connect: _ConnectFuncT,
+            *,
+            max_connections: int = 2,
+            max_channels_per_connection: int = 8,
+            keepalive_seconds: int = 30,
+    ):
+        """
+        Args:
+            connect: opens and authenticates a new ssh client
+            max_connections: the max number of ssh connections we keep open at once
+            max_channels_per_connection: the max number of sftp channels on a single connection
+            keepalive_seconds: the interval of the keepalive packets on each connection, 0 disables them
+        """
+        if max_connections < 1 or max_channels_per_connection < 1:
+            raise ValueError("the pool needs at least one connection with at least one channel")
+        self._connect = connect
+        self._max_connections = max_connections
+        self._max_channels_per_connection = max_channels_per_connection
+        self._keepalive_seconds = keepalive_seconds
+
+        self._cond = threading.Condition()
+        self._connections: t.List[_PooledConnection] = []
+        self._num_connecting = 0
+        self._idle: t.List[t.Tuple[_PooledConnection, paramiko.SFTPClient]] = []
+        self._leased: t.Dict[int, t.Tuple[_PooledConnection, paramiko.SFTPClient]] = {}
+        self._closed = False
+
+    def get_num_connections(self) -> int:
+        with self._cond:
+            return len(self._connections)
+
+    def get_num_channels(self) -> int:
+        with self._cond:
+            return sum(connection_i.num_channels for connection_i in self._connections)
+
+    def _pop_idle_channel(self, to_close: t.List[t.Any]) -> t.Optional[paramiko.SFTPClient]:
+        while self._idle:
+            connection, channel = self._idle.pop()
+            if connection.is_healthy() and _is_channel_open(channel):
+                self._leased[id(channel)] = (connection, channel)
+                return channel
+            self._drop_channel(connection, channel, to_close)
+        return None
+
+    def _drop_channel(
+            self,
+            connection: _PooledConnection,
+            channel: paramiko.SFTPClient,
+            to_close: t.List[t.Any]
+    ) -> None:
+        connection.num_channels -= 1
+        to_close.append(channel)
+        if not connection.is_healthy():
+            self._drop_dead_connections(to_close)
+        self._cond.notify_all()
+
+    def _drop_dead_connections(self, to_close: t.List[t.Any]) -> None:
+        """forget the dead connections, their idle channels go with them, leased ones are dropped on release"""
+        dead = [connection_i for connection_i in self._connections if not connection_i.is_healthy()]
+        if not dead:
+            return
+        for idle_i in [idle_i for idle_i in self._idle if idle_i[0] in dead]:
+            self._idle.remove(idle_i)
+            idle_i[0].num_channels -= 1
+            to_close.append(idle_i[1])
+        for connection_i in dead:
+            if connection_i.num_channels == 0:
+                self._connections.remove(connection_i)
+                to_close.append(connection_i.client)
+
+    def _reserve_channel_slot(self) -> t.Optional[_PooledConnection]:
+        for connection_i in self._connections:
+            if connection_i.num_channels < self._max_channels_per_connection and connection_i.is_healthy():
+                connection_i.num_channels += 1
+                return connection_i
+        return None
+
+    def _open_connection(self) -> _PooledConnection:
+        client = self._connect()
+        if self._keepalive_seconds:
+            client.get_transport().set_keepalive(self._keepalive_seconds)
+        return _PooledConnection(client)
+
+    def acquire(self, timeout: t.Optional[float] = None) -> paramiko.SFTPClient:
+        """
+        lease an sftp channel, it must be handed back with 'release'. Prefer 'lease'.
+
+        Args:
+            timeout: the max number of seconds we wait for a channel when the pool is exhausted,
+                we wait indefinitely if not specified
+
+        Returns:
+            the leased sftp channel
+
+        Raises:
+            TimeoutError: if no channel became available in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        to_close: t.List[t.Any] = []
+        connection: t.Optional[_PooledConnection] = None
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise ValueError("the sftp connection pool was closed")
+                    self._drop_dead_connections(to_close)
+                    channel = self._pop_idle_channel(to_close)
+                    if channel is not None:
+                        return channel
+                    connection = self._reserve_channel_slot()
+                    if connection is not None:
+                        break
+                    if len(self._connections) + self._num_connecting < self._max_connections:
+                        self._num_connecting += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("no sftp channel became available in time")
+                    self._cond.wait(remaining)
+        finally:
+            for closable_i in to_close:
+                _close_quietly(closable_i)
+
+        # the network round trips happen outside the lock
+        if connection is None:
+            try:
+                connection = self._open_connection()
+            finally:
+                with self._cond:
+                    self._num_connecting -= 1
+                    if connection is not None:
+                        connection.num_channels += 1
+                        self._connections.append(connection)
+                    self._cond.notify_all()
+
+        try:
+            channel = connection.client.open_sftp()
+        except Exception as e:
+            with self._cond:
+                connection.num_channels -= 1
+                self._cond.notify_all()
+            raise e
+
+        with self._cond:
+            self._leased[id(channel)] = (connection, channel)
+        return channel
+
+    def release(self, channel: paramiko.SFTPClient, *, discard: bool = False) -> None:
+        """
+        hand a leased channel back to the pool.
+
+        Args:
+            channel: the leased channel
+            discard: if True, we close the channel instead of reusing it, e.g. after a protocol error
+        """
+        to_close: t.List[t.Any] = []
+        with self._cond:
+            connection, _ = self._leased.pop(id(channel))
+            if discard or self._closed or not connection.is_healthy() or not _is_channel_open(channel):
+                self._drop_channel(connection, channel, to_close)
+            else:
+                self._idle.append((connection, channel))
+                self._cond.notify()
+        for closable_i in to_close:
+            _close_quietly(closable_i)
+
+    @contextlib.contextmanager
+    def lease(self, timeout: t.Optional[float] = None) -> t.Iterator[paramiko.SFTPClient]:
+        """
+        lease an sftp channel for the duration of the block. If the block fails with a connection
+        error, the channel is discarded, so a retry gets a fresh one.
+        """
+        channel = self.acquire(timeout=timeout)
+        discard = False
+        try:
+            yield channel
+        except (paramiko.SSHException, EOFError, ConnectionError, TimeoutError) as e:
+            discard = True
+            raise e
+        finally:
+            self.release(channel, discard=discard)
+
+    def close(self) -> None:
+        """close the idle channels and every connection, leased channels stop working"""
+        with self._cond:
+            self._closed = True
+            to_close = [channel_i for _, channel_i in self._idle]
+            to_close.extend(connection_i.client for connection_i in self._connections)
+            self._idle.clear()
+            self._connections.clear()
+            self._cond.notify_all()
+        for closable_i in to_close:
+            _close_quietly(closable_i)
+
+
+_PoolKeyT = t.Tuple[str, t.Optional[int], t.Optional[str], t.Optional[str]]
+"""the host, port, username and a fingerprint of the password"""
+
+
+def _get_pool_key(
+        host: str,
+        port: t.Optional[int],
+        username: t.Optional[str],
+        password: t.Optional[str],
+) -> _PoolKeyT:
+    """different credentials for the same user get separate pools, we key on a hash of the password, not the password"""
+    credential_fingerprint = hashlib.sha256(password.encode()).hexdigest() if password is not None else None
+    return host, port, username, credential_fingerprint
+
+_pools: t.Dict[_PoolKeyT, SftpConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sftp_connection_pool(
+        host: str,
+        port: t.Optional[int] = None,
+        username: t.Optional[str] = None,
+        password: t.Optional[str] = None,
+        *,
+        max_connections: int = 2,
+        max_channels_per_connection: int = 8,
+        keepalive_seconds: int = 30,
+) -> SftpConnectionPool:
+    """
+    the process-wide pool for the host, port, user and password. The pool is built by the first
+    call, so the pool settings of later calls for the same key are ignored.
+    """
+    key = _get_pool_key(host, port, username, password)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            def _connect() -> paramiko.SSHClient:
+                client = paramiko.SSHClient()
+                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                connect_kwargs: t.Dict[str, t.Any] = {"username": username, "password": password}
+                if port:
+                    connect_kwargs["port"] = port
+                client.connect(host, **connect_kwargs)
+                return client
+
+            pool = SftpConnectionPool(
+                _connect,
+                max_connections=max_connections,
+                max_channels_per_connection=max_channels_per_connection,
+                keepalive_seconds=keepalive_seconds,
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_sftp_connection_pools() -> None:
+    """close and forget every process-wide pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool_i in pools:
+        pool_i.close()
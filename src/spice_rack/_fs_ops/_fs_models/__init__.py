@@ -2,11 +2,13 @@ from spice_rack._fs_ops._fs_models._base import *
 from spice_rack._fs_ops._fs_models._file import *
 from spice_rack._fs_ops._fs_models._dir import *
 from spice_rack._fs_ops._fs_models._deferred import *
+from spice_rack._fs_ops._fs_models._manifest import *
 from spice_rack._fs_ops._fs_models._constraints import *
 from spice_rack._fs_ops._fs_models._types import *
 
 from spice_rack._fs_ops._fs_models import (
     _constraints as constraints,
     _types as types,
-    _deferred as deferred
+    _deferred as deferred,
+    _manifest as manifest
 )
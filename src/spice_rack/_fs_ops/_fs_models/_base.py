@@ -99,6 +99,22 @@ class AbstractFileSystemObj(
             (self.path, self.file_system)
         )
 
+    def __reduce__(self) -> t.Tuple[t.Callable[..., AbstractFileSystemObj], t.Tuple[t.Any, ...]]:
+        """
+        pickle as the class, the path and the file system, which pickles as its config fingerprint.
+        Unpickling skips validation, the instance was valid when we pickled it.
+        """
+        extra = {
+            field_name: getattr(self, field_name) for field_name in type(self).model_fields
+            if field_name not in _PICKLED_FIELD_NAMES
+        }
+        # the path goes as a plain str, unpickling the path str type would validate it again
+        path = self.path
+        args = (type(self), type(path), str.__str__(path), self.file_system)
+        if extra:
+            return _restore_file_system_obj, args + (extra,)
+        return _restore_file_system_obj, args
+
     @abstractmethod
     def _special_repr_short(self) -> str:
         ...
@@ -203,3 +219,28 @@ class AbstractFileSystemObj(
     @abstractmethod
     def init_from_str(cls, raw_str: str) -> AbstractFileSystemObj:
         ...
+
+
+_PICKLED_FIELD_NAMES = frozenset({"class_id", "path", "file_system"})
+
+
+def _restore_file_system_obj(
+        cls: t.Type[AbstractFileSystemObj],
+        path_cls: t.Type[_path_strs.FileOrDirAbsPathT],
+        raw_path: str,
+        file_system: _file_systems.AbstractFileSystem,
+        extra: t.Optional[t.Dict[str, t.Any]] = None,
+) -> AbstractFileSystemObj:
+    # what pydantic's own unpickling does, model_construct is several times slower
+    inst = cls.__new__(cls)
+    path = str.__new__(path_cls, raw_path)
+    field_values = {"class_id": cls.get_class_id(), "path": path, "file_system": file_system, **(extra or {})}
+    object.__setattr__(inst, "__dict__", field_values)
+    object.__setattr__(inst, "__pydantic_fields_set__", set(field_values))
+    object.__setattr__(inst, "__pydantic_extra__", None)
+    object.__setattr__(
+        inst,
+        "__pydantic_private__",
+        {name: attr.get_default() for name, attr in cls.__private_attributes__.items()}
+    )
+    return inst
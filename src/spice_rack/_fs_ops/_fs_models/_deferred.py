@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import os
 from abc import abstractmethod
 import typing as t
@@ -14,27 +15,97 @@ if t.TYPE_CHECKING:
 
 
 __all__ = (
-    "DeferredFilePath", "DeferredDirPath",
+    "DeferredFilePath", "DeferredDirPath", "clear_deferred_path_cache",
 )
 
 
+_DeferredPathTV = t.TypeVar("_DeferredPathTV", bound="_DeferredPath")
+
+_ROOT_CACHE_SIZE = 256
+_EVALUATED_CACHE_SIZE = 2 ** 14
+
+
+@functools.lru_cache(maxsize=_ROOT_CACHE_SIZE)
+def _parse_root(env_val: str) -> DirPath:
+    """parse the env var value once, so every path under the same root shares its file system instance"""
+    from spice_rack._fs_ops._fs_models._dir import DirPath
+    return DirPath.model_validate(env_val)
+
+
+@functools.lru_cache(maxsize=_EVALUATED_CACHE_SIZE)
+def _parse_deferred_str(cls: t.Type[_DeferredPathTV], raw_str: str) -> _DeferredPathTV:
+    return cls.model_validate(raw_str)
+
+
+@functools.lru_cache(maxsize=_EVALUATED_CACHE_SIZE)
+def _evaluate(deferred_path: _DeferredPath, env_val: str) -> AbstractFileSystemObj:
+    return deferred_path._evaluate_from_root(_parse_root(env_val))  # noqa
+
+
+def clear_deferred_path_cache() -> None:
+    """drop the cached evaluations of deferred paths"""
+    _parse_root.cache_clear()
+    _parse_deferred_str.cache_clear()
+    _evaluate.cache_clear()
+
+
 class _DeferredPath(_bases.DispatchableValueModelBase):
     env_var_key: str
 
-    def _get_env_var_val(self) -> DirPath:
-        from spice_rack._fs_ops._fs_models._dir import DirPath
-
+    def _get_env_var_str(self) -> str:
         env_val_maybe = os.environ.get(self.env_var_key)
         if env_val_maybe is None:
             raise ValueError(
                 f"'{self.env_var_key}' not found in the environment"
             )
-        return DirPath.model_validate(env_val_maybe)
+        return env_val_maybe
+
+    def _get_env_var_val(self) -> DirPath:
+        return _parse_root(self._get_env_var_str())
 
     @abstractmethod
-    def evaluate(self) -> AbstractFileSystemObj:
+    def _evaluate_from_root(self, root: DirPath) -> AbstractFileSystemObj:
         ...
 
+    def evaluate(self) -> AbstractFileSystemObj:
+        """
+        look up the environment variable and build the path under it.
+
+        The result is cached on the current value of the environment variable, so changing the
+        variable is picked up on the next call.
+        """
+        return _evaluate(self, self._get_env_var_str())
+
+    @classmethod
+    def parse_str(cls: t.Type[_DeferredPathTV], raw_str: str) -> _DeferredPathTV:
+        """parse a '$ENV_VAR/rel/path' str, caching the result"""
+        return _parse_deferred_str(cls, raw_str)
+
+    @classmethod
+    def evaluate_many(
+            cls,
+            deferred_paths: t.Iterable[t.Union[str, _DeferredPath]],
+    ) -> t.List[AbstractFileSystemObj]:
+        """
+        evaluate a collection of deferred paths, or '$ENV_VAR/rel/path' strs, reading each
+        environment variable and resolving its root directory once.
+
+        Returns:
+            the evaluated paths, in the same order
+        """
+        env_vals: t.Dict[str, str] = {}
+        res = []
+        for deferred_path_i in deferred_paths:
+            if isinstance(deferred_path_i, str):
+                deferred_path_i = cls.parse_str(deferred_path_i)
+            env_var_key_i = deferred_path_i.env_var_key
+            env_val_i = env_vals.get(env_var_key_i)
+            if env_val_i is None:
+                env_val_i = deferred_path_i._get_env_var_str()
+                env_vals[env_var_key_i] = env_val_i
+            res.append(_evaluate(deferred_path_i, env_val_i))
+        return res
+
 
 class DeferredFilePath(_DeferredPath):
     """
@@ -60,9 +131,11 @@ class DeferredFilePath(_DeferredPath):
             data = {"env_var_key": env_var_key, "rel_path": rel_path}
         return data
 
+    def _evaluate_from_root(self, root: DirPath) -> FilePath:
+        return root.joinpath(self.rel_path)
+
     def evaluate(self) -> FilePath:
-        env_val = self._get_env_var_val()
-        return env_val.joinpath(self.rel_path)
+        return super().evaluate()
 
 
 class DeferredDirPath(_DeferredPath):
@@ -83,9 +156,11 @@ class DeferredDirPath(_DeferredPath):
             data = {"env_var_key": env_var_key, "rel_path": rel_path}
         return data
 
-    def evaluate(self) -> DirPath:
-        env_val = self._get_env_var_val()
+    def _evaluate_from_root(self, root: DirPath) -> DirPath:
         if self.rel_path:
-            return env_val.joinpath(self.rel_path)
+            return root.joinpath(self.rel_path)
         else:
-            return env_val
+            return root
+
+    def evaluate(self) -> DirPath:
+        return super().evaluate()
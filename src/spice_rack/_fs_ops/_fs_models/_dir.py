@@ -1,5 +1,7 @@
 from __future__ import annotations
 import typing as t
+from collections import deque
+from concurrent import futures
 import pydantic
 
 from spice_rack._fs_ops import _path_strs, _file_systems
@@ -7,6 +9,7 @@ from spice_rack._fs_ops._fs_models._base import AbstractFileSystemObj
 
 if t.TYPE_CHECKING:
     from spice_rack._fs_ops._fs_models._file import FilePath
+    from spice_rack._fs_ops._fs_models._manifest import DirManifest
 
 
 __all__ = (
@@ -14,6 +17,9 @@ __all__ = (
 )
 
 
+_json_type_adapter = pydantic.TypeAdapter(pydantic.JsonValue)
+
+
 class DirPath(AbstractFileSystemObj):
     """
     this class represents a directory on a file system,
@@ -46,7 +52,7 @@ class DirPath(AbstractFileSystemObj):
         )
 
     def iter_dir(self) -> t.Iterator[t.Union[FilePath, DirPath]]:
-        for path_i in self.file_system.iter_dir_contents(path=self.path):
+        for path_i in self.file_system.iter_dir_contents(self.path):
             yield self.build_like(path_i)
 
     def iter_dir_contents_files_only(
@@ -59,6 +65,94 @@ class DirPath(AbstractFileSystemObj):
         ):
             yield self.build_like(path=path_i)
 
+    def iter_files_with_content(
+            self,
+            recursive: bool = True,
+            *,
+            file_exts: t.Optional[t.Sequence[str]] = None,
+            prefetch: int = 8,
+            max_workers: t.Optional[int] = None,
+            max_buffered_bytes: int = 256 * 2 ** 20,
+    ) -> t.Iterator[t.Tuple[FilePath, bytes]]:
+        """
+        iterate over the files in the directory along with their content, in listing order. The next
+        files are read concurrently in the background while the current one is processed.
+
+        Args:
+            recursive: if True, we include the files in subdirectories
+            file_exts: if specified, we only include files with one of these extensions
+            prefetch: the max number of files read ahead of the one being processed
+            max_workers: the max number of concurrent reads, defaults to 'prefetch'
+            max_buffered_bytes: the max total size of the files read ahead, going by their listed
+                sizes. A single file larger than this is still read, on its own.
+
+        Returns:
+            iterator of the file paths and their content
+
+        Raises:
+            NonExistentPathException: if a file is deleted after the listing, raised when we reach it
+        """
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+
+        file_stats = iter(self.file_system.iter_file_stats(self.path, recursive=recursive))
+        if file_exts is not None:
+            valid_exts = {ext_i.lower().lstrip(".") for ext_i in file_exts}
+            file_stats = (
+                file_stat_i for file_stat_i in file_stats
+                if str(file_stat_i.path.get_file_ext() or "").lower() in valid_exts
+            )
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers or prefetch)
+        pending: t.Deque[t.Tuple[FilePath, int, futures.Future]] = deque()
+        buffered_bytes = 0
+        try:
+            for file_stat_i in file_stats:
+                size_i = file_stat_i.size or 0
+                while pending and (
+                        len(pending) >= prefetch or buffered_bytes + size_i > max_buffered_bytes
+                ):
+                    file_path_j, size_j, future_j = pending.popleft()
+                    buffered_bytes -= size_j
+                    yield file_path_j, future_j.result()
+
+                file_path_i = self.build_like(file_stat_i.path)
+                pending.append(
+                    (file_path_i, size_i, executor.submit(self.file_system.read_bytes, file_stat_i.path))
+                )
+                buffered_bytes += size_i
+
+            while pending:
+                file_path_j, _, future_j = pending.popleft()
+                yield file_path_j, future_j.result()
+        finally:
+            # the consumer may stop early, we don't wait for reads nobody will look at
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_json(
+            self,
+            recursive: bool = True,
+            *,
+            prefetch: int = 8,
+            max_workers: t.Optional[int] = None,
+            max_buffered_bytes: int = 256 * 2 ** 20,
+    ) -> t.Iterator[t.Tuple[FilePath, pydantic.JsonValue]]:
+        """
+        iterate over the json files in the directory along with their parsed content, in listing order,
+        reading ahead like 'iter_files_with_content'.
+
+        Raises:
+            ValidationError: if a json file doesn't hold valid json, raised when we reach it
+        """
+        for file_path_i, content_i in self.iter_files_with_content(
+                recursive,
+                file_exts=("json",),
+                prefetch=prefetch,
+                max_workers=max_workers,
+                max_buffered_bytes=max_buffered_bytes,
+        ):
+            yield file_path_i, _json_type_adapter.validate_json(content_i)
+
     @t.overload
     def joinpath(self, relative_path: _path_strs.RelFilePathStr) -> FilePath:
         ...
@@ -121,11 +215,72 @@ class DirPath(AbstractFileSystemObj):
             dest_dir
         )
 
+    def upload_from(
+            self,
+            local_dir: _path_strs.AbsoluteDirPathStr,
+            max_workers: t.Optional[int] = None,
+    ) -> DirPath:
+        """
+        upload the local directory into this directory, transferring files concurrently.
+        Like 'download_locally', the uploaded directory keeps its name, i.e. it becomes a
+        subdirectory of this directory.
+
+        Args:
+            local_dir: the local directory to upload
+            max_workers: the max number of files transferred at once, if not specified we use
+                the file system's default
+
+        Returns:
+            DirPath: the uploaded directory
+        """
+        uploaded_path = self.file_system.upload_dir_from_local(
+            local_dir,
+            self.path,
+            max_workers=max_workers
+        )
+        return self.build_like(uploaded_path)
+
+    def build_manifest(
+            self,
+            persist: bool = True,
+            manifest_path: t.Optional[FilePath] = None,
+            compute_hashes: bool = False,
+    ) -> DirManifest:
+        """
+        list every file under this directory into a DirManifest, an in-memory index we can query
+        instead of listing the directory again.
+
+        Args:
+            persist: if True, we write the manifest as a parquet file
+            manifest_path: where to write the manifest, default is inside this directory
+            compute_hashes: if True, compute md5 hashes for files the file system reports no hash for
+
+        Returns:
+            DirManifest: the manifest
+        """
+        from spice_rack._fs_ops._fs_models._manifest import DirManifest
+
+        manifest = DirManifest.build(self, compute_hashes=compute_hashes)
+        if persist:
+            manifest.save(manifest_path)
+        return manifest
+
+    def load_manifest(
+            self,
+            manifest_path: t.Optional[FilePath] = None,
+    ) -> DirManifest:
+        """
+        load a manifest previously persisted with 'build_manifest'. Use 'DirManifest.refresh' to bring it
+        up to date.
+        """
+        from spice_rack._fs_ops._fs_models._manifest import DirManifest
+        return DirManifest.load(self, manifest_path)
+
     @classmethod
     def init_from_str(cls, raw_str: str) -> DirPath:
         if raw_str.startswith("$"):
             from spice_rack._fs_ops._fs_models._deferred import DeferredDirPath
-            return DeferredDirPath.model_validate(raw_str).evaluate()
+            return DeferredDirPath.parse_str(raw_str).evaluate()
         else:
             inferred_fs = _file_systems.infer_file_system(raw_str)
             path_str = inferred_fs.clean_raw_path_str(raw_str)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 import typing as t
+from concurrent import futures
 import yaml
 import pydantic
+import polars as pl
 
+from spice_rack import _polars_service
 from spice_rack._fs_ops import (
     _path_strs,
     _exceptions,
     _file_systems,
     _open_modes,
     _file_info,
+    _read_cache,
 )
 
 from spice_rack._fs_ops._fs_models._base import AbstractFileSystemObj
@@ -19,6 +23,8 @@ __all__ = (
     "TextFilePath",
     "JsonFilePath",
     "YamlFilePath",
+    "ParquetFilePath",
+    "CsvFilePath",
 )
 
 
@@ -57,12 +63,22 @@ class _FilePathBase(AbstractFileSystemObj, class_type="root"):
 
     def open(
             self,
-            mode: _open_modes.SupportedOpenModesT = "rb"
+            mode: _open_modes.SupportedOpenModesT = "rb",
+            *,
+            block_size: t.Optional[int] = None,
+            cache_type: t.Optional[_read_cache.CacheTypeT] = None,
     ) -> _open_modes.OpenFileT:
+        """
+        open the file. When reading, 'block_size' and 'cache_type' control how reads are buffered,
+        falling back to the file system's read cache config. Use cache_type='shared' for random-access
+        readers that re-open the same object, e.g. parquet or zip readers.
+        """
         try:
             return self.file_system.open_file(
                 self.path,
-                mode=mode
+                mode=mode,
+                block_size=block_size,
+                cache_type=cache_type,
             )
         except Exception as e:
             raise e
@@ -100,6 +116,22 @@ class _FilePathBase(AbstractFileSystemObj, class_type="root"):
             dest_dir
         )
 
+    def copy_to(self, dest: _FilePathBase, chunk_size: int = 8 * 2 ** 20) -> _FilePathBase:
+        """
+        copy the file to the destination. When both are on a file system with the same config, e.g. the
+        same bucket credentials or sftp host, the file system does the copy, otherwise we stream the
+        content through this process 'chunk_size' bytes at a time.
+
+        Returns:
+            the destination
+        """
+        if dest.file_system.get_config_fingerprint() == self.file_system.get_config_fingerprint():
+            self.file_system.copy_file(self.path, dest.path)
+        else:
+            with self.open("rb") as source_f, dest.open("wb") as dest_f:
+                _file_systems._base._stream_file_content(source_f, dest_f, chunk_size=chunk_size)
+        return dest
+
     def ensure_correct_file_ext(self, choices: list[str]) -> None:
         """
         ensure the file path has one of the specified extensions
@@ -136,6 +168,157 @@ class _FilePathBase(AbstractFileSystemObj, class_type="root"):
         """get the mime type of the file from its file extension, if we have it"""
         return self.path.get_mime_type()
 
+    def read_header(self, num_bytes: t.Optional[int] = None) -> bytes:
+        """
+        read the leading bytes of the file with a single ranged read.
+        By default, as many bytes as 'sniff_mime_type' needs.
+        """
+        num_bytes = num_bytes if num_bytes is not None else _file_info.get_sniff_header_size()
+        return self.file_system.read_bytes(self.path, start=0, end=num_bytes)
+
+    def sniff_mime_type(self, fallback_to_file_ext: bool = True) -> t.Optional[_file_info.MimeType]:
+        """
+        detect the mime type from the file's content, reading only its leading bytes.
+
+        Args:
+            fallback_to_file_ext: if True and the content matches nothing, we use the mime type
+                of the file extension
+
+        Returns:
+            the detected mime type, None if we couldn't determine it
+
+        Raises:
+            NonExistentPathException: if the file doesn't exist
+        """
+        mime_type = _file_info.sniff_mime_type(self.read_header())
+        if mime_type is None and fallback_to_file_ext:
+            mime_type = self.get_mime_type()
+        return mime_type
+
+    @classmethod
+    def sniff_many(
+            cls,
+            file_paths: t.Sequence[_FilePathBase],
+            *,
+            fallback_to_file_ext: bool = True,
+            max_workers: int = 16,
+    ) -> t.List[t.Optional[_file_info.MimeType]]:
+        """
+        run 'sniff_mime_type' on many files concurrently, e.g. to route an extension-less drop.
+
+        Returns:
+            the detected mime types, in the same order as the file paths
+        """
+        if not file_paths:
+            return []
+        with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(
+                executor.map(
+                    lambda file_path: file_path.sniff_mime_type(fallback_to_file_ext=fallback_to_file_ext),
+                    file_paths
+                )
+            )
+
+    def _is_local(self) -> bool:
+        return isinstance(self.file_system, _file_systems.LocalFileSystem)
+
+    def scan_parquet(self, **polars_kwargs) -> pl.LazyFrame:
+        """
+        scan the parquet file into a LazyFrame. If polars can read the file system natively, e.g. local
+        or gcs, polars reads the file itself, with the file system's credentials, so filters and
+        column selections are pushed down into the read. Otherwise we read it through the file system.
+
+        Args:
+            **polars_kwargs: passed to 'pl.scan_parquet', or 'pl.read_parquet' when we read through
+                the file system
+        """
+        storage_options = self.file_system.get_polars_storage_options()
+        if storage_options is not None:
+            return pl.scan_parquet(self.as_str(), storage_options=storage_options or None, **polars_kwargs)
+        with self.open("rb", cache_type="shared") as f:
+            return pl.read_parquet(f, **polars_kwargs).lazy()
+
+    def scan_ipc(self, **polars_kwargs) -> pl.LazyFrame:
+        """
+        scan the arrow ipc file into a LazyFrame, see 'scan_parquet'
+
+        Args:
+            **polars_kwargs: passed to 'pl.scan_ipc', or 'pl.read_ipc' when we read through the file system
+        """
+        storage_options = self.file_system.get_polars_storage_options()
+        if storage_options is not None:
+            return pl.scan_ipc(self.as_str(), storage_options=storage_options or None, **polars_kwargs)
+        with self.open("rb", cache_type="shared") as f:
+            return pl.read_ipc(f, memory_map=False, **polars_kwargs).lazy()
+
+    def scan_csv(self, **polars_kwargs) -> pl.LazyFrame:
+        """
+        scan the csv file into a LazyFrame. polars only scans local csv files itself, on other file
+        systems we read the file through the file system.
+
+        Args:
+            **polars_kwargs: passed to 'pl.scan_csv', or 'pl.read_csv' when we read through the file system
+        """
+        if self._is_local():
+            return pl.scan_csv(str(self.path), **polars_kwargs)
+        with self.open("rb") as f:
+            return pl.read_csv(f, **polars_kwargs).lazy()
+
+    def scan_ndjson(self, **polars_kwargs) -> pl.LazyFrame:
+        """
+        scan the newline-delimited json file into a LazyFrame. polars only scans local ndjson files
+        itself, on other file systems we read the file through the file system.
+
+        Args:
+            **polars_kwargs: passed to 'pl.scan_ndjson', or 'pl.read_ndjson' when we read through the
+                file system
+        """
+        if self._is_local():
+            return pl.scan_ndjson(str(self.path), **polars_kwargs)
+        with self.open("rb") as f:
+            return pl.read_ndjson(f, **polars_kwargs).lazy()
+
+    def write_parquet(self, df: _polars_service.types.PolarsMaybeLazyDfT, **polars_kwargs) -> None:
+        """
+        write the DataFrame, or the collected LazyFrame, as a parquet file
+
+        Args:
+            df: the polars object to write
+            **polars_kwargs: passed to 'pl.DataFrame.write_parquet'
+        """
+        with self.open("wb") as f:
+            df.lazy().collect().write_parquet(f, **polars_kwargs)
+
+    def write_ipc(self, df: _polars_service.types.PolarsMaybeLazyDfT, **polars_kwargs) -> None:
+        """
+        write the DataFrame, or the collected LazyFrame, as an arrow ipc file
+
+        Args:
+            df: the polars object to write
+            **polars_kwargs: passed to 'pl.DataFrame.write_ipc'
+        """
+        with self.open("wb") as f:
+            df.lazy().collect().write_ipc(f, **polars_kwargs)
+
+    def write_csv(self, df: _polars_service.types.PolarsMaybeLazyDfT, **polars_kwargs) -> None:
+        """
+        write the DataFrame, or the collected LazyFrame, as a csv file
+
+        Args:
+            df: the polars object to write
+            **polars_kwargs: passed to 'pl.DataFrame.write_csv'
+        """
+        with self.open("wb") as f:
+            df.lazy().collect().write_csv(f, **polars_kwargs)
+
+    def write_ndjson(self, df: _polars_service.types.PolarsMaybeLazyDfT, batch_size: int = 100_000) -> None:
+        """
+        write the DataFrame, or the collected LazyFrame, as newline-delimited json, see
+        'polars_service.write_ndjson'
+        """
+        with self.open("wb") as f:
+            _polars_service.write_ndjson(df, f, batch_size=batch_size)
+
     @classmethod
     def init_from_str(cls: t.Type[SelfTV], raw_str: str) -> SelfTV:
         """
@@ -147,7 +330,7 @@ class _FilePathBase(AbstractFileSystemObj, class_type="root"):
         """
         if raw_str.startswith("$"):
             from spice_rack._fs_ops._fs_models._deferred import DeferredFilePath
-            return DeferredFilePath.model_validate(raw_str).evaluate()
+            return DeferredFilePath.parse_str(raw_str).evaluate()
         else:
             inferred_fs = _file_systems.infer_file_system(raw_str)
             path_str = inferred_fs.clean_raw_path_str(raw_str)
@@ -278,3 +461,61 @@ class YamlFilePath(_FilePathBase):
             data = yaml.unsafe_load(f)
 
         return _json_type_adapter.validate_python(data)
+
+
+class ParquetFilePath(_FilePathBase):
+    """
+    extension of the standard FilePath object for parquet files.
+    """
+    @pydantic.model_validator(mode="before")
+    def _handle_general_file_path(cls, data: t.Any) -> t.Any:
+        if isinstance(data, FilePath):
+            data = data.model_dump(exclude={"class_id"})
+        return data
+
+    def _post_init_validation(self) -> None:
+        try:
+            self.ensure_correct_file_ext(["parquet", "pq"])
+
+        except _exceptions.InvalidFileExtensionException as e:
+            raise e.as_pydantic_error()
+
+        except Exception as e:
+            raise e
+
+    def scan(self, **polars_kwargs) -> pl.LazyFrame:
+        """scan the file into a LazyFrame, see 'scan_parquet'"""
+        return self.scan_parquet(**polars_kwargs)
+
+    def write_df(self, df: _polars_service.types.PolarsMaybeLazyDfT, **polars_kwargs) -> None:
+        """write the polars object, see 'write_parquet'"""
+        self.write_parquet(df, **polars_kwargs)
+
+
+class CsvFilePath(_FilePathBase):
+    """
+    extension of the standard FilePath object for csv files.
+    """
+    @pydantic.model_validator(mode="before")
+    def _handle_general_file_path(cls, data: t.Any) -> t.Any:
+        if isinstance(data, FilePath):
+            data = data.model_dump(exclude={"class_id"})
+        return data
+
+    def _post_init_validation(self) -> None:
+        try:
+            self.ensure_correct_file_ext(["csv"])
+
+        except _exceptions.InvalidFileExtensionException as e:
+            raise e.as_pydantic_error()
+
+        except Exception as e:
+            raise e
+
+    def scan(self, **polars_kwargs) -> pl.LazyFrame:
+        """scan the file into a LazyFrame, see 'scan_csv'"""
+        return self.scan_csv(**polars_kwargs)
+
+    def write_df(self, df: _polars_service.types.PolarsMaybeLazyDfT, **polars_kwargs) -> None:
+        """write the polars object, see 'write_csv'"""
+        self.write_csv(df, **polars_kwargs)
@@ -0,0 +1,285 @@
+from __future__ import annotations
+import hashlib
+import typing as t
+import pydantic
+import polars as pl
+
+from spice_rack import _bases, _polars_service
+from spice_rack._fs_ops import _path_strs, _helpers, _file_stat
+from spice_rack._fs_ops._fs_models._base import _restore_file_system_obj
+from spice_rack._fs_ops._fs_models._dir import DirPath
+from spice_rack._fs_ops._fs_models._file import FilePath
+
+
+__all__ = (
+    "DirManifest",
+)
+
+
+_MANIFEST_SCHEMA: t.Dict[str, pl.PolarsDataType] = {
+    "rel_path": pl.Utf8,
+    "prefix": pl.Utf8,
+    "prefix_fingerprint": pl.Utf8,
+    "file_ext": pl.Utf8,
+    "size": pl.Int64,
+    "mtime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    "hash": pl.Utf8,
+}
+
+_ROOT_PREFIX = "./"
+"""the prefix value we use for files that sit directly in the root directory"""
+
+
+class DirManifest(_bases.ValueModelBase):
+    """
+    an index of every file under a directory, with the relative path, size, modified time and hash
+    of each file. It is persisted as a parquet file, by default next to the data, so repeated
+    queries against a large tree run in memory instead of through repeated listings.
+
+    the rows are grouped by their top-level 'prefix', i.e. the first directory under the root,
+    which is the unit we re-list when refreshing.
+    """
+    root: DirPath = pydantic.Field(description="the directory this manifest indexes")
+    df: _polars_service.types.PolarsDfT = pydantic.Field(
+        description="the manifest data, one row per file"
+    )
+
+    @classmethod
+    def get_schema(cls) -> t.Dict[str, pl.PolarsDataType]:
+        """the polars schema of the manifest data"""
+        return dict(_MANIFEST_SCHEMA)
+
+    @classmethod
+    def build(cls, root: DirPath, compute_hashes: bool = False) -> DirManifest:
+        """
+        list every file under the root and build a new manifest from the listing.
+
+        Args:
+            root: the directory to index
+            compute_hashes: if True, we read files the file system reports no hash for and compute
+                an md5 hash. This reads every such file in full so it is off by default.
+
+        Returns:
+            DirManifest: the new manifest, not yet persisted
+        """
+        fingerprints = _get_top_level_fingerprints(root)
+        df = _build_df(
+            root=root,
+            file_stats=root.file_system.iter_file_stats(root.path),
+            fingerprints=fingerprints,
+            compute_hashes=compute_hashes,
+        )
+        return cls(root=root, df=df)
+
+    def refresh(
+            self,
+            prefixes: t.Optional[t.Sequence[str]] = None,
+            compute_hashes: bool = False,
+    ) -> DirManifest:
+        """
+        build an updated manifest, re-listing only the prefixes that changed.
+
+        If prefixes is not specified, we list the top level of the root once and re-list the
+        top-level prefixes that are new, or whose directory fingerprint changed, and drop the ones that
+        were removed. The fingerprint is the directory's modified time, so on file systems that don't
+        report one, e.g. gcs, every top-level prefix is re-listed. Directory modified times only reflect
+        direct children, so pass the prefixes explicitly when contents nested deeper changed.
+
+        Args:
+            prefixes: relative directory paths to re-list, e.g. './date=2024-01-01/'
+            compute_hashes: see 'build'
+
+        Returns:
+            DirManifest: a new manifest instance, not yet persisted
+        """
+        current_fingerprints = _get_top_level_fingerprints(self.root)
+        recorded_fingerprints: t.Dict[str, t.Optional[str]] = dict(
+            self.df.select("prefix", "prefix_fingerprint").unique(subset="prefix").iter_rows()
+        )
+
+        prefixes_to_list: t.List[_path_strs.RelDirPathStr]
+        prefixes_to_drop: t.List[str]
+        if prefixes is None:
+            prefixes_to_list = [
+                _path_strs.RelDirPathStr(prefix_i)
+                for prefix_i, fingerprint_i in current_fingerprints.items()
+                if fingerprint_i is None or recorded_fingerprints.get(prefix_i) != fingerprint_i
+            ]
+            prefixes_to_drop = [
+                prefix_i for prefix_i in recorded_fingerprints if prefix_i not in current_fingerprints
+            ]
+            # the files directly under the root are always re-listed
+            prefixes_to_drop.append(_ROOT_PREFIX)
+        else:
+            prefixes_to_list = [_path_strs.RelDirPathStr(prefix_i) for prefix_i in prefixes]
+            prefixes_to_drop = []
+
+            # only fully re-listed top-level prefixes get a new fingerprint
+            for prefix_i, fingerprint_i in current_fingerprints.items():
+                if prefix_i not in prefixes_to_list:
+                    current_fingerprints[prefix_i] = recorded_fingerprints.get(prefix_i)
+
+        stale_expr = pl.col("prefix").is_in(prefixes_to_drop)
+        for prefix_i in prefixes_to_list:
+            stale_expr = stale_expr | pl.col("rel_path").str.starts_with(str(prefix_i))
+        kept_df = self.df.filter(~stale_expr)
+
+        file_stats: t.List[_file_stat.FileStat] = []
+        if prefixes is None:
+            file_stats.extend(self.root.file_system.iter_file_stats(self.root.path, recursive=False))
+        for prefix_i in prefixes_to_list:
+            prefix_path = self.root.path.joinpath(prefix_i)
+            if self.root.file_system.exists(prefix_path):
+                file_stats.extend(self.root.file_system.iter_file_stats(prefix_path))
+
+        new_df = _build_df(
+            root=self.root,
+            file_stats=file_stats,
+            fingerprints=current_fingerprints,
+            compute_hashes=compute_hashes
+        )
+        refreshed_df = pl.concat([kept_df, new_df], how="vertical").sort("rel_path")
+        return DirManifest(root=self.root, df=refreshed_df)
+
+    def get_default_path(self) -> FilePath:
+        """the default location we persist this manifest, directly inside the root"""
+        return self.root.joinpath(_helpers.get_manifest_rel_path())
+
+    def save(self, dest: t.Optional[FilePath] = None) -> FilePath:
+        """
+        persist the manifest as a parquet file.
+
+        Args:
+            dest: where to write the manifest, if not specified we use 'get_default_path'. This can
+                be on a different file system than the root, e.g. a local cache dir.
+
+        Returns:
+            FilePath: where we wrote the manifest
+        """
+        dest = dest if dest is not None else self.get_default_path()
+        with dest.open("wb") as f:
+            self.df.write_parquet(f)
+        return dest
+
+    @classmethod
+    def load(cls, root: DirPath, src: t.Optional[FilePath] = None) -> DirManifest:
+        """
+        load a previously persisted manifest.
+
+        Args:
+            root: the directory the manifest indexes
+            src: where the manifest was written, if not specified we use the default location
+                inside the root
+
+        Returns:
+            DirManifest: the loaded manifest
+
+        Raises:
+            NonExistentPathException: if there is no manifest at the location
+        """
+        src = src if src is not None else root.joinpath(_helpers.get_manifest_rel_path())
+        with src.open("rb") as f:
+            df = pl.read_parquet(f)
+        return cls(root=root, df=df)
+
+    def lazy(self) -> pl.LazyFrame:
+        """
+        the manifest data as a LazyFrame, to build queries against, e.g.
+        'manifest.lazy().filter(pl.col("file_ext") == "json", pl.col("size") > 1_000_000)'
+        """
+        return self.df.lazy()
+
+    def iter_file_paths(
+            self,
+            df: t.Optional[_polars_service.types.PolarsMaybeLazyDfT] = None
+    ) -> t.Iterator[FilePath]:
+        """
+        iterate over FilePath instances for the rows of the manifest, or the rows of a query result
+        built from the manifest if specified.
+        """
+        if df is None:
+            df = self.df
+        elif isinstance(df, pl.LazyFrame):
+            df = df.collect()
+
+        # the paths are joined and checked as one column, so we skip validating each FilePath
+        paths = _path_strs.PathStrArray.from_rel_paths(self.root.path, df.get_column("rel_path"))
+        file_system = self.root.file_system
+        for path_i in paths.to_series():
+            yield _restore_file_system_obj(FilePath, _path_strs.AbsoluteFilePathStr, path_i, file_system)
+
+    def __len__(self) -> int:
+        return self.df.height
+
+
+def _get_top_level_fingerprints(root: DirPath) -> t.Dict[str, t.Optional[str]]:
+    """list the top level of the root once, returning the directory fingerprints by prefix"""
+    return {
+        f"./{dir_path_i.get_name()}": mtime_i.isoformat() if mtime_i is not None else None
+        for dir_path_i, mtime_i in root.file_system.iter_sub_dir_mtimes(root.path)
+    }
+
+
+def _compute_md5(root: DirPath, path: _path_strs.AbsoluteFilePathStr) -> str:
+    md5 = hashlib.md5()
+    with root.file_system.open_file(path, "rb") as f:
+        for chunk in iter(lambda: f.read(2 ** 20), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _build_df(
+        root: DirPath,
+        file_stats: t.Iterable[_file_stat.FileStat],
+        fingerprints: t.Dict[str, t.Optional[str]],
+        compute_hashes: bool,
+) -> pl.DataFrame:
+    """build the manifest rows, the path columns are computed over the whole listing at once"""
+    raw_paths: t.List[str] = []
+    sizes: t.List[t.Optional[int]] = []
+    mtimes: t.List[t.Any] = []
+    hashes: t.List[t.Optional[str]] = []
+    for file_stat_i in file_stats:
+        raw_paths.append(file_stat_i.path)
+        sizes.append(file_stat_i.size)
+        mtimes.append(file_stat_i.mtime)
+        hashes.append(file_stat_i.hash)
+
+    paths = _path_strs.PathStrArray.from_strs(raw_paths, validate=False)
+    keep_mask = ~paths.is_manifest()
+    paths = paths.filter(keep_mask)
+    df = pl.DataFrame(
+        {
+            "rel_path": paths.relative_to(root.path),
+            "file_ext": paths.get_file_ext(),
+            "size": pl.Series(sizes, dtype=_MANIFEST_SCHEMA["size"]).filter(keep_mask),
+            "mtime": pl.Series(mtimes, dtype=_MANIFEST_SCHEMA["mtime"]).filter(keep_mask),
+            "hash": pl.Series(hashes, dtype=_MANIFEST_SCHEMA["hash"]).filter(keep_mask),
+        }
+    )
+
+    # './a/b/c.txt' -> './a/', './c.txt' -> './'
+    prefix_expr = pl.col("rel_path").str.extract(r"^\./([^/]+/)", 1)
+    df = df.with_columns(
+        prefix=pl.when(prefix_expr.is_null()).then(pl.lit(_ROOT_PREFIX)).otherwise(pl.lit("./") + prefix_expr),
+    ).with_columns(
+        prefix_fingerprint=pl.col("prefix").replace(fingerprints, default=None, return_dtype=pl.Utf8),
+    )
+
+    if compute_hashes:
+        missing_hashes = df.filter(pl.col("hash").is_null()).get_column("rel_path")
+        if missing_hashes.len():
+            computed = {
+                rel_path_i: _compute_md5(root, path_i) for rel_path_i, path_i in zip(
+                    missing_hashes, _path_strs.PathStrArray.from_rel_paths(root.path, missing_hashes)
+                )
+            }
+            df = df.with_columns(
+                hash=pl.col("hash").fill_null(
+                    pl.col("rel_path").replace(computed, default=None, return_dtype=pl.Utf8)
+                )
+            )
+
+    return df.select(
+        [pl.col(name_i).cast(dtype_i) for name_i, dtype_i in _MANIFEST_SCHEMA.items()]
+    ).sort("rel_path")
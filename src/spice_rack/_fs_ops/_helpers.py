@@ -8,6 +8,8 @@ if t.TYPE_CHECKING:
 __all__ = (
     "get_placeholder_rel_path",
     "is_placeholder_file_path",
+    "get_manifest_rel_path",
+    "is_manifest_file_path",
 )
 
 
@@ -20,7 +22,22 @@ def get_placeholder_rel_path() -> _path_strs.RelFilePathStr:
 
 def is_placeholder_file_path(path: _path_strs.RelOrAbsFilePathT) -> bool:
     placeholder_file_path = get_placeholder_rel_path()
-    if str(path).endswith(str(placeholder_file_path)):
+    if str(path).split("/")[-1] == placeholder_file_path.get_name(include_suffixes=True):
+        return True
+    else:
+        return False
+
+
+def get_manifest_rel_path() -> _path_strs.RelFilePathStr:
+    from spice_rack._fs_ops import _path_strs
+    return _path_strs.RelFilePathStr(
+        "_SPICE_RACK_MANIFEST.parquet"
+    )
+
+
+def is_manifest_file_path(path: _path_strs.RelOrAbsFilePathT) -> bool:
+    manifest_file_path = get_manifest_rel_path()
+    if str(path).split("/")[-1] == manifest_file_path.get_name(include_suffixes=True):
         return True
     else:
         return False
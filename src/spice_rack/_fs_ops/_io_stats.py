@@ -0,0 +1,368 @@
+from __future__ import annotations
+import bisect
+import codecs
+import io
+import threading
+import typing as t
+import polars as pl
+
+
+__all__ = (
+    "IoStats",
+    "IoStatsLogger",
+    "CountingFile",
+    "get_io_stats",
+    "reset_io_stats",
+    "set_io_stats_enabled",
+    "io_stats_enabled",
+    "get_latency_bucket_bounds",
+)
+
+
+_LATENCY_BUCKET_BOUNDS: t.Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+"""the upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded"""
+
+
+def get_latency_bucket_bounds() -> t.Tuple[float, ...]:
+    """the upper bound in seconds of each latency histogram bucket, except the last unbounded one"""
+    return _LATENCY_BUCKET_BOUNDS
+
+
+class _OpStats:
+    """the running totals of a single operation on a single file system type"""
+    __slots__ = ("count", "errors", "bytes_read", "bytes_written", "total_seconds", "max_seconds", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram = [0] * (len(_LATENCY_BUCKET_BOUNDS) + 1)
+
+    def get_quantile(self, q: float) -> t.Optional[float]:
+        """the upper bound of the bucket the quantile falls in, the max latency for the last bucket"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bucket_i, count_i in enumerate(self.histogram):
+            seen += count_i
+            if seen >= target:
+                if bucket_i < len(_LATENCY_BUCKET_BOUNDS):
+                    return min(_LATENCY_BUCKET_BOUNDS[bucket_i], self.max_seconds)
+                break
+        return self.max_seconds
+
+
+class IoStats:
+    """
+    thread-safe running totals of the file system operations, keyed by file system type and operation.
+    Each record is a couple of integer increments under a lock, so this is cheap enough to keep on.
+    """
+    def __init__(self):
+        self._stats: t.Dict[t.Tuple[str, str], _OpStats] = {}
+        self._lock = threading.Lock()
+
+    def _get_op_stats(self, file_system_type: str, op_name: str) -> _OpStats:
+        key = (file_system_type, op_name)
+        op_stats = self._stats.get(key)
+        if op_stats is None:
+            op_stats = _OpStats()
+            self._stats[key] = op_stats
+        return op_stats
+
+    def record_call(
+            self,
+            file_system_type: str,
+            op_name: str,
+            seconds: float,
+            *,
+            error: bool = False,
+            bytes_read: int = 0,
+            bytes_written: int = 0,
+    ) -> None:
+        """record a single call of the operation"""
+        bucket = bisect.bisect_left(_LATENCY_BUCKET_BOUNDS, seconds)
+        with self._lock:
+            op_stats = self._get_op_stats(file_system_type, op_name)
+            op_stats.count += 1
+            op_stats.errors += error
+            op_stats.bytes_read += bytes_read
+            op_stats.bytes_written += bytes_written
+            op_stats.total_seconds += seconds
+            op_stats.max_seconds = max(op_stats.max_seconds, seconds)
+            op_stats.histogram[bucket] += 1
+
+    def record_bytes(
+            self,
+            file_system_type: str,
+            op_name: str,
+            *,
+            bytes_read: int = 0,
+            bytes_written: int = 0,
+    ) -> None:
+        """add bytes transferred after the call was recorded, e.g. when reading from an opened file"""
+        with self._lock:
+            op_stats = self._get_op_stats(file_system_type, op_name)
+            op_stats.bytes_read += bytes_read
+            op_stats.bytes_written += bytes_written
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_dict(self) -> t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]]:
+        """the stats as nested dicts, keyed by file system type, then operation"""
+        res: t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]] = {}
+        for row_i in self.to_rows():
+            file_system_type = row_i.pop("file_system_type")
+            op_name = row_i.pop("op")
+            res.setdefault(file_system_type, {})[op_name] = row_i
+        return res
+
+    def to_rows(self) -> t.List[t.Dict[str, t.Any]]:
+        """the stats as a list of flat dicts, one per file system type and operation"""
+        with self._lock:
+            rows = []
+            for (file_system_type, op_name), op_stats in sorted(self._stats.items()):
+                rows.append(
+                    {
+                        "file_system_type": file_system_type,
+                        "op": op_name,
+                        "count": op_stats.count,
+                        "errors": op_stats.errors,
+                        "bytes_read": op_stats.bytes_read,
+                        "bytes_written": op_stats.bytes_written,
+                        "total_seconds": op_stats.total_seconds,
+                        "mean_seconds": op_stats.total_seconds / op_stats.count if op_stats.count else None,
+                        "p50_seconds": op_stats.get_quantile(0.5),
+                        "p95_seconds": op_stats.get_quantile(0.95),
+                        "p99_seconds": op_stats.get_quantile(0.99),
+                        "max_seconds": op_stats.max_seconds,
+                        "latency_histogram": list(op_stats.histogram),
+                    }
+                )
+            return rows
+
+    def to_df(self) -> pl.DataFrame:
+        """the stats as a DataFrame, one row per file system type and operation"""
+        return pl.DataFrame(
+            self.to_rows(),
+            schema={
+                "file_system_type": pl.Utf8,
+                "op": pl.Utf8,
+                "count": pl.Int64,
+                "errors": pl.Int64,
+                "bytes_read": pl.Int64,
+                "bytes_written": pl.Int64,
+                "total_seconds": pl.Float64,
+                "mean_seconds": pl.Float64,
+                "p50_seconds": pl.Float64,
+                "p95_seconds": pl.Float64,
+                "p99_seconds": pl.Float64,
+                "max_seconds": pl.Float64,
+                "latency_histogram": pl.List(pl.Int64),
+            }
+        )
+
+
+_io_stats = IoStats()
+_enabled = True
+
+
+def get_io_stats() -> IoStats:
+    """the process-wide stats every file system records its operations to"""
+    return _io_stats
+
+
+def reset_io_stats() -> None:
+    """clear the process-wide stats"""
+    _io_stats.reset()
+
+
+def set_io_stats_enabled(enabled: bool) -> None:
+    """turn recording to the process-wide stats on or off, it is on by default"""
+    global _enabled
+    _enabled = enabled
+
+
+def io_stats_enabled() -> bool:
+    return _enabled
+
+
+class IoStatsLogger:
+    """
+    logs a summary of the process-wide stats on an interval, from a daemon thread.
+
+    Examples:
+        stats_logger = IoStatsLogger(interval_seconds=60)
+        stats_logger.start()
+        ...
+        stats_logger.stop()
+    """
+    def __init__(self, interval_seconds: float = 60.0, reset_after_log: bool = False):
+        self._interval_seconds = interval_seconds
+        self._reset_after_log = reset_after_log
+        self._stop_event = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def log_summary(self) -> None:
+        """log the current stats once"""
+        from spice_rack import _logging
+        rows = _io_stats.to_rows()
+        if not rows:
+            return
+        for row_i in rows:
+            row_i.pop("latency_histogram")
+        _logging.Logger.get_logger().info("file system io stats", extra_data=[{"io_stats": rows}])
+        if self._reset_after_log:
+            _io_stats.reset()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval_seconds):
+            self.log_summary()
+
+    def start(self) -> IoStatsLogger:
+        if self._thread is not None:
+            raise ValueError("the io stats logger was already started")
+        self._thread = threading.Thread(target=self._run, name="spice_rack_io_stats_logger", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, log_final_summary: bool = True) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        if log_final_summary:
+            self.log_summary()
+
+
+class CountingFile(io.IOBase):
+    """
+    thin wrapper around an opened file, adding the bytes read and written through it to the stats
+    of the 'read' and 'write' operations. Everything else is passed through to the wrapped file, the
+    same way fsspec's LocalFileOpener wraps local files.
+
+    Set 'count_reads' to False when the reads are already recorded as they are fetched from the
+    file system, so each byte is only counted once. Text is counted as its encoded bytes.
+    """
+    def __init__(self, opened_file: t.Any, file_system_type: str, count_reads: bool = True):
+        self._file = opened_file
+        self._file_system_type = file_system_type
+        self._count_reads = count_reads
+        self._bytes_read = 0
+        self._bytes_written = 0
+        self._encoder: t.Optional[codecs.IncrementalEncoder] = None
+
+    @property
+    def wrapped(self) -> t.Any:
+        """the underlying file object"""
+        return self._file
+
+    def _count_bytes(self, data: t.Union[bytes, str]) -> int:
+        if isinstance(data, str):
+            # incremental, so a BOM is only counted once, like it is only in the file once
+            if self._encoder is None:
+                encoding = getattr(self._file, "encoding", None) or "utf-8"
+                self._encoder = codecs.getincrementalencoder(encoding)(errors="replace")
+            return len(self._encoder.encode(data))
+        return len(data)
+
+    def read(self, *args, **kwargs) -> bytes:
+        data = self._file.read(*args, **kwargs)
+        self._bytes_read += self._count_bytes(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        num_bytes = self._file.readinto(buffer)
+        self._bytes_read += num_bytes or 0
+        return num_bytes
+
+    def readline(self, *args, **kwargs) -> bytes:
+        data = self._file.readline(*args, **kwargs)
+        self._bytes_read += self._count_bytes(data)
+        return data
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        for line in self._file:
+            self._bytes_read += self._count_bytes(line)
+            yield line
+
+    def write(self, data) -> int:
+        num_written = self._file.write(data)
+        if isinstance(data, str):
+            self._bytes_written += self._count_bytes(data[:num_written] if num_written is not None else data)
+        else:
+            self._bytes_written += num_written if num_written is not None else len(data)
+        return num_written
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    def readlines(self, hint: int = -1) -> t.List[bytes]:
+        lines = self._file.readlines(hint)
+        self._bytes_read += sum(self._count_bytes(line) for line in lines)
+        return lines
+
+    def seek(self, *args, **kwargs) -> int:
+        return self._file.seek(*args, **kwargs)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seekable(self) -> bool:
+        return self._file.seekable()
+
+    def readable(self) -> bool:
+        return self._file.readable()
+
+    def writable(self) -> bool:
+        return self._file.writable()
+
+    def flush(self) -> None:
+        return self._file.flush()
+
+    def truncate(self, *args, **kwargs) -> int:
+        return self._file.truncate(*args, **kwargs)
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def isatty(self) -> bool:
+        return self._file.isatty()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _flush_counts(self) -> None:
+        if self._bytes_read and self._count_reads:
+            _io_stats.record_bytes(self._file_system_type, "read", bytes_read=self._bytes_read)
+        if self._bytes_written:
+            _io_stats.record_bytes(self._file_system_type, "write", bytes_written=self._bytes_written)
+        self._bytes_read = 0
+        self._bytes_written = 0
+
+    def close(self) -> None:
+        try:
+            self._file.close()
+        finally:
+            self._flush_counts()
+
+    def __enter__(self) -> CountingFile:
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._file.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._flush_counts()
+
+    def __getattr__(self, item: str) -> t.Any:
+        return getattr(self._file, item)
@@ -4,6 +4,7 @@ import pydantic
 from spice_rack._fs_ops._path_strs._base import *
 from spice_rack._fs_ops._path_strs._abs import *
 from spice_rack._fs_ops._path_strs._rel import *
+from spice_rack._fs_ops._path_strs._array import *
 
 
 _TagsT = t.Literal["rel", "abs"]
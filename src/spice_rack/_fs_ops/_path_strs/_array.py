@@ -0,0 +1,160 @@
+from __future__ import annotations
+import typing as t
+import polars as pl
+
+from spice_rack._fs_ops._path_strs import _abs
+from spice_rack._fs_ops import _exceptions, _helpers
+
+
+__all__ = (
+    "PathStrArray",
+)
+
+
+class PathStrArray:
+    """
+    a column of absolute file path strings, backed by a polars Series. The path str methods run as
+    vectorized string kernels over the whole column, and the typed AbsoluteFilePathStr instances are
+    only built when we iterate or index, so bulk work on millions of paths doesn't build millions of
+    objects.
+
+    Each method returns the same result as the AbsoluteFilePathStr method of the same name, as a Series.
+
+    Examples:
+        paths = PathStrArray.from_strs(raw_strs)
+        json_paths = paths.drop_placeholders().filter_file_exts(["json"])
+        for path in json_paths:
+            ...
+    """
+    def __init__(self, series: pl.Series, validate: bool = True):
+        """
+        Args:
+            series: the absolute file path strings
+            validate: if True, we check every path at once and raise on the first invalid one.
+                Only skip this for paths that came from typed path strings.
+
+        Raises:
+            InvalidPathStrException: if a path is not a valid absolute file path
+        """
+        self._series = series.cast(pl.Utf8).rename("path")
+        if validate:
+            self.validate()
+
+    @classmethod
+    def from_strs(cls, raw_strs: t.Iterable[str], validate: bool = True) -> PathStrArray:
+        return cls(pl.Series("path", list(raw_strs), dtype=pl.Utf8), validate=validate)
+
+    @classmethod
+    def from_rel_paths(
+            cls,
+            dir_path: _abs.AbsoluteDirPathStr,
+            rel_paths: t.Union[pl.Series, t.Iterable[str]],
+            validate: bool = True
+    ) -> PathStrArray:
+        """
+        join the relative file paths onto the directory, the vectorized 'AbsoluteDirPathStr.joinpath'.
+        The relative paths may or may not start with './'.
+        """
+        if not isinstance(rel_paths, pl.Series):
+            rel_paths = pl.Series("path", list(rel_paths), dtype=pl.Utf8)
+        joined = str(dir_path) + rel_paths.cast(pl.Utf8).str.strip_prefix("./")
+        return cls(joined, validate=validate)
+
+    def to_series(self) -> pl.Series:
+        return self._series
+
+    def to_list(self) -> t.List[_abs.AbsoluteFilePathStr]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._series.len()
+
+    def __iter__(self) -> t.Iterator[_abs.AbsoluteFilePathStr]:
+        for raw_str_i in self._series:
+            yield _as_typed(raw_str_i)
+
+    def __getitem__(self, index: int) -> _abs.AbsoluteFilePathStr:
+        return _as_typed(self._series[index])
+
+    def get_validity(self) -> pl.Series:
+        """True for every valid absolute file path, i.e. starting with '/' and not ending with '/'"""
+        return (
+            self._series.str.starts_with("/") & ~self._series.str.ends_with("/")
+        ).fill_null(False).rename("is_valid")
+
+    def validate(self) -> None:
+        """
+        Raises:
+            InvalidPathStrException: for the first path that is not a valid absolute file path
+        """
+        invalid = self._series.filter(~self.get_validity())
+        if invalid.len():
+            raw_str = invalid[0]
+            issues = _abs.AbsoluteFilePathStr._check_str_val(raw_str) if raw_str is not None else [
+                "the path is null"
+            ]
+            raise _exceptions.InvalidPathStrException(
+                detail=f"{invalid.len()} of {len(self)} raw path strs are not valid for "
+                       f"'{_abs.AbsoluteFilePathStr.get_cls_name()}', the first one is '{raw_str}'",
+                raw_str=str(raw_str),
+                issues=issues,
+            )
+
+    def get_name(self, include_suffixes: bool = False) -> pl.Series:
+        names = self._series.str.extract(r"([^/]*)$", 1)
+        if not include_suffixes:
+            names = names.str.extract(r"^([^.]*)", 1)
+        return names.rename("name")
+
+    def get_suffixes(self) -> pl.Series:
+        """the suffixes as a list column, split the same way as 'AbsoluteFilePathStr.get_suffixes'"""
+        return self._series.str.split(".").list.slice(1).rename("suffixes")
+
+    def get_file_ext(self) -> pl.Series:
+        """the last suffix, null where the path has none"""
+        return self._series.str.extract(r"\.([^.]*)$", 1).rename("file_ext")
+
+    def get_parent(self) -> pl.Series:
+        """the parent directory path strs, ending with '/'"""
+        return self._series.str.replace(r"[^/]*$", "").rename("parent")
+
+    def relative_to(self, dir_path: _abs.AbsoluteDirPathStr) -> pl.Series:
+        """
+        the paths relative to the directory, starting with './', null for paths outside of it.
+        This is the inverse of 'from_rel_paths'.
+        """
+        prefix = str(dir_path)
+        return self._series.to_frame().select(
+            pl.when(pl.col("path").str.starts_with(prefix))
+            .then(pl.lit("./") + pl.col("path").str.slice(len(prefix)))
+            .alias("rel_path")
+        ).to_series()
+
+    def is_placeholder(self) -> pl.Series:
+        """the vectorized 'is_placeholder_file_path'"""
+        placeholder_name = _helpers.get_placeholder_rel_path().get_name(include_suffixes=True)
+        return (self.get_name(include_suffixes=True) == placeholder_name).rename("is_placeholder")
+
+    def is_manifest(self) -> pl.Series:
+        """the vectorized 'is_manifest_file_path'"""
+        manifest_name = _helpers.get_manifest_rel_path().get_name(include_suffixes=True)
+        return (self.get_name(include_suffixes=True) == manifest_name).rename("is_manifest")
+
+    def has_file_ext(self, choices: t.Iterable[str]) -> pl.Series:
+        """True where the file extension is one of the choices, with or without the leading '.'"""
+        valid_exts = [choice_i[1:] if choice_i.startswith(".") else choice_i for choice_i in choices]
+        return self.get_file_ext().is_in(valid_exts).fill_null(False).rename("has_file_ext")
+
+    def filter(self, mask: pl.Series) -> PathStrArray:
+        return PathStrArray(self._series.filter(mask), validate=False)
+
+    def drop_placeholders(self) -> PathStrArray:
+        return self.filter(~self.is_placeholder())
+
+    def filter_file_exts(self, choices: t.Iterable[str]) -> PathStrArray:
+        return self.filter(self.has_file_ext(choices))
+
+
+def _as_typed(raw_str: str) -> _abs.AbsoluteFilePathStr:
+    # the array was validated as a whole, so we skip validating each value again
+    return str.__new__(_abs.AbsoluteFilePathStr, raw_str)
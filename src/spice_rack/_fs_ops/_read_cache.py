@@ -0,0 +1,213 @@
+from __future__ import annotations
+import threading
+import typing as t
+from collections import OrderedDict
+from typing_extensions import TypeAlias
+import pydantic
+from fsspec import caching as fsspec_caching
+
+from spice_rack import _bases
+
+
+__all__ = (
+    "CacheTypeT",
+    "ReadCacheConfig",
+    "SharedBlockStore",
+    "SharedBlockCache",
+    "get_shared_block_store",
+    "configure_shared_block_cache",
+    "clear_shared_block_cache",
+)
+
+
+CacheTypeT: TypeAlias = t.Literal["none", "readahead", "bytes", "blockcache", "all", "shared"]
+"""
+how reads on an opened file are buffered. The first options are the fsspec cache types,
+'shared' uses the process-wide SharedBlockCache so blocks are reused across opens of the same object.
+"""
+
+
+class ReadCacheConfig(_bases.ValueModelBase):
+    """
+    controls how files opened for reading are buffered. Anything left as None falls back to
+    the next level, i.e. open kwargs -> file system instance fields -> file system class default
+    -> fsspec default.
+
+    Local files are read directly, so these only affect remote file systems.
+    """
+    block_size: t.Optional[int] = pydantic.Field(
+        description="the number of bytes requested from the file system at a time",
+        default=None,
+        gt=0,
+    )
+    cache_type: t.Optional[CacheTypeT] = pydantic.Field(
+        description="how we cache the bytes we read, see CacheTypeT",
+        default=None,
+    )
+    max_blocks: t.Optional[int] = pydantic.Field(
+        description="the max number of blocks held by a 'blockcache' cache",
+        default=None,
+        gt=0,
+    )
+
+    def merge(self, other: t.Optional[ReadCacheConfig]) -> ReadCacheConfig:
+        """return a new config, where values set on 'other' take precedence over the ones on this inst"""
+        if other is None:
+            return self
+        return ReadCacheConfig(
+            **{
+                **self.model_dump(exclude_none=True),
+                **other.model_dump(exclude_none=True)
+            }
+        )
+
+
+_BlockKeyT = t.Tuple[str, int, int]
+"""the object key, the block size, and the block number"""
+
+
+class SharedBlockStore:
+    """
+    thread-safe LRU store of file blocks, bounded by the total number of bytes held.
+    Blocks are keyed by an object key that includes the object version, so a modified object
+    never serves stale blocks, and by the block size, so opens with different block sizes never
+    read each other's blocks.
+    """
+    def __init__(self, max_bytes: int = 256 * 2 ** 20):
+        self._max_bytes = max_bytes
+        self._blocks: OrderedDict[_BlockKeyT, bytes] = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def num_bytes(self) -> int:
+        return self._num_bytes
+
+    def get(self, key: _BlockKeyT) -> t.Optional[bytes]:
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._blocks.move_to_end(key)
+            return block
+
+    def put(self, key: _BlockKeyT, block: bytes) -> None:
+        if len(block) > self._max_bytes:
+            return
+        with self._lock:
+            existing = self._blocks.pop(key, None)
+            if existing is not None:
+                self._num_bytes -= len(existing)
+            self._blocks[key] = block
+            self._num_bytes += len(block)
+            while self._num_bytes > self._max_bytes:
+                _, evicted = self._blocks.popitem(last=False)
+                self._num_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._blocks.clear()
+            self._num_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+
+_shared_block_store = SharedBlockStore()
+
+
+def get_shared_block_store() -> SharedBlockStore:
+    """the process-wide block store used by the 'shared' cache type"""
+    return _shared_block_store
+
+
+def configure_shared_block_cache(max_bytes: int) -> SharedBlockStore:
+    """replace the process-wide block store with an empty one holding at most 'max_bytes'"""
+    global _shared_block_store
+    _shared_block_store = SharedBlockStore(max_bytes=max_bytes)
+    return _shared_block_store
+
+
+def clear_shared_block_cache() -> None:
+    """drop every block held by the process-wide block store"""
+    _shared_block_store.clear()
+
+
+class SharedBlockCache(fsspec_caching.BaseCache):
+    """
+    fsspec cache implementation backed by the process-wide SharedBlockStore.
+
+    Reads are split into 'blocksize' blocks, and each run of consecutive missing blocks is
+    fetched with a single range request.
+    """
+    name: t.ClassVar[str] = "spice_rack_shared"
+
+    def __init__(
+            self,
+            blocksize: int,
+            fetcher: fsspec_caching.Fetcher,
+            size: int,
+            key: str,
+            store: t.Optional[SharedBlockStore] = None,
+    ):
+        super().__init__(blocksize, fetcher, size)
+        self._key = key
+        self._store = store if store is not None else get_shared_block_store()
+
+    def _fetch(self, start: t.Optional[int], stop: t.Optional[int]) -> bytes:
+        if start is None:
+            start = 0
+        if stop is None:
+            stop = self.size
+        stop = min(stop, self.size)
+        if start >= self.size or start >= stop:
+            return b""
+
+        first_block = start // self.blocksize
+        last_block = (stop - 1) // self.blocksize
+
+        blocks: t.Dict[int, bytes] = {}
+        missing: t.List[int] = []
+        for block_number in range(first_block, last_block + 1):
+            block = self._store.get((self._key, self.blocksize, block_number))
+            if block is None:
+                missing.append(block_number)
+            else:
+                blocks[block_number] = block
+
+        for run in _iter_consecutive_runs(missing):
+            run_start = run[0] * self.blocksize
+            run_stop = min((run[-1] + 1) * self.blocksize, self.size)
+            data = self.fetcher(run_start, run_stop)
+            for i, block_number in enumerate(run):
+                block = data[i * self.blocksize:(i + 1) * self.blocksize]
+                self._store.put((self._key, self.blocksize, block_number), block)
+                blocks[block_number] = block
+
+        joined = b"".join(blocks[block_number] for block_number in range(first_block, last_block + 1))
+        offset = first_block * self.blocksize
+        return joined[start - offset:stop - offset]
+
+
+def _iter_consecutive_runs(block_numbers: t.List[int]) -> t.Iterator[t.List[int]]:
+    run: t.List[int] = []
+    for block_number in block_numbers:
+        if run and block_number != run[-1] + 1:
+            yield run
+            run = []
+        run.append(block_number)
+    if run:
+        yield run
+
+
+fsspec_caching.register_cache(SharedBlockCache, clobber=True)
@@ -0,0 +1,279 @@
+from __future__ import annotations
+import random
+import threading
+import time
+import typing as t
+from collections import deque
+from concurrent import futures
+import pydantic
+
+from spice_rack import _bases
+
+
+__all__ = (
+    "RetryPolicy",
+    "LatencyTracker",
+    "get_latency_tracker",
+    "call_with_retries",
+    "hedged_call",
+)
+
+
+_T = t.TypeVar("_T")
+
+
+class RetryPolicy(_bases.ValueModelBase):
+    """
+    controls how file system operations are retried, timed out and hedged. Anything left as None
+    falls back to the next level, i.e. file system instance fields -> file system class default.
+    """
+    max_attempts: t.Optional[int] = pydantic.Field(
+        description="the max number of times we attempt an operation, 1 means no retries",
+        default=None,
+        ge=1
+    )
+    backoff_base: t.Optional[float] = pydantic.Field(
+        description="the backoff before the first retry in seconds, doubled on every following retry",
+        default=None,
+        ge=0
+    )
+    backoff_max: t.Optional[float] = pydantic.Field(
+        description="the max backoff between two attempts in seconds",
+        default=None,
+        ge=0
+    )
+    timeout: t.Optional[float] = pydantic.Field(
+        description="the max number of seconds we wait for a single attempt of an operation. "
+                    "A timed out attempt counts as a transient error.",
+        default=None,
+        gt=0
+    )
+    hedge_reads: t.Optional[bool] = pydantic.Field(
+        description="if True, when a read takes longer than the 'hedge_quantile' latency of recent reads, "
+                    "we send a duplicate read and take whichever finishes first",
+        default=None
+    )
+    hedge_quantile: t.Optional[float] = pydantic.Field(
+        description="the quantile of recent read latencies we wait for before hedging",
+        default=None,
+        gt=0,
+        lt=1
+    )
+    hedge_min_delay: t.Optional[float] = pydantic.Field(
+        description="we never hedge a read sooner than this many seconds",
+        default=None,
+        ge=0
+    )
+    hedge_min_samples: t.Optional[int] = pydantic.Field(
+        description="the number of read latencies we record before we start hedging",
+        default=None,
+        ge=1
+    )
+
+    def merge(self, other: t.Optional[RetryPolicy]) -> RetryPolicy:
+        """return a new policy, where values set on 'other' take precedence over the ones on this inst"""
+        if other is None:
+            return self
+        return RetryPolicy(
+            **{
+                **self.model_dump(exclude_none=True),
+                **other.model_dump(exclude_none=True)
+            }
+        )
+
+    def with_defaults(self) -> RetryPolicy:
+        """fill in the values left unset with the defaults"""
+        if all(getattr(self, field_name) is not None for field_name in _DEFAULT_POLICY.model_fields_set):
+            return self
+        return _DEFAULT_POLICY.merge(self)
+
+    def get_backoff(self, attempt: int) -> float:
+        """the jittered backoff in seconds after the 'attempt'-th failed attempt, starting at 1"""
+        ceiling = min(
+            self.backoff_max if self.backoff_max is not None else 30.0,
+            (self.backoff_base if self.backoff_base is not None else 0.1) * 2 ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+
+_DEFAULT_POLICY = RetryPolicy(
+    max_attempts=1,
+    backoff_base=0.1,
+    backoff_max=30.0,
+    hedge_reads=False,
+    hedge_quantile=0.95,
+    hedge_min_delay=0.05,
+    hedge_min_samples=20,
+)
+"""the values we use for anything left unset"""
+
+
+class LatencyTracker:
+    """thread-safe record of the most recent latencies of an operation"""
+    def __init__(self, max_samples: int = 512):
+        self._samples: t.Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> t.Optional[float]:
+        """the q-quantile of the recorded latencies, None if nothing was recorded yet"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+_latency_trackers: t.Dict[t.Tuple[str, str], LatencyTracker] = {}
+_latency_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(namespace: str, op_name: str) -> LatencyTracker:
+    """the process-wide latency tracker of the operation against the storage the namespace identifies"""
+    key = (namespace, op_name)
+    with _latency_trackers_lock:
+        tracker = _latency_trackers.get(key)
+        if tracker is None:
+            tracker = LatencyTracker()
+            _latency_trackers[key] = tracker
+        return tracker
+
+
+_ExecutorKindT = t.Literal["timeout", "hedge"]
+
+_executors: t.Dict[_ExecutorKindT, futures.ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(kind: _ExecutorKindT) -> futures.ThreadPoolExecutor:
+    """
+    lazily built pools we run attempts on when they need a timeout or a hedge. The timed out
+    attempts and the hedge legs get separate pools, and neither blocks on work queued on its own
+    pool, so a saturated pool can't deadlock waiting on itself.
+    """
+    with _executors_lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            executor = futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix=f"spice_rack_fs_ops_{kind}")
+            _executors[kind] = executor
+        return executor
+
+
+def _call_with_timeout(func: t.Callable[[], _T], timeout: t.Optional[float]) -> _T:
+    if timeout is None:
+        return func()
+
+    # the attempt can't be interrupted, it keeps running in the background after we give up on it
+    future = _get_executor("timeout").submit(func)
+    try:
+        return future.result(timeout=timeout)
+    except futures.TimeoutError as e:
+        raise TimeoutError(f"operation did not finish within {timeout} seconds") from e
+
+
+def hedged_call(func: t.Callable[[], _T], delay: float, timeout: t.Optional[float] = None) -> _T:
+    """
+    call the function, and if it didn't finish after 'delay' seconds, call it a second time and
+    return the result of whichever succeeds first. Only use this for idempotent operations.
+
+    Args:
+        func: the operation, called without arguments
+        delay: the seconds we wait for the first call before we send the second
+        timeout: the max seconds we wait for either call, if not specified we wait indefinitely
+
+    Raises:
+        TimeoutError: if neither call finished within the timeout
+        Exception: the first attempt's exception, if both attempts fail
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def _get_remaining(wait_seconds: t.Optional[float] = None) -> t.Optional[float]:
+        if deadline is None:
+            return wait_seconds
+        remaining = max(0.0, deadline - time.monotonic())
+        return remaining if wait_seconds is None else min(wait_seconds, remaining)
+
+    executor = _get_executor("hedge")
+    pending = {executor.submit(func)}
+    done, pending = futures.wait(pending, timeout=_get_remaining(delay))
+    if not done:
+        pending.add(executor.submit(func))
+
+    first_exception: t.Optional[BaseException] = None
+    while True:
+        for future_i in done:
+            exception_i = future_i.exception()
+            if exception_i is None:
+                return future_i.result()
+            if first_exception is None:
+                first_exception = exception_i
+        if not pending:
+            raise first_exception
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"operation did not finish within {timeout} seconds")
+        done, pending = futures.wait(pending, timeout=_get_remaining(), return_when=futures.FIRST_COMPLETED)
+
+
+def call_with_retries(
+        func: t.Callable[[], _T],
+        policy: RetryPolicy,
+        is_transient: t.Callable[[BaseException], bool],
+        latency_tracker: t.Optional[LatencyTracker] = None,
+        hedge: bool = False,
+) -> _T:
+    """
+    call the function, retrying with jittered exponential backoff when it raises a transient error.
+
+    Args:
+        func: the operation, called without arguments
+        policy: the retry policy, values left unset fall back to the defaults
+        is_transient: returns True if the exception is worth retrying
+        latency_tracker: if specified, we record the latency of successful attempts here
+        hedge: if True and the policy allows it, we hedge each attempt after the tracked latency quantile
+
+    Returns:
+        the result of the first successful attempt
+
+    Raises:
+        Exception: the last exception if every attempt failed, or the first non-transient exception
+    """
+    start = time.perf_counter()
+    policy = policy.with_defaults()
+    if policy.max_attempts == 1 and policy.timeout is None and not (hedge and policy.hedge_reads):
+        res = func()
+        if latency_tracker is not None:
+            latency_tracker.record(time.perf_counter() - start)
+        return res
+
+    hedge_delay: t.Optional[float] = None
+    if hedge and policy.hedge_reads and latency_tracker is not None:
+        if len(latency_tracker) >= policy.hedge_min_samples:
+            hedge_delay = max(policy.hedge_min_delay, latency_tracker.quantile(policy.hedge_quantile))
+
+    def _attempt() -> _T:
+        # the hedge bounds its own waits, so it doesn't take a thread of the timeout pool as well
+        if hedge_delay is not None:
+            return hedged_call(func, hedge_delay, timeout=policy.timeout)
+        return _call_with_timeout(func, policy.timeout)
+
+    attempt = 1
+    while True:
+        try:
+            res = _attempt()
+        except Exception as e:
+            if attempt >= policy.max_attempts or not is_transient(e):
+                raise e
+            time.sleep(policy.get_backoff(attempt))
+            attempt += 1
+            start = time.perf_counter()
+            continue
+
+        if latency_tracker is not None:
+            latency_tracker.record(time.perf_counter() - start)
+        return res
@@ -1,2 +1,6 @@
 from spice_rack._polars_service._services._joiner import *
 from spice_rack._polars_service._services._json_dumper import *
+from spice_rack._polars_service._services._misc import *
+from spice_rack._polars_service._services._models import *
+from spice_rack._polars_service._services._partitions import *
+from spice_rack._polars_service._services._cache import *
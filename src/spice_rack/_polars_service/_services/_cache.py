@@ -0,0 +1,182 @@
+from __future__ import annotations
+import datetime as dt
+import hashlib
+import json
+import typing as t
+import polars as pl
+
+from spice_rack import _guid_service
+
+if t.TYPE_CHECKING:
+    from spice_rack._fs_ops import DirPath, file_systems
+
+
+__all__ = (
+    "get_plan_key",
+    "cache_lazy",
+    "evict_cache",
+)
+
+
+_CACHE_FILE_EXT = "parquet"
+_TEMP_FILE_EXT = "tmp"
+
+
+def _iter_scan_paths(plan: t.Any) -> t.Iterator[str]:
+    """the paths of every file the serialized plan scans"""
+    if isinstance(plan, dict):
+        scan = plan.get("Scan")
+        if isinstance(scan, dict):
+            yield from scan.get("paths", [])
+        for val_i in plan.values():
+            yield from _iter_scan_paths(val_i)
+    elif isinstance(plan, list):
+        for val_i in plan:
+            yield from _iter_scan_paths(val_i)
+
+
+def _get_input_fingerprint(
+        raw_path: str,
+        file_system: t.Optional[file_systems.AbstractFileSystem],
+) -> t.Dict[str, t.Any]:
+    from spice_rack._fs_ops import _file_systems, _path_strs
+
+    if file_system is None:
+        file_system = _file_systems.infer_file_system(raw_path)
+    file_stat = file_system.get_file_stat(
+        _path_strs.AbsoluteFilePathStr(file_system.clean_raw_path_str(raw_path))
+    )
+    return {
+        "path": raw_path,
+        "size": file_stat.size,
+        "mtime": file_stat.mtime.isoformat() if file_stat.mtime else None,
+        "hash": file_stat.hash,
+    }
+
+
+def get_plan_key(
+        lazy_df: pl.LazyFrame,
+        file_system: t.Optional[file_systems.AbstractFileSystem] = None,
+) -> str:
+    """
+    the key of the LazyFrame's result, a hash of the serialized logical plan and the size, modified
+    time and hash of every file it scans, so a rewritten input file is a new key. In-memory
+    DataFrames are part of the serialized plan.
+
+    Args:
+        lazy_df: the plan
+        file_system: the file system we stat the scanned files on, if not specified, inferred from
+            each path, e.g. the default credentials for gs:// paths
+
+    Raises:
+        ValueError: if polars can't serialize the plan
+    """
+    try:
+        raw_plan = lazy_df.serialize()
+    except (pl.PolarsError, TypeError, ValueError) as e:
+        raise ValueError(f"the plan can't be serialized, so it can't be cached: {e}") from e
+
+    fingerprints = [
+        _get_input_fingerprint(path_i, file_system) for path_i in _iter_scan_paths(json.loads(raw_plan))
+    ]
+    hasher = hashlib.sha256(raw_plan.encode())
+    hasher.update(json.dumps(fingerprints, sort_keys=True).encode())
+    return hasher.hexdigest()[:32]
+
+
+def _is_expired(mtime: t.Optional[dt.datetime], ttl: t.Optional[dt.timedelta]) -> bool:
+    if ttl is None or mtime is None:
+        return False
+    return dt.datetime.now(tz=dt.timezone.utc) - mtime > ttl
+
+
+def evict_cache(
+        store: DirPath,
+        ttl: t.Optional[dt.timedelta] = None,
+        max_bytes: t.Optional[int] = None,
+) -> int:
+    """
+    delete the cached results older than the ttl, then the oldest ones until the store is within
+    'max_bytes'. A single listing of the store, and a delete per evicted entry.
+
+    Args:
+        store: the directory 'cache_lazy' writes to
+        ttl: the max age of an entry
+        max_bytes: the max total size of the entries
+
+    Returns:
+        the number of entries deleted
+    """
+    if not store.exists():
+        return 0
+    entries = sorted(
+        (
+            file_stat_i for file_stat_i in store.file_system.iter_file_stats(store.path, recursive=False)
+            if file_stat_i.path.get_file_ext() == _CACHE_FILE_EXT
+        ),
+        key=lambda file_stat_i: file_stat_i.mtime or dt.datetime.min.replace(tzinfo=dt.timezone.utc),
+    )
+    total_bytes = sum(file_stat_i.size or 0 for file_stat_i in entries)
+    num_deleted = 0
+    for file_stat_i in entries:
+        over_size = max_bytes is not None and total_bytes > max_bytes
+        if not over_size and not _is_expired(file_stat_i.mtime, ttl):
+            continue
+        store.file_system.delete_file(file_stat_i.path, if_non_existent="return")
+        total_bytes -= file_stat_i.size or 0
+        num_deleted += 1
+    return num_deleted
+
+
+def cache_lazy(
+        lazy_df: pl.LazyFrame,
+        store: DirPath,
+        ttl: t.Optional[dt.timedelta] = None,
+        max_bytes: t.Optional[int] = None,
+        file_system: t.Optional[file_systems.AbstractFileSystem] = None,
+) -> pl.LazyFrame:
+    """
+    memoize the result of the LazyFrame as a parquet file in the store, keyed by 'get_plan_key'. On
+    a hit we scan the stored result rather than running the plan again, on a miss we collect it,
+    store it, and evict from the store.
+
+    The store can be on any file system, we scan it natively where polars can, see
+    'FilePath.scan_parquet'. The result is written under a temporary name and moved into place, so
+    concurrent readers never scan a partly written entry.
+
+    Args:
+        lazy_df: the plan to memoize
+        store: the directory to keep the results in, created if it doesn't exist
+        ttl: entries older than this are recomputed, and evicted
+        max_bytes: the oldest entries are evicted until the store is within this size
+        file_system: the file system the plan's input files are on, see 'get_plan_key'
+
+    Returns:
+        a LazyFrame of the result
+
+    Raises:
+        ValueError: if polars can't serialize the plan, e.g. it reads from a python object
+    """
+    from spice_rack._fs_ops import _path_strs
+
+    key = get_plan_key(lazy_df, file_system=file_system)
+    file_path = store.joinpath(_path_strs.RelFilePathStr(f"{key}.{_CACHE_FILE_EXT}"))
+    if file_path.exists():
+        file_stat = file_path.file_system.get_file_stat(file_path.path)
+        if not _is_expired(file_stat.mtime, ttl):
+            return file_path.scan_parquet()
+
+    store.make_self(if_exists="return")
+    df = lazy_df.collect()
+    temp_file_path = store.joinpath(
+        _path_strs.RelFilePathStr(f"{key}.{_guid_service.gen_str_guid()}.{_TEMP_FILE_EXT}")
+    )
+    try:
+        temp_file_path.write_parquet(df)
+        store.file_system.move_file(temp_file_path.path, file_path.path)
+    except BaseException as e:
+        store.file_system.delete_file(temp_file_path.path, if_non_existent="return")
+        raise e
+    if ttl is not None or max_bytes is not None:
+        evict_cache(store, ttl=ttl, max_bytes=max_bytes)
+    return df.lazy()
@@ -7,64 +7,179 @@ if t.TYPE_CHECKING:
 
 __all__ = (
     "HowJoinT",
+    "AsofStrategyT",
     "join_dfs",
+    "StackHowT",
     "stack_dfs",
-
 )
 
-HowJoinT = t.Literal["inner", "outer", "left"]
+HowJoinT = t.Literal["inner", "outer", "outer_coalesce", "left", "semi", "anti", "cross", "asof"]
+AsofStrategyT = t.Literal["backward", "forward", "nearest"]
 
 
 def join_dfs(
         dfs: t.Iterable[_types.PolarsMaybeLazyDfT],
-        join_on: str,
-        how: HowJoinT = "inner"
+        join_on: t.Union[str, t.Sequence[str], None] = None,
+        how: HowJoinT = "inner",
+        *,
+        left_on: t.Union[str, t.Sequence[str], None] = None,
+        right_on: t.Union[str, t.Sequence[str], None] = None,
+        suffix: t.Union[str, t.Sequence[str]] = "_right",
+        asof_by: t.Union[str, t.Sequence[str], None] = None,
+        asof_strategy: AsofStrategyT = "backward",
+        asof_tolerance: t.Union[str, int, float, None] = None,
 ) -> _types.PolarsLazyDfT:
     """
-    join an iterable of polars DataFrame or LazyFrame objects into a single LazyFrame
+    join an iterable of polars DataFrame or LazyFrame objects into a single LazyFrame, left to right.
+    Nothing is collected, so polars can push predicates and projections down into each input. Collect
+    the result with 'streaming=True' for inputs that don't fit in memory, or with 'collect_all'
+    alongside other plans.
 
     Args:
         dfs: iterable of polars objects
-        join_on: the column we are joining on, all dataframes must have this column
-        how: the type of join, 'inner', 'outer', 'left',
-            if 'left' the first dataframe in the iterable is the 'left' one
+        join_on: the column or columns we are joining on, all dataframes must have them.
+            Not used for 'cross' joins, exactly one column for 'asof' joins
+        how: the type of join, e.g. 'inner', 'outer', 'left', 'cross', 'asof'
+            if 'left' the first dataframe in the iterable is the 'left' one,
+            if 'asof' every dataframe must be sorted by the key
+        left_on: instead of 'join_on', the column or columns of the joined result so far
+        right_on: instead of 'join_on', the column or columns of each dataframe we join onto it
+        suffix: appended to the clashing column names of the right dataframe. Either one suffix
+            for every join, or one suffix per dataframe after the first
+        asof_by: for 'asof' joins, also join exactly on these columns before the asof search
+        asof_strategy: for 'asof' joins, which direction we search for the nearest key
+        asof_tolerance: for 'asof' joins, the max distance to the nearest key, e.g. '1h' or 10
 
     Returns:
         pl.LazyFrame: the joined polars LazyFrame
+
+    Raises:
+        ValueError: if the keys or suffixes don't fit the type of join
     """
-    merged_df: t.Optional[pl.DataFrame] = None
-    for df in dfs:
+    lazy_dfs = [df_i.lazy() for df_i in dfs]
+    if len(lazy_dfs) == 0:
+        raise ValueError("empty iterable passed in")
+
+    if how == "cross":
+        if join_on is not None or left_on is not None or right_on is not None:
+            raise ValueError("a cross join doesn't take join keys")
+    elif join_on is None and (left_on is None or right_on is None):
+        raise ValueError(f"a '{how}' join needs either 'join_on' or both 'left_on' and 'right_on'")
+    elif join_on is not None and (left_on is not None or right_on is not None):
+        raise ValueError("specify either 'join_on' or 'left_on' and 'right_on', not both")
+
+    if how == "asof":
+        join_on, left_on, right_on = (_get_asof_key(key_i) for key_i in (join_on, left_on, right_on))
+
+    if isinstance(suffix, str):
+        suffixes = [suffix] * (len(lazy_dfs) - 1)
+    else:
+        suffixes = list(suffix)
+        if len(suffixes) != len(lazy_dfs) - 1:
+            raise ValueError(
+                f"expected a suffix for each of the {len(lazy_dfs) - 1} dataframes after the first, "
+                f"got {len(suffixes)}"
+            )
+
+    merged_df = lazy_dfs[0]
+    for df_i, suffix_i in zip(lazy_dfs[1:], suffixes):
+        if how == "cross":
+            merged_df = merged_df.join(other=df_i, how="cross", suffix=suffix_i)
+        elif how == "asof":
+            merged_df = merged_df.join_asof(
+                other=df_i,
+                on=join_on,
+                left_on=left_on,
+                right_on=right_on,
+                by=asof_by,
+                strategy=asof_strategy,
+                tolerance=asof_tolerance,
+                suffix=suffix_i,
+            )
+        else:
+            merged_df = merged_df.join(
+                other=df_i, on=join_on, left_on=left_on, right_on=right_on, how=how, suffix=suffix_i
+            )
 
-        if isinstance(df, pl.DataFrame):
-            df = df.lazy()
-        if isinstance(df, pl.LazyFrame):
-            df = df.collect()
+    return merged_df
 
-        if merged_df is None:
-            merged_df = df
-        else:
-            merged_df = merged_df.join(other=df, on=join_on, how=how)
 
-    return merged_df.lazy()
+def _get_asof_key(key: t.Union[str, t.Sequence[str], None]) -> t.Optional[str]:
+    """polars searches on a single key, the exact matches go in 'asof_by'"""
+    if key is None or isinstance(key, str):
+        return key
+    keys = list(key)
+    if len(keys) != 1:
+        raise ValueError(f"an 'asof' join takes exactly one key, use 'asof_by' for the others, got {keys}")
+    return keys[0]
+
+
+StackHowT = t.Literal["strict", "diagonal", "supertype", "diagonal_supertype"]
+
+_CONCAT_HOWS: t.Dict[StackHowT, str] = {
+    "strict": "vertical",
+    "diagonal": "diagonal",
+    "supertype": "vertical_relaxed",
+    "diagonal_supertype": "diagonal_relaxed",
+}
 
 
 def stack_dfs(
-        dfs: t.List[_types.PolarsMaybeLazyDfT],
+        dfs: t.Iterable[_types.PolarsMaybeLazyDfT],
+        how: StackHowT = "strict",
+        *,
+        source_col: t.Optional[str] = None,
+        source_tags: t.Optional[t.Sequence[t.Any]] = None,
+        rechunk: bool = False,
 ) -> _types.PolarsLazyDfT:
     """
     vertically stack an iterable of polars DataFrame or LazyFrame objects into a single LazyFrame.
     This is a vertical stack.
 
+    Only 'strict' reads the schema of every input, the other modes leave resolving the schemas to
+    polars, once, when the result is collected. If every input is a DataFrame we concatenate them
+    right away, without rechunking that only references the existing chunks.
+
     Args:
         dfs: iterable of polars objects
+        how: how we reconcile the schemas of the inputs,
+            'strict': the column sets must match, every input is cast to the dtypes of the first one
+            'diagonal': missing columns are filled with null, the dtypes must match
+            'supertype': the columns must match, in the same order, each column is promoted to the supertype
+                of its dtypes
+            'diagonal_supertype': 'diagonal' and 'supertype' combined
+        source_col: if specified, we add a column of this name that tags each row with the input it
+            came from
+        source_tags: the tag of each input, if not specified we use the position of the input
+        rechunk: if True, the result is copied into contiguous memory
 
     Returns:
         pl.LazyFrame: the stacked polars LazyFrame
-    """
 
+    Raises:
+        ValueError: if there are no inputs, the tags don't match the inputs, or the column sets don't
+            match in 'strict' mode
+    """
+    dfs = list(dfs)
     if len(dfs) == 0:
         raise ValueError("empty list passed in")
 
+    if source_col is not None:
+        source_tags = list(range(len(dfs))) if source_tags is None else list(source_tags)
+        if len(source_tags) != len(dfs):
+            raise ValueError(f"got {len(source_tags)} source tags for {len(dfs)} dfs")
+        dfs = [df_i.with_columns(pl.lit(tag_i).alias(source_col)) for df_i, tag_i in zip(dfs, source_tags)]
+
+    if how == "strict":
+        dfs = _cast_to_first(dfs)
+
+    if all(isinstance(df_i, pl.DataFrame) for df_i in dfs):
+        return pl.concat(items=dfs, how=_CONCAT_HOWS[how], rechunk=rechunk).lazy()
+    return pl.concat(items=[df_i.lazy() for df_i in dfs], how=_CONCAT_HOWS[how], rechunk=rechunk)
+
+
+def _cast_to_first(dfs: t.List[_types.PolarsMaybeLazyDfT]) -> t.List[_types.PolarsMaybeLazyDfT]:
+    """check the column sets match, and select the columns of each input in the same order and dtype"""
     col_sets = {}
     for i, df_i in enumerate(dfs):
         col_sets[i] = list(df_i.columns)
@@ -87,7 +202,4 @@ def stack_dfs(
         expr = pl.col(col).cast(dtype)
         sorted_col_exprs.append(expr)
 
-    dfs_to_stack = [
-        df_i.lazy().select(sorted_col_exprs) for df_i in dfs
-    ]
-    return pl.concat(items=dfs_to_stack, how="vertical", ).lazy()
+    return [df_i.select(sorted_col_exprs) for df_i in dfs]
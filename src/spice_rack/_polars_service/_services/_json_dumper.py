@@ -1,8 +1,11 @@
 from __future__ import annotations
 import json
+import os
 import typing as t
 import polars as pl
 
+from spice_rack._bases import _raw_json
+
 if t.TYPE_CHECKING:
     from spice_rack._polars_service import _types
 
@@ -11,7 +14,9 @@ __all__ = (
     "get_json_safe_row_dicts",
     "get_json_safe_column_dict",
     "get_json_safe_row_dicts_lazy_peek",
-    "get_json_safe_column_dict_lazy_peek"
+    "get_json_safe_column_dict_lazy_peek",
+    "serialize_df_json",
+    "write_ndjson",
 )
 
 
@@ -93,3 +98,88 @@ def get_json_safe_column_dict_lazy_peek(
     """
     sample_df = lazy_df.fetch(n_rows=num_rows)
     return get_json_safe_column_dict(sample_df)
+
+
+def serialize_df_json(
+        df: pl.DataFrame
+) -> t.Union[str, _types.RowDictsT]:
+    """
+    the json serializer of PolarsDfT. When dumping to a json string, e.g. 'model_dump_json' on our
+    bases, we embed the json polars writes directly, otherwise, e.g. 'model_dump(mode="json")', we
+    return the json-encodeable row dicts.
+
+    Args:
+        df: DataFrame instance
+
+    Returns:
+        the placeholder of the embedded json, or a list of dicts
+    """
+    if _raw_json.raw_json_enabled():
+        return _raw_json.embed_raw_json(df.write_json(file=None, row_oriented=True))
+    return get_json_safe_row_dicts(df)
+
+
+_COUNT_CHUNK_SIZE = 8 * 2 ** 20
+
+
+def _count_lines(path: t.Union[str, os.PathLike]) -> int:
+    num_lines = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COUNT_CHUNK_SIZE), b""):
+            num_lines += chunk.count(b"\n")
+    return num_lines
+
+
+def _write_ndjson_lazy_slices(lazy_df: pl.LazyFrame, file: t.BinaryIO, batch_size: int) -> int:
+    num_rows = 0
+    while True:
+        batch_df = lazy_df.slice(num_rows, batch_size).collect(streaming=True)
+        if batch_df.height:
+            batch_df.write_ndjson(file)
+        num_rows += batch_df.height
+        if batch_df.height < batch_size:
+            return num_rows
+
+
+def write_ndjson(
+        df: _types.PolarsMaybeLazyDfT,
+        file: t.Union[str, os.PathLike, t.BinaryIO],
+        batch_size: int = 100_000,
+) -> int:
+    """
+    write the polars LazyFrame or DataFrame as newline-delimited json, one row per line, without
+    holding the encoded json of a large frame in memory at once.
+
+    A LazyFrame written to a local path is sunk by the streaming engine, so it is never collected.
+    Plans the streaming engine can't sink, and LazyFrames written to a file object, are collected
+    'batch_size' rows at a time, each batch is a slice of the plan, so the plan runs once per batch
+    and needs a deterministic row order, e.g. a sort. A DataFrame is encoded 'batch_size' rows at a time.
+
+    Args:
+        df: LazyFrame or DataFrame instance
+        file: a local path, or a binary file object, e.g. from 'FilePath.open("wb")'
+        batch_size: the number of rows we collect and encode at once
+
+    Returns:
+        the number of rows written
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    if isinstance(file, (str, os.PathLike)):
+        if isinstance(df, pl.LazyFrame):
+            try:
+                df.sink_ndjson(file)
+                return _count_lines(file)
+            except pl.InvalidOperationError:
+                # not every plan is supported by the streaming engine
+                pass
+        with open(file, "wb") as f:
+            return write_ndjson(df, f, batch_size=batch_size)
+
+    if isinstance(df, pl.LazyFrame):
+        return _write_ndjson_lazy_slices(df, file, batch_size)
+
+    for batch_df in df.iter_slices(n_rows=batch_size):
+        batch_df.write_ndjson(file)
+    return df.height
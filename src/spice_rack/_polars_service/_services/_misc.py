@@ -0,0 +1,35 @@
+from __future__ import annotations
+import typing as t
+import polars as pl
+
+if t.TYPE_CHECKING:
+    from spice_rack._polars_service import _types
+
+
+__all__ = (
+    "collect_all",
+)
+
+
+def collect_all(
+        dfs: t.Iterable[_types.PolarsMaybeLazyDfT],
+        streaming: bool = False,
+) -> t.List[_types.PolarsDfT]:
+    """
+    collect several independent LazyFrame objects at once. polars runs the plans in parallel, and
+    inputs the plans share are only computed once. DataFrame objects are passed through.
+
+    Args:
+        dfs: iterable of polars objects
+        streaming: if True, we run the plans with the streaming engine, so inputs that don't fit
+            in memory are processed in batches
+
+    Returns:
+        the collected DataFrames, in the same order
+    """
+    dfs = list(dfs)
+    lazy_ixs = [ix for ix, df_i in enumerate(dfs) if isinstance(df_i, pl.LazyFrame)]
+    collected_dfs = pl.collect_all([dfs[ix] for ix in lazy_ixs], streaming=streaming)
+    for ix, collected_df_i in zip(lazy_ixs, collected_dfs):
+        dfs[ix] = collected_df_i
+    return dfs
@@ -0,0 +1,182 @@
+from __future__ import annotations
+import dataclasses
+import enum
+import functools
+import operator
+import typing as t
+import uuid
+import pydantic
+import polars as pl
+
+from spice_rack import _bases, _ts_service
+from spice_rack._polars_service._types import _schema_df
+
+
+__all__ = (
+    "models_to_df",
+    "df_to_models",
+)
+
+
+_ModelTV = t.TypeVar("_ModelTV", bound=pydantic.BaseModel)
+
+
+@dataclasses.dataclass(frozen=True)
+class _FieldConverter:
+    """how the values of a single field become a column and back"""
+    name: str
+    key: str
+    annotation: t.Any
+    kind: t.Literal["plain", "enum", "timestamp", "guid", "special_str"]
+    dtype: t.Optional[pl.PolarsDataType]
+
+    def to_series(self, values: t.List[t.Any]) -> pl.Series:
+        if self.kind == "timestamp":
+            # a column has a single tz, mixed timezones are kept as the same instants in utc
+            tzs = {str(val_i.tz) for val_i in values if val_i is not None}
+            tz = tzs.pop() if len(tzs) == 1 else "UTC"
+            microseconds = [None if val_i is None else val_i.microseconds for val_i in values]
+            utc_series = pl.Series(self.name, microseconds, dtype=pl.Int64).cast(pl.Datetime("us", "UTC"))
+            return utc_series.dt.convert_time_zone(tz)
+        elif self.kind == "guid":
+            values = [None if val_i is None else str(val_i) for val_i in values]
+        elif self.kind == "enum":
+            values = [None if val_i is None else val_i.value for val_i in values]
+        elif self.kind == "special_str":
+            return pl.Series(self.name, values, dtype=pl.Utf8).cast(pl.Categorical)
+
+        if self.dtype is None:
+            return pl.Series(self.name, values)
+        series = _schema_df._build_epoch_series(self.name, self.dtype, values)
+        if series is not None:
+            return series
+        return pl.Series(self.name, values, dtype=self.dtype)
+
+    def to_values(self, series: pl.Series, trusted: bool) -> t.List[t.Any]:
+        """the python values of the column, already the field types if trusted"""
+        if self.kind == "timestamp":
+            tz = series.dtype.time_zone or "UTC"  # type: ignore[union-attr]
+            microseconds = series.dt.epoch("us").to_list()
+            if not trusted:
+                return [None if val_i is None else {"microseconds": val_i, "tz": tz} for val_i in microseconds]
+            tz_key = str.__new__(_ts_service.TimeZoneKey, tz)
+            construct = _ts_service.Timestamp.model_construct
+            return [None if val_i is None else construct(microseconds=val_i, tz=tz_key) for val_i in microseconds]
+
+        values = series.cast(pl.Utf8).to_list() if series.dtype == pl.Categorical else series.to_list()
+        if not trusted or self.kind == "plain":
+            return values
+        elif self.kind == "guid":
+            return [None if val_i is None else uuid.UUID(val_i) for val_i in values]
+        elif self.kind == "enum":
+            enum_cls = self.annotation
+            return [None if val_i is None else enum_cls(val_i) for val_i in values]
+        else:
+            # the values came from the typed strs, so we skip validating each one again
+            str_cls = self.annotation
+            return [None if val_i is None else str.__new__(str_cls, val_i) for val_i in values]
+
+
+def _build_converter(name: str, field: pydantic.fields.FieldInfo) -> _FieldConverter:
+    annotation, _ = _schema_df._unwrap_optional(field.annotation)
+    if t.get_origin(annotation) is t.Annotated:
+        annotation = t.get_args(annotation)[0]
+    key = field.alias or name
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, _ts_service.Timestamp):
+            return _FieldConverter(name, key, annotation, "timestamp", None)
+        elif issubclass(annotation, uuid.UUID):
+            return _FieldConverter(name, key, annotation, "guid", pl.Utf8)
+        elif issubclass(annotation, _bases.special_str.SpecialStrBase):
+            return _FieldConverter(name, key, annotation, "special_str", pl.Categorical)
+        elif issubclass(annotation, enum.Enum):
+            dtype = _schema_df._get_literal_dtype([member_i.value for member_i in annotation])
+            return _FieldConverter(name, key, annotation, "enum", dtype)
+
+    try:
+        dtype, _, _ = _schema_df._get_dtype(annotation, [])
+    except TypeError:
+        # polars infers the dtype from the values
+        dtype = None
+    return _FieldConverter(name, key, annotation, "plain", dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_converters(model_cls: t.Type[pydantic.BaseModel]) -> t.Tuple[_FieldConverter, ...]:
+    return tuple(_build_converter(name, field_i) for name, field_i in model_cls.model_fields.items())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_list_adapter(model_cls: t.Type[pydantic.BaseModel]) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(t.List[model_cls])  # type: ignore[valid-type]
+
+
+def models_to_df(
+        models: t.Sequence[pydantic.BaseModel],
+        model_cls: t.Optional[t.Type[pydantic.BaseModel]] = None,
+) -> pl.DataFrame:
+    """
+    build a DataFrame with a column per field, reading the attributes a field at a time rather than
+    dumping each model. The dtypes come from the field annotations:
+
+    * Timestamp fields become microsecond Datetime columns with the tz, mixed timezones become utc
+    * datetime fields become naive Datetime columns, or utc ones when the values are aware
+    * GuidT fields become str columns, SpecialStrBase subclasses become categorical columns
+    * enums become their values, the other types map as in PolarsDfSchema. Types it doesn't
+        support, e.g. nested models, are inferred by polars from the values.
+
+    Args:
+        models: the model instances, all of the model class
+        model_cls: the class of the models, if not specified, the class of the first model
+
+    Returns:
+        the DataFrame, one row per model
+
+    Raises:
+        ValueError: if a datetime field mixes naive and aware values
+    """
+    if model_cls is None:
+        if not models:
+            raise ValueError("the model class is required when there are no models")
+        model_cls = type(models[0])
+
+    columns = []
+    for converter_i in _get_converters(model_cls):
+        values = list(map(operator.attrgetter(converter_i.name), models))
+        columns.append(converter_i.to_series(values))
+    return pl.DataFrame(columns)
+
+
+def df_to_models(
+        df: pl.DataFrame,
+        model_cls: t.Type[_ModelTV],
+        trusted: bool = False,
+) -> t.List[_ModelTV]:
+    """
+    rebuild the models from the columns of the DataFrame, the inverse of 'models_to_df'. Columns
+    that aren't fields are ignored, fields without a column get their default.
+
+    Args:
+        df: the DataFrame
+        model_cls: the class to build
+        trusted: if True, the rows are not validated, we use 'model_construct' and build the
+            field types from the columns directly. Only use this for data that came from valid
+            models, e.g. 'models_to_df' and polars operations that keep the values valid.
+
+    Returns:
+        the models, one per row
+    """
+    converters = [converter_i for converter_i in _get_converters(model_cls) if converter_i.name in df.columns]
+    columns = [converter_i.to_values(df.get_column(converter_i.name), trusted) for converter_i in converters]
+
+    if trusted:
+        names = [converter_i.name for converter_i in converters]
+        construct = model_cls.model_construct
+        return [construct(**dict(zip(names, row_i))) for row_i in zip(*columns)] if columns else [
+            construct() for _ in range(df.height)
+        ]
+
+    keys = [converter_i.key for converter_i in converters]
+    rows = [dict(zip(keys, row_i)) for row_i in zip(*columns)] if columns else [{} for _ in range(df.height)]
+    return _get_list_adapter(model_cls).validate_python(rows)
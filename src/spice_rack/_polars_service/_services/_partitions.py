@@ -0,0 +1,134 @@
+from __future__ import annotations
+import multiprocessing
+import os
+import pathlib
+import tempfile
+import typing as t
+from concurrent import futures
+import polars as pl
+
+if t.TYPE_CHECKING:
+    from spice_rack._polars_service import _types
+
+
+__all__ = (
+    "ExecutorKindT",
+    "map_partitions",
+)
+
+
+ExecutorKindT = t.Literal["process", "thread"]
+
+_PartitionFuncT = t.Callable[[pl.DataFrame], t.Union[pl.DataFrame, pl.LazyFrame]]
+
+_SHARED_MEMORY_DIR = pathlib.Path("/dev/shm")
+
+
+def _split(
+        df: pl.DataFrame,
+        partition_by: t.Optional[t.Union[str, t.Sequence[str]]],
+        n_chunks: t.Optional[int],
+) -> t.List[pl.DataFrame]:
+    if partition_by is not None:
+        # an empty frame has no partitions, we still run the function once for the result schema
+        return df.partition_by(partition_by, maintain_order=True) or [df]
+    chunk_size = -(-df.height // n_chunks) if df.height else 1
+    return [df.slice(offset, chunk_size) for offset in range(0, max(df.height, 1), chunk_size)]
+
+
+def _run_partition(func: _PartitionFuncT, df: pl.DataFrame) -> pl.DataFrame:
+    res = func(df)
+    if isinstance(res, pl.LazyFrame):
+        res = res.collect()
+    return res
+
+
+def _run_ipc_partition(func: _PartitionFuncT, in_path: str, out_path: str) -> str:
+    """the process worker, the partition is memory mapped from the ipc file the parent wrote"""
+    df = pl.read_ipc(in_path, memory_map=True)
+    _run_partition(func, df).write_ipc(out_path)
+    return out_path
+
+
+def _get_scratch_dir() -> t.Optional[str]:
+    """tmpfs when we have it, so the ipc files the workers map never touch the disk"""
+    if _SHARED_MEMORY_DIR.is_dir() and os.access(_SHARED_MEMORY_DIR, os.W_OK):
+        return str(_SHARED_MEMORY_DIR)
+    return None
+
+
+def _map_in_processes(
+        func: _PartitionFuncT,
+        partitions: t.List[pl.DataFrame],
+        max_workers: int,
+) -> t.List[pl.DataFrame]:
+    with tempfile.TemporaryDirectory(prefix="spice_rack_partitions_", dir=_get_scratch_dir()) as scratch_dir:
+        in_paths = [os.path.join(scratch_dir, f"in_{i}.arrow") for i in range(len(partitions))]
+        out_paths = [os.path.join(scratch_dir, f"out_{i}.arrow") for i in range(len(partitions))]
+        for partition_i, in_path_i in zip(partitions, in_paths):
+            partition_i.write_ipc(in_path_i)
+
+        # polars' thread pool doesn't survive a fork, so the workers are spawned
+        with futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            list(executor.map(_run_ipc_partition, [func] * len(partitions), in_paths, out_paths))
+
+        # read into memory before the scratch dir is removed
+        return [pl.read_ipc(out_path_i, memory_map=False) for out_path_i in out_paths]
+
+
+def map_partitions(
+        df: _types.PolarsMaybeLazyDfT,
+        func: _PartitionFuncT,
+        *,
+        partition_by: t.Optional[t.Union[str, t.Sequence[str]]] = None,
+        n_chunks: t.Optional[int] = None,
+        executor: ExecutorKindT = "process",
+        max_workers: t.Optional[int] = None,
+) -> pl.LazyFrame:
+    """
+    split the frame into partitions, run the python function on each partition in parallel, and
+    concatenate the results. Use this for transforms polars can't vectorize, e.g. calls into other
+    python libraries, and that need every core.
+
+    With the process executor, each partition is written as an arrow ipc file, to shared memory
+    where we have it, and the worker memory maps it rather than unpickling a copy. The results come
+    back the same way. The function has to be picklable, i.e. defined at the top level of a module.
+
+    The thread executor passes the partitions directly, it only helps if the function releases the
+    GIL.
+
+    Args:
+        df: the frame to split, a LazyFrame is collected first
+        func: called with each partition, returns a DataFrame or LazyFrame. The results need to have
+            the same schema.
+        partition_by: the columns to partition by, each partition has a single value of them
+        n_chunks: the number of contiguous chunks of rows to split into, if neither this nor
+            'partition_by' is specified, the number of workers
+        executor: 'process' or 'thread'
+        max_workers: the max number of partitions processed at once, defaults to the cpu count
+
+    Returns:
+        the results, in the order of the partitions, concatenated lazily
+
+    Raises:
+        ValueError: if both 'partition_by' and 'n_chunks' are specified
+    """
+    if partition_by is not None and n_chunks is not None:
+        raise ValueError("specify either 'partition_by' or 'n_chunks', not both")
+    max_workers = max_workers or os.cpu_count() or 1
+    if isinstance(df, pl.LazyFrame):
+        df = df.collect()
+
+    partitions = _split(df, partition_by, n_chunks or max_workers)
+    max_workers = min(max_workers, len(partitions))
+    if executor == "process":
+        results = _map_in_processes(func, partitions, max_workers)
+    elif executor == "thread":
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
+            results = list(thread_executor.map(_run_partition, [func] * len(partitions), partitions))
+    else:
+        raise ValueError(f"unexpected value for 'executor': '{executor}'")
+
+    return pl.concat([res_i.lazy() for res_i in results], how="vertical", rechunk=False)
@@ -2,3 +2,5 @@ from spice_rack._polars_service._types._dicts import *
 from spice_rack._polars_service._types._collected_df import *
 from spice_rack._polars_service._types._lazy_df import *
 from spice_rack._polars_service._types._maybe_lazy import *
+from spice_rack._polars_service._types._binary_df import *
+from spice_rack._polars_service._types._schema_df import *
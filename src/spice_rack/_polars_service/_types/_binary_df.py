@@ -0,0 +1,156 @@
+from __future__ import annotations
+import base64
+import dataclasses
+import io
+import typing as t
+import pydantic
+import pydantic_core
+import polars as pl
+
+from spice_rack._polars_service._types import _collected_df, _lazy_df
+
+
+__all__ = (
+    "BinaryFormatT",
+    "PolarsBinarySerialization",
+    "PolarsDfIpcT",
+    "PolarsDfIpcTypeAdapter",
+    "PolarsDfParquetT",
+    "PolarsDfParquetTypeAdapter",
+    "PolarsLazyDfIpcT",
+    "PolarsLazyDfIpcTypeAdapter",
+    "PolarsLazyDfParquetT",
+    "PolarsLazyDfParquetTypeAdapter",
+)
+
+
+BinaryFormatT = t.Literal["ipc", "parquet"]
+
+_DEFAULT_COMPRESSIONS: t.Dict[BinaryFormatT, str] = {
+    "ipc": "uncompressed",
+    "parquet": "zstd",
+}
+
+_MEDIA_TYPES: t.Dict[BinaryFormatT, str] = {
+    "ipc": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class PolarsBinarySerialization:
+    """
+    annotation for a polars DataFrame or LazyFrame that serializes the frame as arrow ipc or parquet
+    bytes, rather than row-oriented json. Unlike the json serialization this is safe for roundtrips,
+    the dtypes are kept exactly.
+
+    * anything PolarsDfT, or PolarsLazyDfT, accepts is parsed the same way, in python and in json,
+        e.g. row dicts and columnar dicts
+    * bytes are read as the ipc or parquet file, in json a base64 encoded str
+
+    * serialization returns the bytes, in json the base64 encoded str. A LazyFrame is collected first.
+
+    Examples:
+        class CachedFeatures(ValueModelBase):
+            features: t.Annotated[pl.DataFrame, PolarsBinarySerialization("ipc", compression="lz4")]
+    """
+    format: BinaryFormatT = "ipc"
+    compression: t.Optional[str] = None
+    """the compression polars writes with, if not specified 'uncompressed' for ipc and 'zstd' for parquet"""
+
+    def get_compression(self) -> str:
+        return self.compression if self.compression is not None else _DEFAULT_COMPRESSIONS[self.format]
+
+    def to_bytes(self, df: t.Union[pl.DataFrame, pl.LazyFrame]) -> bytes:
+        if isinstance(df, pl.LazyFrame):
+            df = df.collect()
+        buffer = io.BytesIO()
+        if self.format == "ipc":
+            df.write_ipc(buffer, compression=self.get_compression())  # noqa
+        else:
+            df.write_parquet(buffer, compression=self.get_compression())  # noqa
+        return buffer.getvalue()
+
+    def from_bytes(self, data: bytes) -> pl.DataFrame:
+        """polars reads the buffers straight from the bytes, uncompressed ipc needs no decoding"""
+        if self.format == "ipc":
+            return pl.read_ipc(data, memory_map=False)
+        else:
+            return pl.read_parquet(data)
+
+    def __get_pydantic_core_schema__(
+            self,
+            source_type: t.Any,
+            _handler: pydantic.GetCoreSchemaHandler,
+    ) -> pydantic_core.core_schema.CoreSchema:
+        lazy = source_type is pl.LazyFrame
+        if lazy:
+            base_schema = _lazy_df._PolarsLazyDfPydanticAnnotation.__get_pydantic_core_schema__(
+                source_type, _handler
+            )
+        else:
+            base_schema = _collected_df._PolarsDfPydanticAnnotation.__get_pydantic_core_schema__(
+                source_type, _handler
+            )
+
+        def _from_bytes(data: t.Any) -> t.Any:
+            if isinstance(data, str):
+                data = base64.b64decode(data, validate=True)
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                df = self.from_bytes(bytes(data))
+                return df.lazy() if lazy else df
+            return data
+
+        def _serialize(df: t.Union[pl.DataFrame, pl.LazyFrame], info: pydantic.SerializationInfo) -> t.Any:
+            data = self.to_bytes(df)
+            if info.mode_is_json():
+                return base64.b64encode(data).decode()
+            return data
+
+        # the base json schema returns row dicts as they are, the python one builds the frame from
+        # row or columnar dicts, so we validate json with it too
+        validator_schema = pydantic_core.core_schema.no_info_before_validator_function(
+            function=_from_bytes, schema=base_schema["python_schema"]
+        )
+        return pydantic_core.core_schema.json_or_python_schema(
+            python_schema=validator_schema,
+            json_schema=validator_schema,
+            serialization=pydantic_core.core_schema.plain_serializer_function_ser_schema(
+                _serialize, info_arg=True, when_used="unless-none"
+            ),
+        )
+
+    def __get_pydantic_json_schema__(
+            self,
+            _core_schema: pydantic_core.core_schema.CoreSchema,
+            handler: pydantic.GetJsonSchemaHandler
+    ):
+        """a base64 encoded str of the file"""
+        return {
+            "type": "string",
+            "contentEncoding": "base64",
+            "contentMediaType": _MEDIA_TYPES[self.format],
+        }
+
+
+PolarsDfIpcT = t.Annotated[pl.DataFrame, PolarsBinarySerialization("ipc")]
+"""a polars DataFrame that serializes as arrow ipc bytes, see PolarsBinarySerialization"""
+
+PolarsDfIpcTypeAdapter: pydantic.TypeAdapter[PolarsDfIpcT] = pydantic.TypeAdapter(PolarsDfIpcT)
+
+PolarsDfParquetT = t.Annotated[pl.DataFrame, PolarsBinarySerialization("parquet")]
+"""a polars DataFrame that serializes as parquet bytes, see PolarsBinarySerialization"""
+
+PolarsDfParquetTypeAdapter: pydantic.TypeAdapter[PolarsDfParquetT] = pydantic.TypeAdapter(PolarsDfParquetT)
+
+PolarsLazyDfIpcT = t.Annotated[pl.LazyFrame, PolarsBinarySerialization("ipc")]
+"""a polars LazyFrame that is collected and serialized as arrow ipc bytes, see PolarsBinarySerialization"""
+
+PolarsLazyDfIpcTypeAdapter: pydantic.TypeAdapter[PolarsLazyDfIpcT] = pydantic.TypeAdapter(PolarsLazyDfIpcT)
+
+PolarsLazyDfParquetT = t.Annotated[pl.LazyFrame, PolarsBinarySerialization("parquet")]
+"""a polars LazyFrame that is collected and serialized as parquet bytes, see PolarsBinarySerialization"""
+
+PolarsLazyDfParquetTypeAdapter: pydantic.TypeAdapter[PolarsLazyDfParquetT] = pydantic.TypeAdapter(
+    PolarsLazyDfParquetT
+)
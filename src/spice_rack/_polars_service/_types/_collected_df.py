@@ -81,7 +81,8 @@ class _PolarsDfPydanticAnnotation:
         * list of dicts will be parsed as a DataFrame. (row orientation)
         * dict of lists will be parsed as a DataFrame (columnar orientation)
 
-        * serialization will return a row orientation of json-encodeable dicts
+        * serialization will return a row orientation of json-encodeable dicts, when dumping to
+            a json string on our bases, polars' own row-oriented json is embedded directly
 
         Args:
             _source_type: the class calling this, not sure exactly what it means beyond that,
@@ -105,7 +106,7 @@ class _PolarsDfPydanticAnnotation:
               choices=choices, discriminator=_discrim_helper.discrim_func
             ),
             serialization=pydantic_core.core_schema.plain_serializer_function_ser_schema(
-                lambda _df: _services.get_json_safe_row_dicts(_df),
+                _services.serialize_df_json,
                 when_used="json-unless-none"
             ),
             json_schema=cls._get_core_json_schema(),
@@ -138,7 +139,8 @@ e.g. as a field on a model. The pydantic behavior is as follows:
 * list of dicts will be parsed as a DataFrame. (row orientation)
 * dict of lists will be parsed as a DataFrame (columnar orientation)
 
-* serialization will return a row orientation of json-encodeable dicts
+* serialization will return a row orientation of json-encodeable dicts, 'model_dump_json' on our
+    bases embeds polars' own row-oriented json directly
 
 Notes: this is not safe for roundtrip serialization, i.e. the a serialized instance of an instance
     of this type will not necessarily deserialize to be equal to the original instance
@@ -1,5 +1,10 @@
 from __future__ import annotations
+import dataclasses
+import io
+import json
+import threading
 import typing as t
+import weakref
 import pydantic
 import pydantic_core
 import polars as pl
@@ -8,11 +13,126 @@ from spice_rack._polars_service._types import _dicts, _discrim_helper
 
 
 __all__ = (
+    "LazyDfSerializationStrategyT",
+    "LazyDfSerialization",
     "PolarsLazyDfT",
     "PolarsLazyDfTypeAdapter"
 )
 
 
+LazyDfSerializationStrategyT = t.Literal["peek", "schema", "plan"]
+
+
+class _PeekCache:
+    """the peeked rows of each LazyFrame instance, dropped when the LazyFrame is garbage collected"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._peeks: t.Dict[t.Tuple[int, int], t.Any] = {}
+        self._tracked_ids: t.Set[int] = set()
+
+    def _evict(self, lazy_df_id: int) -> None:
+        with self._lock:
+            self._tracked_ids.discard(lazy_df_id)
+            for key_i in [key_i for key_i in self._peeks if key_i[0] == lazy_df_id]:
+                del self._peeks[key_i]
+
+    def get_peek(self, lazy_df: pl.LazyFrame, num_rows: int) -> t.Any:
+        from spice_rack._polars_service import _services
+
+        key = (id(lazy_df), num_rows)
+        with self._lock:
+            if key in self._peeks:
+                return self._peeks[key]
+
+        # fetch outside the lock, concurrent peeks of the same frame at worst fetch twice
+        peek = _services.get_json_safe_row_dicts_lazy_peek(lazy_df, num_rows=num_rows)
+        with self._lock:
+            if key[0] not in self._tracked_ids:
+                self._tracked_ids.add(key[0])
+                weakref.finalize(lazy_df, self._evict, key[0])
+            self._peeks[key] = peek
+        return peek
+
+
+_peek_cache = _PeekCache()
+
+
+@dataclasses.dataclass(frozen=True)
+class LazyDfSerialization:
+    """
+    annotation controlling how a PolarsLazyDfT serializes, so dumping a model doesn't have to run
+    the query plan.
+
+    * 'peek': the first 'num_rows' rows as row dicts. The plan runs on the first dump of each LazyFrame
+        instance, later dumps reuse the rows.
+    * 'schema': the column names and dtypes, resolving the plan without running it
+    * 'plan': the serialized logical plan, nothing runs. With this strategy the serialized plan also
+        parses back into a LazyFrame.
+
+    Examples:
+        class Job(ValueModelBase):
+            query: t.Annotated[PolarsLazyDfT, LazyDfSerialization("plan")]
+            preview: t.Annotated[PolarsLazyDfT, LazyDfSerialization("peek", num_rows=10)]
+    """
+    strategy: LazyDfSerializationStrategyT = "peek"
+    num_rows: int = 3
+
+    def serialize(self, lazy_df: pl.LazyFrame) -> t.Any:
+        from spice_rack._bases import _raw_json
+
+        if self.strategy == "peek":
+            return _peek_cache.get_peek(lazy_df, self.num_rows)
+        elif self.strategy == "schema":
+            return {col_name: str(dtype) for col_name, dtype in lazy_df.schema.items()}
+        elif self.strategy == "plan":
+            serialized_plan = lazy_df.serialize()
+            if _raw_json.raw_json_enabled():
+                return _raw_json.embed_raw_json(serialized_plan)
+            return json.loads(serialized_plan)
+        else:
+            raise ValueError(f"'{self.strategy}' is an unexpected serialization strategy")
+
+    @staticmethod
+    def _parse_plan(
+            data: t.Any,
+            handler: pydantic_core.core_schema.ValidatorFunctionWrapHandler
+    ) -> t.Any:
+        """serialized plans, as a json str or the loaded dict, become LazyFrames again"""
+        if isinstance(data, dict) and not all(isinstance(val_i, list) for val_i in data.values()):
+            data = json.dumps(data)
+        if isinstance(data, str):
+            return pl.LazyFrame.deserialize(io.StringIO(data))
+        return handler(data)
+
+    def __get_pydantic_core_schema__(
+            self,
+            source_type: t.Any,
+            handler: pydantic.GetCoreSchemaHandler,
+    ) -> pydantic_core.core_schema.CoreSchema:
+        schema = handler(source_type)
+        if self.strategy == "plan":
+            schema = pydantic_core.core_schema.no_info_wrap_validator_function(
+                function=self._parse_plan, schema=schema
+            )
+        return {
+            **schema,
+            "serialization": pydantic_core.core_schema.plain_serializer_function_ser_schema(
+                self.serialize, when_used="json-unless-none"
+            ),
+        }
+
+    def __get_pydantic_json_schema__(
+            self,
+            core_schema: pydantic_core.core_schema.CoreSchema,
+            handler: pydantic.GetJsonSchemaHandler
+    ):
+        if self.strategy == "schema":
+            return {"type": "object", "additionalProperties": {"type": "string"}}
+        elif self.strategy == "plan":
+            return {"type": "object"}
+        return handler(core_schema)
+
+
 class _PolarsLazyDfPydanticAnnotation:
     @classmethod
     def _get_lazy_df_schema(cls) -> pydantic_core.CoreSchema:
@@ -81,7 +201,8 @@ class _PolarsLazyDfPydanticAnnotation:
         * list of dicts will be parsed as a LazyFrame. (row orientation)
         * dict of lists will be parsed as a LazyFrame (columnar orientation)
 
-        * serialization will return a row orientation of json-encodeable dicts, only the first 3
+        * serialization will return a row orientation of json-encodeable dicts, only the first 3,
+            see LazyDfSerialization for other strategies
 
         Args:
             _source_type: the class calling this, not sure exactly what it means beyond that,
@@ -91,8 +212,6 @@ class _PolarsLazyDfPydanticAnnotation:
         Returns:
             pydantic_core.core_schema.CoreSchema
         """
-        from spice_rack._polars_service import _services
-
         choices = _discrim_helper.build_choices(
             df_schema=cls._get_df_schema(),
             lazy_df_schema=cls._get_lazy_df_schema(),
@@ -105,10 +224,7 @@ class _PolarsLazyDfPydanticAnnotation:
               choices=choices, discriminator=_discrim_helper.discrim_func
             ),
             serialization=pydantic_core.core_schema.plain_serializer_function_ser_schema(
-
-                # todo: how could we make num_rows variable?
-                lambda _df: _services.get_json_safe_row_dicts_lazy_peek(_df, num_rows=3),
-
+                LazyDfSerialization().serialize,
                 when_used="json-unless-none"
             ),
             json_schema=cls._get_core_json_schema(),
@@ -141,7 +257,9 @@ e.g. as a field on a model. The pydantic behavior is as follows:
 * list of dicts will be parsed as a LazyFrame. (row orientation)
 * dict of lists will be parsed as a LazyFrame (columnar orientation)
 
-* serialization will return a row orientation of json-encodeable dicts, only the first 3
+* serialization will return a row orientation of json-encodeable dicts, only the first 3. The rows
+    are fetched once per LazyFrame instance. Add a LazyDfSerialization annotation to change the
+    strategy or number of rows.
 
 Notes: this is not safe for roundtrip serialization, i.e. the a serialized instance of an instance
     of this type will not necessarily deserialize to be equal to the original instance
@@ -0,0 +1,425 @@
+from __future__ import annotations
+import dataclasses
+import datetime as dt
+import enum
+import functools
+import types
+import typing as t
+import pydantic
+import pydantic_core
+import polars as pl
+
+from spice_rack._polars_service._types import _discrim_helper
+
+
+__all__ = (
+    "PolarsDfSchema",
+    "PolarsSchemaDfT",
+)
+
+
+_SCALAR_DTYPES: t.Dict[type, pl.PolarsDataType] = {
+    bool: pl.Boolean,
+    int: pl.Int64,
+    float: pl.Float64,
+    str: pl.Utf8,
+}
+
+_TEMPORAL_DTYPES: t.Dict[type, pl.PolarsDataType] = {
+    dt.datetime: pl.Datetime("us"),
+    dt.date: pl.Date,
+    dt.time: pl.Time,
+}
+
+_EPOCH = dt.datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+# 'X | Y' annotations only exist on python 3.10+
+_UNION_ORIGINS = tuple(
+    origin_i for origin_i in (t.Union, getattr(types, "UnionType", None)) if origin_i is not None
+)
+
+_CONSTRAINT_ATTRS = ("gt", "ge", "lt", "le", "multiple_of", "min_length", "max_length", "pattern")
+
+
+def _build_epoch_series(
+        name: str,
+        dtype: pl.PolarsDataType,
+        values: t.Sequence[t.Any]
+) -> t.Optional[pl.Series]:
+    """
+    polars' builder is slow for python datetimes and dates, the integer offsets from the epoch
+    are much cheaper to compute in python and build. Aware datetimes become a utc column.
+    None if the dtype isn't Datetime or Date, or the values aren't all dates or datetimes.
+
+    Raises:
+        ValueError: if the values mix naive and aware datetimes
+    """
+    if dtype == pl.Datetime:
+        try:
+            naive_flags = {val_i.utcoffset() is None for val_i in values if val_i is not None}
+        except (TypeError, AttributeError):
+            return None
+        if len(naive_flags) > 1:
+            raise ValueError(f"column '{name}' mixes naive and aware datetimes")
+        if False in naive_flags:
+            epoch = _EPOCH_UTC
+            dtype = pl.Datetime(getattr(dtype, "time_unit", None) or "us", "UTC")
+        else:
+            epoch = _EPOCH
+        try:
+            offsets = [None if val_i is None else (val_i - epoch) // _MICROSECOND for val_i in values]
+        except TypeError:
+            return None
+        return pl.Series(name, offsets, dtype=pl.Int64).cast(dtype)
+    elif dtype == pl.Date:
+        try:
+            offsets = [None if val_i is None else val_i.toordinal() - _EPOCH_ORDINAL for val_i in values]
+            return pl.Series(name, offsets, dtype=pl.Int32).cast(dtype)
+        except (TypeError, AttributeError):
+            pass
+    return None
+
+
+@dataclasses.dataclass(frozen=True)
+class _ColumnSpec:
+    """how a single field of the schema model is built and checked as a column"""
+    name: str
+    dtype: pl.PolarsDataType
+    nullable: bool
+    field: pydantic.fields.FieldInfo
+    checks: t.Tuple[t.Tuple[str, pl.Expr], ...]
+
+    @property
+    def is_temporal(self) -> bool:
+        return self.dtype in (pl.Datetime, pl.Date, pl.Time)
+
+    @property
+    def wire_dtype(self) -> pl.PolarsDataType:
+        """the dtype we build the column as, temporal values arrive as iso strings in json"""
+        return pl.Utf8 if self.is_temporal else self.dtype
+
+    def build_series(self, values: t.Sequence[t.Any], from_json: bool = False) -> pl.Series:
+        """
+        Raises:
+            ValueError: if the values can't be built as the column's dtype, or its wire dtype
+        """
+        if not from_json:
+            series = _build_epoch_series(self.name, self.dtype, values)
+            if series is not None:
+                # aware values are kept as utc in the column's naive dtype, like the parsed strs
+                if series.dtype != self.dtype and series.dtype == pl.Datetime:
+                    series = series.dt.replace_time_zone(None)
+                return series
+            try:
+                return pl.Series(self.name, values, dtype=self.dtype)
+            except (pl.ComputeError, TypeError, ValueError):
+                # e.g. temporal values as iso strings, we build them as strs and parse them after
+                pass
+        try:
+            return pl.Series(self.name, values, dtype=self.wire_dtype)
+        except (pl.ComputeError, TypeError, ValueError) as e:
+            raise ValueError(f"unable to build column '{self.name}' as {self.dtype}: {e}")
+
+    def parse_str(self, expr: pl.Expr) -> pl.Expr:
+        """parse iso strings into the temporal dtype"""
+        if self.dtype == pl.Date:
+            return expr.str.to_date()
+        elif self.dtype == pl.Time:
+            return expr.str.to_time()
+        # aware values are converted to utc, like polars does for python datetimes
+        parsed = expr.str.to_datetime(time_unit="us", time_zone="UTC")
+        return parsed.dt.replace_time_zone(None)
+
+
+def _unwrap_optional(annotation: t.Any) -> t.Tuple[t.Any, bool]:
+    origin = t.get_origin(annotation)
+    if origin in _UNION_ORIGINS:
+        args = [arg_i for arg_i in t.get_args(annotation) if arg_i is not type(None)]
+        if len(args) == 1:
+            return args[0], len(args) != len(t.get_args(annotation))
+        raise TypeError(f"unions are not supported as a column, got '{annotation}'")
+    return annotation, False
+
+
+def _get_literal_dtype(choices: t.Sequence[t.Any]) -> pl.PolarsDataType:
+    choice_types = {type(choice_i) for choice_i in choices}
+    if len(choice_types) == 1 and choice_types.issubset(_SCALAR_DTYPES):
+        return _SCALAR_DTYPES[choice_types.pop()]
+    raise TypeError(f"literals need choices of a single type of {list(_SCALAR_DTYPES)}, got {choices}")
+
+
+def _get_dtype(
+        annotation: t.Any,
+        metadata: t.List[t.Any],
+        allow_temporal: bool = True,
+) -> t.Tuple[pl.PolarsDataType, bool, t.List[t.Any]]:
+    """
+    Returns:
+        the polars dtype, if the column is nullable, and the valid choices if the values are restricted
+    """
+    annotation, nullable = _unwrap_optional(annotation)
+    if t.get_origin(annotation) is t.Annotated:
+        annotation, *annotated_metadata = t.get_args(annotation)
+        metadata.extend(annotated_metadata)
+        dtype, inner_nullable, choices = _get_dtype(annotation, metadata, allow_temporal)
+        return dtype, nullable or inner_nullable, choices
+
+    origin = t.get_origin(annotation)
+    if origin is t.Literal:
+        choices = list(t.get_args(annotation))
+        return _get_literal_dtype(choices), nullable, choices
+    elif origin in (list, tuple, t.Sequence) or annotation in (list, tuple):
+        args = [arg_i for arg_i in t.get_args(annotation) if arg_i is not Ellipsis]
+        if len(set(args)) != 1:
+            raise TypeError(f"list columns need a single item type, got '{annotation}'")
+        inner_dtype, _, _ = _get_dtype(args[0], [], allow_temporal=False)
+        return pl.List(inner_dtype), nullable, []
+
+    elif isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        choices = [member_i.value for member_i in annotation]
+        return _get_literal_dtype(choices), nullable, choices
+    elif annotation in _SCALAR_DTYPES:
+        return _SCALAR_DTYPES[annotation], nullable, []
+    elif annotation in _TEMPORAL_DTYPES and allow_temporal:
+        return _TEMPORAL_DTYPES[annotation], nullable, []
+    raise TypeError(f"'{annotation}' can't be represented as a polars column")
+
+
+def _build_checks(
+        name: str,
+        dtype: pl.PolarsDataType,
+        metadata: t.List[t.Any],
+        choices: t.List[t.Any]
+) -> t.Tuple[t.Tuple[str, pl.Expr], ...]:
+    """the vectorized checks for the field's constraints, each expr is True for the valid rows"""
+    col = pl.col(name)
+    length = col.list.len() if isinstance(dtype, pl.List) else col.str.len_chars()
+    checks: t.List[t.Tuple[str, pl.Expr]] = []
+    if choices:
+        checks.append((f"one of {choices}", col.is_in(choices)))
+
+    for meta_i in metadata:
+        if hasattr(meta_i, "func"):
+            raise TypeError(f"validator functions can't run as column checks, got '{meta_i}' for '{name}'")
+        for attr_i in _CONSTRAINT_ATTRS:
+            val = getattr(meta_i, attr_i, None)
+            if val is None:
+                continue
+            if attr_i == "gt":
+                checks.append((f"> {val}", col > val))
+            elif attr_i == "ge":
+                checks.append((f">= {val}", col >= val))
+            elif attr_i == "lt":
+                checks.append((f"< {val}", col < val))
+            elif attr_i == "le":
+                checks.append((f"<= {val}", col <= val))
+            elif attr_i == "multiple_of":
+                checks.append((f"a multiple of {val}", (col % val) == 0))
+            elif attr_i == "min_length":
+                checks.append((f"at least {val} long", length >= val))
+            elif attr_i == "max_length":
+                checks.append((f"at most {val} long", length <= val))
+            else:
+                checks.append((f"matching '{val}'", col.str.contains(val)))
+    return tuple(checks)
+
+
+@dataclasses.dataclass(frozen=True)
+class PolarsDfSchema:
+    """
+    annotation for a polars DataFrame whose columns are the fields of a pydantic model. The
+    polars schema is derived from the model once, and the input is built straight into columns of
+    that schema, rather than validating each row and inferring the dtypes.
+
+    * DataFrame and LazyFrame instances are cast to the schema, extra columns are dropped
+    * list of dicts (row orientation) and dict of lists (columnar orientation) are built with the schema
+    * in json, temporal values are parsed from their iso strings as whole columns
+
+    * missing columns, and nulls in non-optional fields, get the field default, else they raise
+    * the field constraints, e.g. 'gt' or 'max_length', literal and enum choices, run as vectorized
+        checks over each column. Validator functions are not supported.
+
+    * serialization is the same as PolarsDfT
+
+    The supported field types are bool, int, float, str, datetime, date, time, literals, enums, and
+    lists of the scalar types, each optionally Optional.
+
+    Notes: values are coerced by polars' builders, e.g. a float in an int column is truncated, where
+        the model itself would raise.
+
+    Examples:
+        class Trade(ValueModelBase):
+            symbol: str = pydantic.Field(max_length=8)
+            price: float = pydantic.Field(gt=0)
+
+        class TradesBatch(ValueModelBase):
+            trades: PolarsSchemaDfT[Trade]
+    """
+    model: t.Type[pydantic.BaseModel]
+
+    @functools.cached_property
+    def columns(self) -> t.Tuple[_ColumnSpec, ...]:
+        columns = []
+        for field_name, field_i in self.model.model_fields.items():
+            name = field_i.alias or field_name
+            metadata = list(field_i.metadata)
+            try:
+                dtype, nullable, choices = _get_dtype(field_i.annotation, metadata)
+            except TypeError as e:
+                raise TypeError(f"'{self.model.__name__}.{field_name}': {e}") from e
+            columns.append(
+                _ColumnSpec(
+                    name=name,
+                    dtype=dtype,
+                    nullable=nullable,
+                    field=field_i,
+                    checks=_build_checks(name, dtype, metadata, choices),
+                )
+            )
+        return tuple(columns)
+
+    def get_polars_schema(self) -> t.Dict[str, pl.PolarsDataType]:
+        return {col_i.name: col_i.dtype for col_i in self.columns}
+
+    def _get_wire_schema(self) -> t.Dict[str, pl.PolarsDataType]:
+        return {col_i.name: col_i.wire_dtype for col_i in self.columns}
+
+    def _build_from_rows(self, rows: t.List[t.Dict[str, t.Any]], from_json: bool) -> pl.DataFrame:
+        """polars builds the columns from the rows, missing keys are read as nulls"""
+        plain_schema = {col_i.name: col_i.dtype for col_i in self.columns if not col_i.is_temporal}
+        try:
+            df = pl.DataFrame(rows, schema=plain_schema)
+        except (pl.ComputeError, TypeError, ValueError) as e:
+            raise ValueError(f"unable to build the rows with the schema of '{self.model.__name__}': {e}")
+
+        temporal_series = [
+            col_i.build_series([row_i.get(col_i.name) for row_i in rows], from_json=from_json)
+            for col_i in self.columns if col_i.is_temporal
+        ]
+        return df.with_columns(temporal_series)
+
+    def _build_from_columns(self, data: t.Dict[str, t.List[t.Any]], from_json: bool) -> pl.DataFrame:
+        return pl.DataFrame(
+            [col_i.build_series(data[col_i.name], from_json=from_json) for col_i in self.columns if col_i.name in data]
+        )
+
+    def _conform(self, df: pl.DataFrame) -> pl.DataFrame:
+        """cast the columns to the schema and fill the defaults"""
+        exprs = []
+        for col_i in self.columns:
+            default = col_i.field.get_default(call_default_factory=True)
+            if col_i.name not in df.columns:
+                if col_i.field.is_required():
+                    raise ValueError(f"column '{col_i.name}' is required")
+                exprs.append(pl.lit(default, dtype=col_i.dtype).alias(col_i.name))
+                continue
+
+            expr = pl.col(col_i.name)
+            source_dtype = df.schema[col_i.name]
+            if source_dtype != col_i.dtype:
+                if source_dtype == pl.Utf8 and col_i.is_temporal:
+                    expr = col_i.parse_str(expr)
+                else:
+                    expr = expr.cast(col_i.dtype, strict=True)
+            if not col_i.nullable and not col_i.field.is_required() and default is not None:
+                expr = expr.fill_null(pl.lit(default, dtype=col_i.dtype))
+            exprs.append(expr.alias(col_i.name))
+        try:
+            return df.select(exprs)
+        except pl.PolarsError as e:
+            raise ValueError(f"unable to cast to the schema of '{self.model.__name__}': {e}")
+
+    def _check(self, df: pl.DataFrame) -> pl.DataFrame:
+        """run every check as one select, and report each failing check with its first failing row"""
+        labels = []
+        invalid_exprs = []
+        for col_i in self.columns:
+            if not col_i.nullable:
+                labels.append((col_i.name, "not null"))
+                invalid_exprs.append(pl.col(col_i.name).is_null())
+            for check_label_i, check_i in col_i.checks:
+                labels.append((col_i.name, check_label_i))
+                invalid_exprs.append(~check_i.fill_null(True))
+        if not invalid_exprs or not df.height:
+            return df
+
+        invalid = df.select(
+            [expr_i.alias(f"_{i}") for i, expr_i in enumerate(invalid_exprs)]
+        )
+        num_invalid = invalid.sum().row(0)
+        issues = []
+        for (col_name, label), invalid_col, count in zip(labels, invalid.columns, num_invalid):
+            if count:
+                first_row = invalid.get_column(invalid_col).arg_true()[0]
+                issues.append(
+                    f"'{col_name}' must be {label}, {count} of {df.height} rows aren't, the first is row {first_row}"
+                )
+        if issues:
+            raise ValueError("; ".join(issues))
+        return df
+
+    def validate_df(self, data: t.Any, from_json: bool = False) -> pl.DataFrame:
+        """
+        build and check the DataFrame from any input the annotation accepts
+
+        Raises:
+            ValueError: if the data can't be built with the schema or fails a check
+        """
+        if isinstance(data, pl.LazyFrame):
+            data = data.collect()
+        if isinstance(data, list):
+            data = self._build_from_rows(data, from_json=from_json)
+        elif isinstance(data, dict):
+            data = self._build_from_columns(data, from_json=from_json)
+        elif not isinstance(data, pl.DataFrame):
+            raise ValueError(f"unable to parse '{type(data)}' as a polars dataframe")
+        return self._check(self._conform(data))
+
+    def __get_pydantic_core_schema__(
+            self,
+            _source_type: t.Any,
+            _handler: pydantic.GetCoreSchemaHandler,
+    ) -> pydantic_core.core_schema.CoreSchema:
+        from spice_rack._polars_service import _services
+
+        # derive the columns up front, so unsupported fields raise when the annotation is used
+        _ = self.columns
+        validator = pydantic_core.core_schema.no_info_plain_validator_function(self.validate_df)
+        choices = _discrim_helper.build_choices(
+            df_schema=validator,
+            lazy_df_schema=validator,
+            row_dicts_schema=validator,
+            columnar_dict_schema=validator,
+        )
+        return pydantic_core.core_schema.json_or_python_schema(
+            python_schema=pydantic_core.core_schema.tagged_union_schema(
+                choices=choices, discriminator=_discrim_helper.discrim_func
+            ),
+            json_schema=pydantic_core.core_schema.no_info_plain_validator_function(
+                functools.partial(self.validate_df, from_json=True)
+            ),
+            serialization=pydantic_core.core_schema.plain_serializer_function_ser_schema(
+                _services.serialize_df_json,
+                when_used="json-unless-none"
+            ),
+        )
+
+    def __get_pydantic_json_schema__(
+            self,
+            _core_schema: pydantic_core.core_schema.CoreSchema,
+            handler: pydantic.GetJsonSchemaHandler
+    ):
+        """the rows of the schema model"""
+        return handler(pydantic_core.core_schema.list_schema(self.model.__pydantic_core_schema__))
+
+
+class PolarsSchemaDfT:
+    """
+    a polars DataFrame with the columns of a pydantic model, 'PolarsSchemaDfT[Model]' is short for
+    't.Annotated[pl.DataFrame, PolarsDfSchema(Model)]', see PolarsDfSchema
+    """
+    def __class_getitem__(cls, model: t.Type[pydantic.BaseModel]) -> t.Any:
+        return t.Annotated[pl.DataFrame, PolarsDfSchema(model)]
@@ -0,0 +1,75 @@
+from pathlib import Path
+import pytest
+
+from spice_rack import fs_ops, gcp_auth
+
+
+_DATA = bytes(range(256)) * 4
+
+
+@pytest.fixture(scope="function")
+def local_file(tmp_path: Path) -> fs_ops.path_strs.AbsoluteFilePathStr:
+    p = tmp_path.joinpath("source.bin")
+    p.write_bytes(_DATA)
+    return fs_ops.path_strs.AbsoluteFilePathStr(str(p))
+
+
+@pytest.fixture(scope="function")
+def remote_fsspec_obj(monkeypatch):
+    """the gcs calls go to a memory backed fault injecting file system, the first part write fails"""
+    fault_fs = fs_ops.file_systems.FaultInjectingFileSystem(
+        wrapped_protocol="memory", failure_rate=1.0, max_faults=1, fault_ops=("write",), seed=11
+    )
+    fault_fs.reset_trace()
+    fsspec_obj = fault_fs.fsspec_obj
+
+    def _merge(path, paths):
+        fsspec_obj.pipe_file(path, b"".join(fsspec_obj.cat_file(path_i) for path_i in paths))
+
+    monkeypatch.setattr(fsspec_obj, "merge", _merge, raising=False)
+    monkeypatch.setattr(fs_ops.file_systems.GcsFileSystem, "fsspec_obj", property(lambda _: fsspec_obj))
+    yield fsspec_obj
+    for path_i in _list_bucket(fsspec_obj):
+        fsspec_obj.wrapped.rm_file(path_i)
+
+
+def _list_bucket(fsspec_obj) -> list:
+    # the memory file system keeps the gs:// paths as they are
+    return [path_i for path_i in fsspec_obj.wrapped.store if path_i.startswith("gs://composite-upload-bucket/")]
+
+
+def test_composite_upload(local_file, remote_fsspec_obj):
+    file_system = fs_ops.file_systems.GcsFileSystem(
+        creds=gcp_auth.AnyGcpAuthStrat.model_validate(gcp_auth.auth_strategies.AnonAuthStrategy()),
+        composite_upload_threshold=100,
+        composite_upload_part_size=300,
+        retry_max_attempts=2,
+    )
+    dest_dir = fs_ops.path_strs.AbsoluteDirPathStr("/composite-upload-bucket/dir/")
+    dest_path = file_system.upload_file_from_local(local_file, dest_dir)
+
+    dest_path_str = file_system.contextualize_abs_path(dest_path)
+    assert remote_fsspec_obj.cat_file(dest_path_str) == _DATA
+    # the parts are gone, and the failed part write was retried
+    assert _list_bucket(remote_fsspec_obj) == [dest_path_str]
+    trace = remote_fsspec_obj.get_trace()
+    assert [event_i.error for event_i in trace.events if event_i.op == "write"].count(True) == 1
+    assert trace.get_op_counts()["delete"] == 4
+
+
+def test_composite_upload_failure_cleans_up(local_file, remote_fsspec_obj, monkeypatch):
+    def _merge(*_args, **_kwargs):
+        raise PermissionError("compose denied")
+
+    monkeypatch.setattr(remote_fsspec_obj, "merge", _merge, raising=False)
+    file_system = fs_ops.file_systems.GcsFileSystem(
+        creds=gcp_auth.AnyGcpAuthStrat.model_validate(gcp_auth.auth_strategies.AnonAuthStrategy()),
+        composite_upload_threshold=100,
+        composite_upload_part_size=300,
+        retry_max_attempts=2,
+    )
+    with pytest.raises(PermissionError):
+        file_system.upload_file_from_local(
+            local_file, fs_ops.path_strs.AbsoluteDirPathStr("/composite-upload-bucket/dir/")
+        )
+    assert _list_bucket(remote_fsspec_obj) == []
@@ -0,0 +1,78 @@
+from pathlib import Path
+import pytest
+
+from spice_rack import fs_ops, gcp_auth
+
+
+def test_virtual_make_dir_makes_no_requests():
+    fs_ops.io_stats.reset_io_stats()
+    file_system = fs_ops.file_systems.GcsFileSystem(
+        creds=gcp_auth.AnyGcpAuthStrat.model_validate(gcp_auth.auth_strategies.AnonAuthStrategy()),
+        dir_mode="virtual"
+    )
+    for i in range(100):
+        file_system.make_dir(fs_ops.path_strs.AbsoluteDirPathStr(f"/some-bucket/partition={i}/"))
+    assert "gcs" not in fs_ops.io_stats.get_io_stats().to_dict()
+
+
+@pytest.fixture(scope="module")
+def placeholder_fs(service_account_key_data) -> fs_ops.file_systems.GcsFileSystem:
+    auth_strat = gcp_auth.auth_strategies.ServiceAcctKeyAuthStrategy(
+        key_data=service_account_key_data  # noqa
+    )
+    return fs_ops.file_systems.GcsFileSystem(creds=gcp_auth.AnyGcpAuthStrat.model_validate(auth_strat))
+
+
+@pytest.fixture(scope="module")
+def virtual_fs(placeholder_fs) -> fs_ops.file_systems.GcsFileSystem:
+    return placeholder_fs.model_copy(update={"dir_mode": "virtual"})
+
+
+@pytest.fixture(scope="function")
+def work_dir(protected_bucket, placeholder_fs) -> fs_ops.path_strs.AbsoluteDirPathStr:
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(
+        placeholder_fs.clean_raw_path_str(protected_bucket + "virtual_dirs_test_dir/")
+    )
+    placeholder_fs.delete_dir(dir_path, if_non_existent="return", recursive=True)
+    yield dir_path
+    placeholder_fs.delete_dir(dir_path, recursive=True, if_non_existent="return")
+
+
+def test_virtual_dirs_exist_once_written(virtual_fs, work_dir):
+    sub_dir = work_dir.joinpath(fs_ops.path_strs.RelDirPathStr("sub/"))
+    virtual_fs.make_dir(sub_dir)
+    assert not virtual_fs.exists(sub_dir)
+
+    with virtual_fs.open_file(sub_dir.joinpath(fs_ops.path_strs.RelFilePathStr("file.txt")), "wb") as f:
+        f.write(b"data")
+    assert virtual_fs.exists(sub_dir)
+
+    with pytest.raises(fs_ops.exceptions.PathAlreadyExistsException):
+        virtual_fs.make_dir(sub_dir, if_exists="raise")
+
+
+def test_strip_placeholders(placeholder_fs, virtual_fs, work_dir):
+    for name_i in ["a/", "b/", "b/c/"]:
+        placeholder_fs.make_dir(work_dir.joinpath(fs_ops.path_strs.RelDirPathStr(name_i)))
+    with placeholder_fs.open_file(work_dir.joinpath(fs_ops.path_strs.RelFilePathStr("b/file.txt")), "wb") as f:
+        f.write(b"data")
+
+    # trees with placeholders read the same in both modes
+    assert virtual_fs.list_dir_contents(work_dir) == placeholder_fs.list_dir_contents(work_dir)
+
+    local_dir = fs_ops.path_strs.AbsoluteDirPathStr(str(Path(__file__).parent.joinpath("virtual_dirs_download/")))
+    local_fs = fs_ops.file_systems.LocalFileSystem()
+    try:
+        downloaded = virtual_fs.download_dir_locally(work_dir, local_dir)
+        assert not any(
+            fs_ops.path_strs.PathStrArray.from_strs(
+                local_fs.iter_dir_contents_files_only(downloaded, recursive=True)
+            ).is_placeholder()
+        )
+        assert local_fs.exists(downloaded.joinpath(fs_ops.path_strs.RelDirPathStr("b/c/")))
+    finally:
+        local_fs.delete_dir(local_dir, recursive=True, if_non_existent="return")
+
+    assert virtual_fs.strip_placeholders(work_dir) == 3
+    assert virtual_fs.strip_placeholders(work_dir) == 0
+    assert virtual_fs.exists(work_dir.joinpath(fs_ops.path_strs.RelFilePathStr("b/file.txt")))
@@ -0,0 +1,150 @@
+import time
+from concurrent import futures
+import pytest
+
+from spice_rack import fs_ops
+
+
+@pytest.fixture(scope="function")
+def work_dir() -> fs_ops.path_strs.AbsoluteDirPathStr:
+    memory_fs = fs_ops.file_systems.MemoryFileSystem()
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr("/fault_injecting_test_dir/")
+    memory_fs.make_dir(dir_path, if_exists="raise")
+    yield dir_path
+    memory_fs.delete_dir(dir_path, recursive=True, if_non_existent="raise")
+
+
+def _build_file_system(**kwargs) -> fs_ops.file_systems.FaultInjectingFileSystem:
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(wrapped_protocol="memory", **kwargs)
+    file_system.reset_trace()
+    return file_system
+
+
+def _file_path(dir_path: fs_ops.path_strs.AbsoluteDirPathStr, i: int) -> fs_ops.path_strs.AbsoluteFilePathStr:
+    return dir_path.joinpath(fs_ops.path_strs.RelFilePathStr(f"file_{i}.bin"))
+
+
+def test_round_trips_recorded(work_dir):
+    file_system = _build_file_system(latency=0.01)
+    file_path = _file_path(work_dir, 0)
+    with file_system.open_file(file_path, "wb", block_size=100) as f:
+        f.write(b"x" * 1000)
+
+    start = time.perf_counter()
+    with file_system.open_file(file_path, "rb", block_size=100, cache_type="none") as f:
+        while f.read(100):
+            pass
+    assert time.perf_counter() - start >= 0.11
+
+    op_counts = file_system.get_trace().get_op_counts()
+    assert op_counts["info"] == 1
+    assert op_counts["read"] == 10
+    assert op_counts["write"] >= 1
+    assert file_system.list_dir_contents(work_dir) == [file_path]
+
+
+def test_bandwidth_shared(work_dir):
+    file_system = _build_file_system(latency=0.05, bandwidth=1e6)
+    memory_fs = fs_ops.file_systems.MemoryFileSystem()
+    for i in range(4):
+        with memory_fs.open_file(_file_path(work_dir, i), "wb") as f:
+            f.write(b"y" * 50_000)
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: file_system.read_bytes(_file_path(work_dir, i)), range(4)))
+    elapsed = time.perf_counter() - start
+
+    # the latencies overlap, the transfers don't
+    assert 0.25 <= elapsed < 0.4
+    assert file_system.get_trace().get_total_bytes() == 200_000
+
+
+def test_replay(work_dir):
+    file_system = _build_file_system(latency=0.0, seed=1)
+    file_path = _file_path(work_dir, 0)
+    with file_system.open_file(file_path, "wb") as f:
+        f.write(b"z" * 10)
+    file_system.exists(file_path)
+    trace = file_system.get_trace()
+
+    memory_fs = fs_ops.file_systems.MemoryFileSystem()
+    memory_fs.delete_file(file_path)
+    trace.replay(memory_fs)
+    assert memory_fs.get_file_stat(file_path).size == 10
+
+    replay_fs = _build_file_system(latency=0.01, seed=2)
+    assert trace.replay(replay_fs, max_workers=2) >= 0.01
+    assert replay_fs.get_trace().get_op_counts() == trace.get_op_counts()
+    assert trace.to_df().height == trace.get_num_round_trips()
+
+
+def test_faults_traced(work_dir):
+    file_system = _build_file_system(failure_rate=1.0, max_faults=1, fault_ops=("exists",), seed=3)
+    with pytest.raises(fs_ops.file_systems.InjectedFaultError):
+        file_system.exists(work_dir)
+    assert file_system.exists(work_dir)
+
+    trace = file_system.get_trace()
+    assert [event_i.error for event_i in trace.events] == [True, False]
+
+    # the failed event is skipped when it fails again on replay
+    replay_fs = _build_file_system(failure_rate=1.0, max_faults=1, fault_ops=("exists",), seed=4)
+    trace.replay(replay_fs)
+    assert replay_fs.get_trace().get_op_counts() == {"exists": 2}
+
+
+def test_state_per_instance(work_dir):
+    # identical settings don't share the fault count or the trace
+    for _ in range(2):
+        file_system = _build_file_system(failure_rate=1.0, max_faults=1, fault_ops=("exists",), seed=5)
+        with pytest.raises(fs_ops.file_systems.InjectedFaultError):
+            file_system.exists(work_dir)
+        assert file_system.exists(work_dir)
+        assert file_system.get_trace().get_num_round_trips() == 2
+
+
+def test_state_shared_by_trace_id(work_dir):
+    file_system = _build_file_system(failure_rate=1.0, max_faults=1, fault_ops=("exists",), trace_id="shared")
+    other_file_system = _build_file_system(latency=0.001, trace_id="shared")
+    with pytest.raises(fs_ops.file_systems.InjectedFaultError):
+        file_system.exists(work_dir)
+    assert other_file_system.exists(work_dir)
+    assert [event_i.error for event_i in other_file_system.get_trace().events] == [True, False]
+
+
+def test_trace_bounded(work_dir):
+    file_system = _build_file_system(max_trace_events=3)
+    for _ in range(5):
+        file_system.exists(work_dir)
+    trace = file_system.get_trace()
+    assert trace.get_num_round_trips() == 3
+    assert trace.events[-1].start_seconds > trace.events[0].start_seconds
+
+
+@pytest.mark.parametrize("wrapped", [fs_ops.file_systems.MemoryFileSystem(), fs_ops.file_systems.LocalFileSystem()])
+def test_wraps_file_system(tmp_path, wrapped):
+    file_system = fs_ops.file_systems.SimulatedRemoteFileSystem.wrap(wrapped, latency=0.001)
+    assert file_system.get_wrapped() == wrapped
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(str(tmp_path) + "/wrapped/")
+    file_path = _file_path(dir_path, 0)
+    file_system.make_dir(dir_path, if_exists="raise")
+    try:
+        with file_system.open_file(file_path, "wb") as f:
+            f.write(b"w" * 100)
+        assert wrapped.get_file_stat(file_path).size == 100
+        assert file_system.read_bytes(file_path) == b"w" * 100
+        assert file_system.list_dir_contents(dir_path) == [file_path]
+        assert file_system.get_trace().get_op_counts()["list"] == 1
+    finally:
+        wrapped.delete_dir(dir_path, recursive=True, if_non_existent="raise")
+
+
+def test_wrapped_validation():
+    wrapped = fs_ops.file_systems.MemoryFileSystem()
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem.wrap(wrapped)
+    assert fs_ops.file_systems.AnyFileSystemTypeAdapter.validate_json(file_system.model_dump_json()) == file_system
+    with pytest.raises(ValueError):
+        fs_ops.file_systems.FaultInjectingFileSystem(wrapped=wrapped, wrapped_protocol="memory")
+    with pytest.raises(ValueError):
+        fs_ops.file_systems.FaultInjectingFileSystem.wrap(file_system)
@@ -35,3 +35,101 @@ def test_write_to_new_file(file_system, work_dir):
         read_text = f.read().decode()
 
     assert read_text == text
+
+
+@pytest.fixture(scope="function")
+def nested_work_dir(file_system, work_dir) -> fs_ops.path_strs.AbsoluteDirPathStr:
+    for rel_path_i in ["a.txt", "sub/b.txt", "sub/deeper/c.txt"]:
+        Path(str(work_dir)).joinpath(rel_path_i).parent.mkdir(parents=True, exist_ok=True)
+        Path(str(work_dir)).joinpath(rel_path_i).write_text(rel_path_i)
+    Path(str(work_dir)).joinpath("empty/").mkdir()
+    return work_dir
+
+
+def test_iter_dir_contents(file_system, nested_work_dir):
+    found = sorted(str(p)[len(nested_work_dir):] for p in file_system.iter_dir_contents(nested_work_dir))
+    assert found == ["a.txt", "empty/", "sub/"]
+    assert all(
+        isinstance(p, fs_ops.path_strs.AbsoluteDirPathStr)
+        for p in file_system.iter_dir_contents(nested_work_dir) if str(p).endswith("/")
+    )
+
+
+def test_iter_files_recursive(file_system, nested_work_dir):
+    found = sorted(
+        str(p)[len(nested_work_dir):] for p in file_system.iter_dir_contents_files_only(nested_work_dir)
+    )
+    assert found == ["a.txt", "sub/b.txt", "sub/deeper/c.txt"]
+
+    found = list(file_system.iter_dir_contents_files_only(nested_work_dir, recursive=False))
+    assert found == [nested_work_dir.joinpath("a.txt")]
+
+
+def test_iter_file_stats(file_system, nested_work_dir):
+    file_stats = list(file_system.iter_file_stats(nested_work_dir))
+    assert [str(s.path)[len(nested_work_dir):] for s in file_stats] == ["a.txt", "sub/b.txt", "sub/deeper/c.txt"]
+    assert [s.size for s in file_stats] == [5, 9, 16]
+
+
+def test_copy_file(file_system, nested_work_dir):
+    source = nested_work_dir.joinpath("sub/deeper/c.txt")
+    dest = nested_work_dir.joinpath("copied/c.txt")
+    assert file_system.copy_file(source, dest) == dest
+    with file_system.open_file(dest, "rb") as f:
+        assert f.read() == b"sub/deeper/c.txt"
+
+
+def test_copy_to_other_file_system(nested_work_dir):
+    source = fs_ops.FilePath.model_validate(str(nested_work_dir.joinpath("a.txt")))
+    dest = fs_ops.FilePath(
+        path=nested_work_dir.joinpath("other_fs/a.txt"),
+        file_system=fs_ops.file_systems.FaultInjectingFileSystem()
+    )
+    dest.get_parent().make_self()
+    assert source.copy_to(dest).read_as_str() == "a.txt"
+
+
+def test_copy_to_differently_configured_file_system(nested_work_dir, monkeypatch):
+    # the same home dir, but a different config, so the copy is streamed rather than done in place
+    def _copy_file(*_args, **_kwargs):
+        raise AssertionError("copied in place across differently configured file systems")
+
+    monkeypatch.setattr(fs_ops.file_systems.LocalFileSystem, "copy_file", _copy_file)
+    source = fs_ops.FilePath.model_validate(str(nested_work_dir.joinpath("a.txt")))
+    dest = fs_ops.FilePath(
+        path=nested_work_dir.joinpath("a_copy.txt"),
+        file_system=fs_ops.file_systems.LocalFileSystem(retry_max_attempts=3)
+    )
+    assert source.copy_to(dest).read_as_str() == "a.txt"
+
+
+def test_copy_file_without_server_side_copy(monkeypatch):
+    # e.g. sftp, fsspec has no cp_file for it
+    memory_fs = fs_ops.file_systems.MemoryFileSystem()
+
+    def _cp_file(*_args, **_kwargs):
+        raise NotImplementedError
+
+    monkeypatch.setattr(memory_fs.fsspec_obj, "cp_file", _cp_file)
+    source = fs_ops.path_strs.AbsoluteFilePathStr("/copy_fallback_test/a.bin")
+    dest = fs_ops.path_strs.AbsoluteFilePathStr("/copy_fallback_test/b.bin")
+    with memory_fs.open_file(source, "wb") as f:
+        f.write(b"abc")
+    try:
+        assert memory_fs.copy_file(source, dest) == dest
+        assert memory_fs.read_bytes(dest) == b"abc"
+    finally:
+        memory_fs.delete_dir(fs_ops.path_strs.AbsoluteDirPathStr("/copy_fallback_test/"), recursive=True)
+
+
+def test_iter_file_stats_lazy(file_system, nested_work_dir, monkeypatch):
+    listed = []
+    scan_dir_stats = fs_ops.file_systems._local._scan_dir_stats
+
+    def _scan(dir_path):
+        listed.append(dir_path)
+        return scan_dir_stats(dir_path)
+
+    monkeypatch.setattr(fs_ops.file_systems._local, "_scan_dir_stats", _scan)
+    next(file_system.iter_file_stats(nested_work_dir))
+    assert len(listed) == 1
@@ -0,0 +1,118 @@
+from concurrent import futures
+import time
+import pytest
+from pathlib import Path
+
+from spice_rack import fs_ops
+
+
+_DATA = b"0123456789" * 100
+
+
+@pytest.fixture(scope="function")
+def work_dir() -> fs_ops.path_strs.AbsoluteDirPathStr:
+    local_fs = fs_ops.file_systems.LocalFileSystem()
+    p = Path(__file__).parent.joinpath("resilience_test_dir/")
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(str(p))
+    local_fs.make_dir(dir_path, if_exists="raise")
+    with local_fs.open_file(dir_path.joinpath("file.bin"), "wb") as f:
+        f.write(_DATA)
+    yield dir_path
+    local_fs.delete_dir(dir_path, recursive=True, if_non_existent="raise")
+
+
+def test_retry_transient_failures(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        failure_rate=1.0, max_faults=2, fault_ops=("exists",), retry_max_attempts=3, seed=1
+    )
+    assert file_system.exists(work_dir.joinpath("file.bin"))
+
+
+def test_retries_exhausted(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        failure_rate=1.0, max_faults=2, fault_ops=("exists",), retry_max_attempts=2, seed=2
+    )
+    with pytest.raises(fs_ops.file_systems.InjectedFaultError):
+        file_system.exists(work_dir.joinpath("file.bin"))
+
+
+def test_non_transient_not_retried(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(retry_max_attempts=3, seed=3)
+    with pytest.raises(fs_ops.exceptions.NonExistentPathException):
+        file_system.open_file(work_dir.joinpath("missing.bin"), "rb")
+
+
+def test_read_retried(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        failure_rate=1.0, max_faults=1, fault_ops=("read",), retry_max_attempts=2, seed=4
+    )
+    with file_system.open_file(work_dir.joinpath("file.bin"), "rb", block_size=100) as f:
+        assert f.read() == _DATA
+
+
+def test_op_timeout(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        stall_rate=1.0, stall_seconds=1.0, max_faults=1, fault_ops=("exists",),
+        op_timeout=0.2, retry_max_attempts=2, seed=5
+    )
+    start = time.perf_counter()
+    assert file_system.exists(work_dir.joinpath("file.bin"))
+    assert time.perf_counter() - start < 0.9
+
+
+def test_hedged_read(work_dir):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        stall_rate=1.0, stall_seconds=2.0, max_faults=1, fault_ops=("read",), hedge_reads=True, seed=6
+    )
+    tracker = fs_ops.resilience.get_latency_tracker(file_system._get_cache_namespace(), "read")
+    for _ in range(20):
+        tracker.record(0.001)
+
+    start = time.perf_counter()
+    with file_system.open_file(work_dir.joinpath("file.bin"), "rb", cache_type="none") as f:
+        assert f.read() == _DATA
+    assert time.perf_counter() - start < 1.5
+
+
+def test_hedged_call_both_fail():
+    def _func():
+        raise ValueError("fails")
+
+    with pytest.raises(ValueError):
+        fs_ops.resilience.hedged_call(_func, delay=0.0)
+
+
+def test_policy_merge():
+    policy = fs_ops.file_systems.GcsFileSystem.get_default_retry_policy()
+    merged = policy.merge(fs_ops.RetryPolicy(max_attempts=5))
+    assert merged.max_attempts == 5
+    assert merged.hedge_reads
+
+
+def test_concurrent_timeouts_and_hedges():
+    # more concurrent calls than the pools have threads, each with a timeout and a hedge
+    policy = fs_ops.RetryPolicy(timeout=10.0, hedge_reads=True, hedge_min_samples=1, hedge_min_delay=0.01)
+    tracker = fs_ops.resilience.LatencyTracker()
+    tracker.record(0.001)
+
+    def _call(i: int) -> int:
+        def _func() -> int:
+            time.sleep(0.05)
+            return i
+
+        return fs_ops.resilience.call_with_retries(
+            _func, policy, is_transient=lambda _e: False, latency_tracker=tracker, hedge=True
+        )
+
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=64) as executor:
+        assert list(executor.map(_call, range(64))) == list(range(64))
+    assert time.perf_counter() - start < 5.0
+
+    # the pools are still usable afterwards
+    assert _call(-1) == -1
+
+
+def test_hedged_call_timeout():
+    with pytest.raises(TimeoutError):
+        fs_ops.resilience.hedged_call(lambda: time.sleep(1.0), delay=0.05, timeout=0.2)
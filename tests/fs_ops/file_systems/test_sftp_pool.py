@@ -0,0 +1,201 @@
+import os
+import threading
+from concurrent import futures
+import pytest
+from pathlib import Path
+import paramiko
+
+from spice_rack import fs_ops
+from spice_rack._fs_ops._file_systems import _sftp_pool
+
+
+class _FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, interval: int) -> None:
+        self.keepalive = interval
+
+
+class _FakeChannel:
+    def __init__(self):
+        self.closed = False
+
+
+class _FakeSftpClient:
+    """serves the local file system through the few paramiko sftp client methods fsspec uses"""
+    def __init__(self):
+        self._channel = _FakeChannel()
+
+    def get_channel(self) -> _FakeChannel:
+        return self._channel
+
+    def close(self) -> None:
+        self._channel.closed = True
+
+    def stat(self, path: str) -> paramiko.SFTPAttributes:
+        return paramiko.SFTPAttributes.from_stat(os.stat(path))
+
+    def listdir_iter(self, path: str):
+        for name_i in os.listdir(path):
+            yield paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(path, name_i)), name_i)
+
+    def mkdir(self, path: str, mode: int = 511) -> None:
+        os.mkdir(path, mode)
+
+    def rmdir(self, path: str) -> None:
+        os.rmdir(path)
+
+    def remove(self, path: str) -> None:
+        os.remove(path)
+
+    def open(self, path: str, mode: str = "r", bufsize: int = -1):
+        return open(path, mode if "b" in mode else mode + "b")
+
+
+class _FakeSshClient:
+    def __init__(self):
+        self.transport = _FakeTransport()
+        self.closed = False
+
+    def get_transport(self) -> _FakeTransport:
+        return self.transport
+
+    def open_sftp(self) -> _FakeSftpClient:
+        return _FakeSftpClient()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeServer:
+    def __init__(self):
+        self.clients = []
+        self._lock = threading.Lock()
+
+    def connect(self) -> _FakeSshClient:
+        client = _FakeSshClient()
+        with self._lock:
+            self.clients.append(client)
+        return client
+
+
+def test_channels_reused():
+    server = _FakeServer()
+    pool = fs_ops.file_systems.SftpConnectionPool(server.connect, max_connections=2, keepalive_seconds=10)
+    with pool.lease() as channel_1:
+        pass
+    with pool.lease() as channel_2:
+        pass
+    assert channel_1 is channel_2
+    assert len(server.clients) == 1
+    assert server.clients[0].transport.keepalive == 10
+
+
+def test_channels_multiplexed():
+    server = _FakeServer()
+    pool = fs_ops.file_systems.SftpConnectionPool(
+        server.connect, max_connections=2, max_channels_per_connection=3
+    )
+    channels = [pool.acquire() for _ in range(6)]
+    assert len(server.clients) == 2
+    assert pool.get_num_channels() == 6
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+    for channel_i in channels:
+        pool.release(channel_i)
+    assert pool.get_num_connections() == 2
+
+
+def test_waits_for_release():
+    server = _FakeServer()
+    pool = fs_ops.file_systems.SftpConnectionPool(
+        server.connect, max_connections=1, max_channels_per_connection=1
+    )
+    channel = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(channel,)).start()
+    assert pool.acquire(timeout=5) is channel
+
+
+def test_reconnects_after_connection_dies():
+    server = _FakeServer()
+    pool = fs_ops.file_systems.SftpConnectionPool(server.connect, max_connections=1)
+    with pool.lease():
+        pass
+    server.clients[0].transport.active = False
+
+    with pool.lease():
+        pass
+    assert len(server.clients) == 2
+    assert server.clients[0].closed
+    assert pool.get_num_connections() == 1
+
+
+def test_broken_channel_discarded():
+    server = _FakeServer()
+    pool = fs_ops.file_systems.SftpConnectionPool(server.connect)
+    with pytest.raises(EOFError):
+        with pool.lease() as channel_1:
+            raise EOFError()
+    assert channel_1.get_channel().closed
+
+    with pool.lease() as channel_2:
+        assert channel_2 is not channel_1
+    assert len(server.clients) == 1
+
+
+@pytest.fixture(scope="function")
+def fake_server() -> _FakeServer:
+    return _FakeServer()
+
+
+@pytest.fixture(scope="function")
+def sftp_file_system(fake_server, monkeypatch) -> fs_ops.file_systems.SftpFileSystem:
+    pool = fs_ops.file_systems.SftpConnectionPool(
+        fake_server.connect, max_connections=1, max_channels_per_connection=4
+    )
+    monkeypatch.setitem(_sftp_pool._pools, _sftp_pool._get_pool_key("fake-sftp-host", None, None, None), pool)
+    yield fs_ops.file_systems.SftpFileSystem(host="fake-sftp-host")
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def work_dir() -> fs_ops.path_strs.AbsoluteDirPathStr:
+    local_fs = fs_ops.file_systems.LocalFileSystem()
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(str(Path(__file__).parent.joinpath("sftp_pool_test_dir/")))
+    local_fs.make_dir(dir_path, if_exists="raise")
+    yield dir_path
+    local_fs.delete_dir(dir_path, recursive=True, if_non_existent="raise")
+
+
+def test_file_system_shares_connection(fake_server, sftp_file_system, work_dir):
+    def _write_and_read(i: int) -> bytes:
+        file_path = work_dir.joinpath(fs_ops.path_strs.RelFilePathStr(f"file_{i}.txt"))
+        with sftp_file_system.open_file(file_path, "wb") as f:
+            f.write(f"content {i}".encode())
+        assert sftp_file_system.exists(file_path)
+        with sftp_file_system.open_file(file_path, "rb") as f:
+            return f.read()
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(_write_and_read, range(16)))
+
+    assert contents == [f"content {i}".encode() for i in range(16)]
+    assert len(list(sftp_file_system.iter_dir_contents(work_dir))) == 16
+    assert len(fake_server.clients) == 1
+    assert sftp_file_system.get_connection_pool().get_num_channels() <= 4
+
+
+def test_pools_keyed_by_credentials(monkeypatch):
+    monkeypatch.setattr(_sftp_pool, "_pools", {})
+    pool = fs_ops.file_systems.get_sftp_connection_pool("sftp-host", 22, "user", "password-a")
+    assert fs_ops.file_systems.get_sftp_connection_pool("sftp-host", 22, "user", "password-a") is pool
+    assert fs_ops.file_systems.get_sftp_connection_pool("sftp-host", 22, "user", "password-b") is not pool
+    # only a hash of the password is kept in the key
+    assert all("password-a" not in key_i for key_i in _sftp_pool._pools)
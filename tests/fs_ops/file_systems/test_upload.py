@@ -0,0 +1,57 @@
+import pytest
+from pathlib import Path
+
+from spice_rack import fs_ops
+
+
+@pytest.fixture(scope="module")
+def file_system() -> fs_ops.file_systems.LocalFileSystem:
+    return fs_ops.file_systems.LocalFileSystem()
+
+
+@pytest.fixture(scope="function")
+def source_dir(file_system) -> fs_ops.path_strs.AbsoluteDirPathStr:
+    p = Path(__file__).parent.joinpath("upload_source_dir/")
+    p.joinpath("nested/deeper").mkdir(parents=True)
+    p.joinpath("a.txt").write_text("a")
+    p.joinpath("nested/b.txt").write_text("b")
+    p.joinpath("nested/deeper/c.txt").write_text("c")
+    p.joinpath(str(fs_ops._helpers.get_placeholder_rel_path().get_name(include_suffixes=True))).write_text("x")
+
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(str(p))
+    yield dir_path
+    file_system.delete_dir(dir_path, recursive=True, if_non_existent="raise")
+
+
+@pytest.fixture(scope="function")
+def dest_dir(file_system) -> fs_ops.path_strs.AbsoluteDirPathStr:
+    p = Path(__file__).parent.joinpath("upload_dest_dir/")
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr(str(p))
+    yield dir_path
+    file_system.delete_dir(dir_path, recursive=True, if_non_existent="return")
+
+
+def test_upload_file(file_system, source_dir, dest_dir):
+    uploaded = file_system.upload_file_from_local(source_dir.joinpath("a.txt"), dest_dir)
+    assert uploaded == dest_dir.joinpath("a.txt")
+    with file_system.open_file(uploaded, "rb") as f:
+        assert f.read() == b"a"
+
+
+def test_upload_dir(file_system, source_dir, dest_dir):
+    uploaded = file_system.upload_dir_from_local(source_dir, dest_dir, max_workers=2)
+    assert uploaded == dest_dir.joinpath("upload_source_dir/")
+
+    uploaded_files = sorted(
+        str(p)[len(uploaded):] for p in file_system.iter_dir_contents_files_only(uploaded)
+    )
+
+    # placeholder not uploaded
+    assert uploaded_files == ["a.txt", "nested/b.txt", "nested/deeper/c.txt"]
+
+
+def test_dir_path_upload_from(source_dir, dest_dir):
+    dest_dir_obj = fs_ops.DirPath.model_validate(str(dest_dir))
+    uploaded = dest_dir_obj.upload_from(source_dir)
+    assert isinstance(uploaded, fs_ops.DirPath)
+    assert uploaded.joinpath("nested/deeper/c.txt").read_as_str() == "c"
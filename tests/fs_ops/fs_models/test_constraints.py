@@ -3,6 +3,7 @@ from pathlib import Path
 import pydantic
 import typing as t
 import json
+import time
 
 from spice_rack import fs_ops
 
@@ -109,3 +110,52 @@ def test_file_ext_constraint_on_path_str(json_setup_func, text_setup_func):
     # todo: should raise Validation Error but will raise json decoder error for now
     with pytest.raises(pydantic.ValidationError):
         _json_only(text_path)
+
+
+class _ExistsConstrainedModel(pydantic.BaseModel):
+    paths: t.List[t.Annotated[fs_ops.FilePath, fs_ops.ExistsConstraint()]]
+
+
+@pytest.fixture(scope="function")
+def slow_paths(work_dir) -> t.List[t.Dict]:
+    """paths on a file system adding latency to every call, the even ones exist"""
+    file_system = {"class_id": "fault_injecting", "latency": 0.05}
+    raw_paths = []
+    for i in range(20):
+        path_i = work_dir.joinpath(f"exists_{i}.txt")
+        if i % 2 == 0:
+            fs_ops.FilePath.model_validate(path_i).write("x")
+        raw_paths.append({"path": str(path_i), "file_system": file_system})
+    return raw_paths
+
+
+def test_exists_constraint_batched(slow_paths):
+    existing = slow_paths[::2]
+    start = time.perf_counter()
+    model = fs_ops.validate_with_batched_exists_checks(_ExistsConstrainedModel, {"paths": existing})
+    assert time.perf_counter() - start < 0.05 * len(existing)
+    assert len(model.paths) == len(existing)
+
+
+def test_exists_constraint_batched_errors(slow_paths):
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        fs_ops.validate_with_batched_exists_checks(_ExistsConstrainedModel, {"paths": slow_paths})
+    error_locs = [error_i["loc"] for error_i in exc_info.value.errors()]
+    assert error_locs == [("paths", i) for i in range(1, 20, 2)]
+
+
+def test_exists_constraint_batch_cached(slow_paths):
+    batch = fs_ops.ExistsCheckBatch()
+    fs_ops.validate_with_batched_exists_checks(_ExistsConstrainedModel, {"paths": slow_paths[:1]}, batch=batch)
+    assert batch.get_result(fs_ops.FilePath.model_validate(slow_paths[0])) is True
+
+    # the first path was already checked, so only the second one is registered
+    _ExistsConstrainedModel.model_validate({"paths": slow_paths[:2]}, context=batch.as_context())
+    missing = batch.run()
+    assert [str(fs_obj.path) for fs_obj in missing] == [slow_paths[1]["path"]]
+
+
+def test_exists_constraint_unbatched(slow_paths):
+    with pytest.raises(pydantic.ValidationError):
+        _ExistsConstrainedModel.model_validate({"paths": slow_paths[:2]})
+    assert len(_ExistsConstrainedModel.model_validate({"paths": slow_paths[:1]}).paths) == 1
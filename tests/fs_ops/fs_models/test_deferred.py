@@ -75,3 +75,30 @@ def test_deferred_dir_parse_nested(deferred_path_maker, sample_dir):
 
     dir_obj = deferred_dir_obj.evaluate()
     assert dir_obj.as_str() == str(sample_dir) + "/nested_dir/"
+
+
+def test_evaluate_cached_on_env_val(deferred_path_maker, sample_dir):
+    deferred_file_obj = fs_ops.DeferredFilePath.model_validate(deferred_path_maker("file.txt"))
+    assert deferred_file_obj.evaluate() is deferred_file_obj.evaluate()
+
+    key = deferred_file_obj.env_var_key
+    os.environ[key] = str(sample_dir.joinpath("other"))
+    try:
+        assert deferred_file_obj.evaluate().as_str() == str(sample_dir) + "/other/file.txt"
+    finally:
+        os.environ[key] = str(sample_dir)
+    assert deferred_file_obj.evaluate().as_str() == str(sample_dir) + "/file.txt"
+
+
+def test_evaluate_many(deferred_path_maker, sample_dir):
+    raw_strs = [deferred_path_maker(f"nested/file_{i}.txt") for i in range(10)]
+    file_objs = fs_ops.DeferredFilePath.evaluate_many(raw_strs)
+    assert [file_obj.as_str() for file_obj in file_objs] == [
+        str(sample_dir) + f"/nested/file_{i}.txt" for i in range(10)
+    ]
+
+    # every path shares the resolved root's file system
+    assert len({id(file_obj.file_system) for file_obj in file_objs}) == 1
+
+    dir_objs = fs_ops.DeferredDirPath.evaluate_many([deferred_path_maker(""), deferred_path_maker("a/")])
+    assert [dir_obj.as_str() for dir_obj in dir_objs] == [str(sample_dir) + "/", str(sample_dir) + "/a/"]
@@ -53,3 +53,44 @@ def test_dir_parse_gcs(public_bucket):
     from_str = fs_ops.DirPath.model_validate(public_bucket)
     inferred_fs = from_str.file_system  # noqa -- pycharm AI is shitty
     assert isinstance(inferred_fs, fs_ops.file_systems.GcsFileSystem)
+
+
+@pytest.fixture(scope="function")
+def content_dir(dir_obj) -> fs_ops.DirPath:
+    content_dir = dir_obj.joinpath("content_dir/")
+    content_dir.make_self(if_exists="raise")
+    content_dir.joinpath("nested/").make_self(if_exists="raise")
+    for i in range(12):
+        sub_dir = "nested/" if i % 3 == 0 else ""
+        content_dir.joinpath(f"{sub_dir}doc_{i:02d}.json").write(f'{{"i": {i}}}')
+    content_dir.joinpath("notes.txt").write("not json")
+    yield content_dir
+    content_dir.delete(if_non_existent="raise")
+
+
+def test_iter_files_with_content(content_dir):
+    file_system = content_dir.file_system
+    expected = [
+        (content_dir.build_like(stat_i.path), file_system.read_bytes(stat_i.path))
+        for stat_i in file_system.iter_file_stats(content_dir.path)
+    ]
+    assert len(expected) == 13
+    assert list(content_dir.iter_files_with_content(prefetch=4)) == expected
+
+    # a budget smaller than any single file still makes progress
+    assert list(content_dir.iter_files_with_content(prefetch=4, max_buffered_bytes=1)) == expected
+
+
+def test_iter_files_with_content_stops_early(content_dir):
+    iterator = content_dir.iter_files_with_content(prefetch=4)
+    first_path, _ = next(iterator)
+    iterator.close()
+    assert first_path.exists()
+
+
+def test_iter_json(content_dir):
+    docs = list(content_dir.iter_json(recursive=False, prefetch=2))
+    assert [doc_i for _, doc_i in docs] == [{"i": i} for i in range(12) if i % 3 != 0]
+
+    nested_docs = list(content_dir.iter_json())
+    assert sorted(doc_i["i"] for _, doc_i in nested_docs) == list(range(12))
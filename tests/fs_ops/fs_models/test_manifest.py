@@ -0,0 +1,83 @@
+import pytest
+from pathlib import Path
+import polars as pl
+
+from spice_rack import fs_ops
+
+
+@pytest.fixture(scope="function")
+def work_dir() -> fs_ops.DirPath:
+    p = Path(__file__).parent.joinpath("manifest_test_dir/")
+    dir_obj = fs_ops.DirPath.model_validate(str(p) + "/")
+    dir_obj.make_self(if_exists="raise")
+    dir_obj.joinpath("part=1/").make_self()
+    dir_obj.joinpath("part=2/nested/").make_self()
+    dir_obj.joinpath("a.json").write('{"x": 1}')
+    dir_obj.joinpath("part=1/b.txt").write("b")
+    dir_obj.joinpath("part=2/nested/c.json").write("{}" * 1000)
+    yield dir_obj
+    dir_obj.delete(if_non_existent="raise")
+
+
+def test_build_manifest(work_dir):
+    manifest = work_dir.build_manifest(persist=False)
+    assert len(manifest) == 3
+    assert manifest.df.get_column("rel_path").to_list() == [
+        "./a.json", "./part=1/b.txt", "./part=2/nested/c.json"
+    ]
+    assert manifest.df.get_column("prefix").to_list() == ["./", "./part=1/", "./part=2/"]
+    assert manifest.df.schema == fs_ops.DirManifest.get_schema()
+
+
+def test_persist_and_load(work_dir):
+    manifest = work_dir.build_manifest(persist=True)
+    assert manifest.get_default_path().exists()
+
+    loaded = work_dir.load_manifest()
+    assert loaded.df.equals(manifest.df)
+
+    # the manifest file itself is not indexed
+    rebuilt = work_dir.build_manifest(persist=False)
+    assert rebuilt.df.get_column("rel_path").to_list() == manifest.df.get_column("rel_path").to_list()
+
+
+def test_query(work_dir):
+    manifest = work_dir.build_manifest(persist=False)
+    query = manifest.lazy().filter(pl.col("file_ext") == "json", pl.col("size") > 100)
+    found = list(manifest.iter_file_paths(query))
+    assert found == [work_dir.joinpath("part=2/nested/c.json")]
+
+
+def test_refresh_explicit_prefix(work_dir):
+    manifest = work_dir.build_manifest(persist=False)
+    work_dir.joinpath("part=1/d.txt").write("d")
+    work_dir.joinpath("part=2/e.txt").write("e")
+
+    refreshed = manifest.refresh(prefixes=["part=1/"])
+    rel_paths = refreshed.df.get_column("rel_path").to_list()
+    assert "./part=1/d.txt" in rel_paths
+
+    # not re-listed
+    assert "./part=2/e.txt" not in rel_paths
+
+
+def test_refresh_detects_new_prefix(work_dir):
+    manifest = work_dir.build_manifest(persist=False)
+    work_dir.joinpath("part=3/").make_self()
+    work_dir.joinpath("part=3/f.txt").write("f")
+    work_dir.joinpath("part=1/").delete()
+
+    refreshed = manifest.refresh()
+    rel_paths = refreshed.df.get_column("rel_path").to_list()
+    assert rel_paths == ["./a.json", "./part=2/nested/c.json", "./part=3/f.txt"]
+
+
+def test_top_level_listing_retried(work_dir):
+    # the first listing fails, the fingerprint listing goes through the retry policy like the rest
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(
+        failure_rate=1.0, max_faults=1, fault_ops=("list",), retry_max_attempts=2, seed=21
+    )
+    root = fs_ops.DirPath(path=work_dir.path, file_system=file_system)
+    manifest = root.build_manifest(persist=False)
+    assert manifest.df.get_column("prefix").to_list() == ["./", "./part=1/", "./part=2/"]
+    assert manifest.df.get_column("prefix_fingerprint").null_count() == 1
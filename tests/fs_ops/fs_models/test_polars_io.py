@@ -0,0 +1,80 @@
+import pytest
+from pathlib import Path
+import polars as pl
+import pydantic
+
+from spice_rack import fs_ops, gcp_auth
+
+
+@pytest.fixture(scope="module")
+def df() -> pl.DataFrame:
+    return pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "score": [0.5, 1.5, 2.5]})
+
+
+@pytest.fixture(scope="module")
+def local_dir() -> fs_ops.DirPath:
+    dir_path = fs_ops.DirPath.model_validate(str(Path(__file__).parent.joinpath("polars_io_test_dir")) + "/")
+    dir_path.make_self(if_exists="raise")
+    yield dir_path
+    dir_path.delete(recursive=True, if_non_existent="raise")
+
+
+@pytest.fixture(scope="module")
+def memory_dir() -> fs_ops.DirPath:
+    dir_path = fs_ops.DirPath(
+        path=fs_ops.path_strs.AbsoluteDirPathStr("/polars_io_test_dir/"),
+        file_system=fs_ops.file_systems.MemoryFileSystem(),
+    )
+    dir_path.make_self(if_exists="raise")
+    yield dir_path
+    dir_path.delete(recursive=True, if_non_existent="raise")
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "ipc", "csv", "ndjson"])
+@pytest.mark.parametrize("dir_fixture", ["local_dir", "memory_dir"])
+def test_roundtrip(request, df, file_format, dir_fixture):
+    dir_path: fs_ops.DirPath = request.getfixturevalue(dir_fixture)
+    file_path = dir_path.joinpath(f"data.{file_format}")
+    getattr(file_path, f"write_{file_format}")(df.lazy())
+
+    scanned = getattr(file_path, f"scan_{file_format}")()
+    assert isinstance(scanned, pl.LazyFrame)
+    assert scanned.filter(pl.col("id") > 1).select("name").collect().to_series().to_list() == ["b", "c"]
+
+
+def test_local_scan_pushes_down(df, local_dir):
+    file_path = local_dir.joinpath("pushdown.parquet")
+    file_path.write_parquet(df)
+    plan = file_path.scan_parquet().filter(pl.col("id") > 1).select("name").explain()
+    assert "Parquet SCAN" in plan
+    assert "PROJECT 2/3 COLUMNS" in plan
+
+
+def test_storage_options(tmp_path):
+    assert fs_ops.file_systems.LocalFileSystem().get_polars_storage_options() == {}
+    assert fs_ops.file_systems.MemoryFileSystem().get_polars_storage_options() is None
+
+    anon_fs = fs_ops.file_systems.GcsFileSystem(
+        creds=gcp_auth.AnyGcpAuthStrat.model_validate(gcp_auth.auth_strategies.AnonAuthStrategy())
+    )
+    assert anon_fs.get_polars_storage_options() is None
+
+    key_file_fs = fs_ops.file_systems.GcsFileSystem(
+        creds=gcp_auth.AnyGcpAuthStrat.model_validate(
+            gcp_auth.auth_strategies.ServiceAcctKeyFileAuthStrategy(file_path="/secrets/key.json")
+        )
+    )
+    assert key_file_fs.get_polars_storage_options() == {"google_service_account": "/secrets/key.json"}
+
+
+def test_special_file_paths(df, local_dir):
+    parquet_path = fs_ops.ParquetFilePath.model_validate(local_dir.joinpath("special.parquet"))
+    parquet_path.write_df(df)
+    assert parquet_path.scan().collect().equals(df)
+
+    csv_path = fs_ops.CsvFilePath.model_validate(local_dir.joinpath("special.csv"))
+    csv_path.write_df(df)
+    assert csv_path.scan().collect().equals(df)
+
+    with pytest.raises(pydantic.ValidationError):
+        fs_ops.ParquetFilePath.model_validate(local_dir.joinpath("special.csv"))
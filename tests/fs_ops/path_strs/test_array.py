@@ -0,0 +1,75 @@
+import pytest
+
+from spice_rack import fs_ops
+from spice_rack._fs_ops import _helpers
+
+
+_RAW_PATHS = [
+    "/data/part=1/file_1.json",
+    "/data/part=1/archive.tar.gz",
+    "/data/part=2/PLACEHOLDER_7b86519eb4ef4ef5b1e16aeb70329fd6.txt",
+    "/data/part=2/no_ext",
+    "/data/_SPICE_RACK_MANIFEST.parquet",
+    "/top_level.CSV",
+]
+
+
+@pytest.fixture(scope="module")
+def path_objs() -> list:
+    return [fs_ops.path_strs.AbsoluteFilePathStr(raw_path_i) for raw_path_i in _RAW_PATHS]
+
+
+@pytest.fixture(scope="module")
+def path_array() -> fs_ops.path_strs.PathStrArray:
+    return fs_ops.path_strs.PathStrArray.from_strs(_RAW_PATHS)
+
+
+def test_matches_path_str_methods(path_objs, path_array):
+    assert path_array.get_name().to_list() == [path_i.get_name() for path_i in path_objs]
+    assert path_array.get_name(include_suffixes=True).to_list() == [
+        path_i.get_name(include_suffixes=True) for path_i in path_objs
+    ]
+    assert path_array.get_suffixes().to_list() == [
+        [str(suffix_i) for suffix_i in path_i.get_suffixes()] for path_i in path_objs
+    ]
+    assert path_array.get_file_ext().to_list() == [
+        str(path_i.get_file_ext()) if path_i.get_file_ext() else None for path_i in path_objs
+    ]
+    assert path_array.get_parent().to_list() == [path_i.get_parent() for path_i in path_objs]
+    assert path_array.is_placeholder().to_list() == [
+        _helpers.is_placeholder_file_path(path_i) for path_i in path_objs
+    ]
+    assert path_array.is_manifest().to_list() == [
+        _helpers.is_manifest_file_path(path_i) for path_i in path_objs
+    ]
+
+
+def test_typed_values(path_objs, path_array):
+    assert len(path_array) == len(path_objs)
+    assert path_array.to_list() == path_objs
+    assert isinstance(path_array[0], fs_ops.path_strs.AbsoluteFilePathStr)
+
+
+def test_filters(path_array):
+    assert len(path_array.drop_placeholders()) == len(_RAW_PATHS) - 1
+    assert path_array.filter_file_exts([".json", "gz"]).to_list() == _RAW_PATHS[:2]
+
+
+def test_rel_paths_round_trip(path_array):
+    dir_path = fs_ops.path_strs.AbsoluteDirPathStr("/data/")
+    rel_paths = path_array.relative_to(dir_path)
+    assert rel_paths[0] == "./part=1/file_1.json"
+    assert rel_paths[-1] is None
+
+    joined = fs_ops.path_strs.PathStrArray.from_rel_paths(dir_path, rel_paths.drop_nulls())
+    assert joined.to_list() == [
+        dir_path.joinpath(fs_ops.path_strs.RelFilePathStr(rel_path_i)) for rel_path_i in rel_paths.drop_nulls()
+    ]
+
+
+def test_invalid_paths():
+    with pytest.raises(fs_ops.exceptions.InvalidPathStrException):
+        fs_ops.path_strs.PathStrArray.from_strs(["/fine.txt", "relative/path.txt"])
+
+    with pytest.raises(fs_ops.exceptions.InvalidPathStrException):
+        fs_ops.path_strs.PathStrArray.from_strs(["/some/dir/"])
@@ -1,4 +1,5 @@
 import pytest
+from pathlib import Path
 
 from spice_rack import fs_ops
 
@@ -18,3 +19,53 @@ def test_file_ext_to_mime_type_good():
 
 def test_file_ext_to_mime_type_unknown_mime():
     assert fs_ops.file_info.FileExt("xxx").get_mime_type() is None
+
+
+def test_possible_file_extensions():
+    assert "pdf" in fs_ops.file_info.MimeType("application/pdf").get_possible_file_extensions()
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (b"%PDF-1.7\n...", "application/pdf"),
+        (b"PAR1\x15\x04", "application/vnd.apache.parquet"),
+        (b"\x1f\x8b\x08\x00", "application/gzip"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"a" * 257 + b"ustar\x0000", "application/x-tar"),
+        (b'  {"k": 1}', "application/json"),
+        (b"<?xml version='1.0'?><a/>", "text/xml"),
+        (b"a,b,c\n1,2,3\n4,5,6\n", "text/csv"),
+        (b"some text", "text/plain"),
+        (b"\x00\x01\x02\x03", None),
+        (b"BZh91AY&SY\x8f\x1b", "application/x-bzip2"),
+        (b"BZh is not a bzip2 file", "text/plain"),
+        (b"ORC\x11\x00\x00\x0a\x06", "application/vnd.apache.orc"),
+        (b"ORCA,1\nORCHID,2\n", "text/csv"),
+    ]
+)
+def test_sniff_mime_type(header, expected):
+    assert fs_ops.file_info.sniff_mime_type(header) == expected
+
+
+@pytest.fixture(scope="function")
+def sniff_dir() -> fs_ops.DirPath:
+    dir_obj = fs_ops.DirPath.model_validate(str(Path(__file__).parent.joinpath("sniff_test_dir")) + "/")
+    dir_obj.make_self(if_exists="raise")
+    yield dir_obj
+    dir_obj.delete(if_non_existent="raise")
+
+
+def test_file_path_sniff(sniff_dir):
+    pdf_path = sniff_dir.joinpath("no_ext_pdf")
+    pdf_path.write(b"%PDF-1.4\n" + b"x" * 10_000)
+    csv_path = sniff_dir.joinpath("no_ext_csv")
+    csv_path.write("a,b\n1,2\n")
+    binary_path = sniff_dir.joinpath("binary.json")
+    binary_path.write(b"\x00\x01")
+
+    assert len(pdf_path.read_header()) == fs_ops.file_info.get_sniff_header_size()
+    assert fs_ops.FilePath.sniff_many([pdf_path, csv_path, binary_path]) == [
+        "application/pdf", "text/csv", "application/json"
+    ]
+    assert binary_path.sniff_mime_type(fallback_to_file_ext=False) is None
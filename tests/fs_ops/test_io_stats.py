@@ -0,0 +1,95 @@
+import io
+import pytest
+from pathlib import Path
+import polars as pl
+
+from spice_rack import fs_ops
+
+
+@pytest.fixture(scope="function")
+def io_stats() -> fs_ops.io_stats.IoStats:
+    fs_ops.io_stats.reset_io_stats()
+    yield fs_ops.io_stats.get_io_stats()
+    fs_ops.io_stats.reset_io_stats()
+
+
+@pytest.fixture(scope="function")
+def file_path() -> fs_ops.FilePath:
+    fp = fs_ops.FilePath.model_validate(Path(__file__).parent.joinpath("io_stats_file.bin"))
+    yield fp
+    fp.delete(if_non_existent="return")
+
+
+def test_ops_recorded(io_stats, file_path):
+    file_path.write(b"x" * 100)
+    assert file_path.read_as_str() == "x" * 100
+    file_path.delete()
+
+    local_stats = io_stats.to_dict()["local"]
+    assert local_stats["open"]["count"] == 2
+    assert local_stats["write"]["bytes_written"] == 100
+    assert local_stats["read"]["bytes_read"] == 100
+    # the bytes are only counted under 'read' and 'write'
+    assert local_stats["open"]["bytes_read"] == local_stats["open"]["bytes_written"] == 0
+    assert local_stats["delete"]["count"] == 1
+    assert local_stats["exists"]["count"] >= 1
+    assert sum(local_stats["open"]["latency_histogram"]) == 2
+
+
+def test_errors_recorded(io_stats):
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(failure_rate=1.0, seed=7)
+    with pytest.raises(fs_ops.file_systems.InjectedFaultError):
+        file_system.exists(fs_ops.path_strs.AbsoluteDirPathStr("/"))
+
+    assert io_stats.to_dict()["fault_injecting"]["exists"]["errors"] == 1
+
+
+def test_remote_reads_recorded(io_stats, file_path):
+    file_path.write(b"y" * 1000)
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(seed=8)
+    with file_system.open_file(file_path.path, "rb", block_size=100, cache_type="none") as f:
+        while f.read(100):
+            pass
+
+    stats = io_stats.to_dict()["fault_injecting"]
+    assert stats["read"]["count"] == 10
+    assert stats["read"]["bytes_read"] == 1000
+    assert stats["open"]["bytes_read"] == 0
+
+
+def test_to_df(io_stats, file_path):
+    file_path.write(b"z")
+    df = io_stats.to_df()
+    assert df.filter(pl.col("file_system_type") == "local", pl.col("op") == "open").height == 1
+    assert len(df.get_column("latency_histogram")[0]) == len(fs_ops.io_stats.get_latency_bucket_bounds()) + 1
+
+
+def test_disabled(io_stats, file_path):
+    fs_ops.io_stats.set_io_stats_enabled(False)
+    try:
+        file_path.write(b"z")
+    finally:
+        fs_ops.io_stats.set_io_stats_enabled(True)
+    assert io_stats.to_rows() == []
+
+
+def test_logger(io_stats, file_path, caplog):
+    file_path.write(b"z")
+    fs_ops.io_stats.IoStatsLogger(interval_seconds=0.01).start().stop()
+    assert any(record.msg == "file system io stats" for record in caplog.records)
+
+
+def test_text_counted_as_bytes(io_stats):
+    text = "naïve café ✓\n" * 10
+    with fs_ops.io_stats.CountingFile(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"), "text") as f:
+        f.write(text)
+        f.seek(0)
+        assert f.read() == text
+    # the bom is only counted once
+    utf_16_file = io.TextIOWrapper(io.BytesIO(text.encode("utf-16")), encoding="utf-16")
+    with fs_ops.io_stats.CountingFile(utf_16_file, "text") as f:
+        assert list(f) == text.splitlines(keepends=True)
+
+    text_stats = io_stats.to_dict()["text"]
+    assert text_stats["write"]["bytes_written"] == len(text.encode("utf-8"))
+    assert text_stats["read"]["bytes_read"] == len(text.encode("utf-8")) + len(text.encode("utf-16"))
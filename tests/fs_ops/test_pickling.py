@@ -0,0 +1,62 @@
+import pickle
+from concurrent import futures
+
+from spice_rack import fs_ops
+
+
+def _describe(file_path: fs_ops.FilePath) -> tuple:
+    return file_path.get_name(include_suffixes=True), file_path.file_system.get_config_fingerprint()
+
+
+def test_round_trip():
+    file_path = fs_ops.JsonFilePath.model_validate("/tmp/some_dir/file.json")
+    restored = pickle.loads(pickle.dumps(file_path))
+    assert type(restored) is fs_ops.JsonFilePath
+    assert restored == file_path
+    assert restored.model_dump() == file_path.model_dump()
+
+    dir_path = fs_ops.DirPath.model_validate("/tmp/some_dir/")
+    restored_dir = pickle.loads(pickle.dumps(dir_path))
+    assert restored_dir == dir_path
+    assert isinstance(restored_dir.path, fs_ops.path_strs.AbsoluteDirPathStr)
+
+
+def test_file_system_reused():
+    file_system = fs_ops.file_systems.LocalFileSystem(read_block_size=1024)
+    same_config = fs_ops.file_systems.LocalFileSystem(read_block_size=1024)
+    assert file_system.get_config_fingerprint() == same_config.get_config_fingerprint()
+    assert file_system.get_config_fingerprint() != fs_ops.file_systems.LocalFileSystem().get_config_fingerprint()
+
+    restored = pickle.loads(pickle.dumps(same_config))
+    assert restored is file_system
+
+
+def test_file_system_cache_bounded(monkeypatch):
+    monkeypatch.setattr(fs_ops.file_systems._base, "_FILE_SYSTEM_CACHE_MAX_SIZE", 4)
+    file_systems = [fs_ops.file_systems.LocalFileSystem(read_block_size=2048 + i) for i in range(10)]
+    fingerprints = [file_system_i.get_config_fingerprint() for file_system_i in file_systems]
+    cache = fs_ops.file_systems._base._file_system_cache
+    assert len(cache) <= 4
+    assert list(cache)[-4:] == fingerprints[-4:]
+
+    # an evicted config is rebuilt from its json
+    restored = pickle.loads(pickle.dumps(file_systems[0]))
+    assert restored is not file_systems[0]
+    assert restored.get_config_fingerprint() == fingerprints[0]
+
+
+def test_compact_payload():
+    file_paths = [
+        fs_ops.FilePath.model_validate(f"/tmp/some_dir/file_{i}.txt") for i in range(1000)
+    ]
+    payload = pickle.dumps(file_paths)
+    # the file system config is written once, not per path
+    assert len(payload) < 50 * len(file_paths)
+    assert pickle.loads(payload) == file_paths
+
+
+def test_process_pool():
+    file_paths = [fs_ops.FilePath.model_validate(f"/tmp/some_dir/file_{i}.txt") for i in range(10)]
+    with futures.ProcessPoolExecutor(max_workers=2) as executor:
+        res = list(executor.map(_describe, file_paths))
+    assert res == [_describe(file_path_i) for file_path_i in file_paths]
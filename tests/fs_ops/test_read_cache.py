@@ -0,0 +1,98 @@
+import pytest
+from pathlib import Path
+
+from spice_rack import fs_ops
+
+
+_DATA = bytes(range(256)) * 40
+
+
+class _CountingFetcher:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start: int, stop: int) -> bytes:
+        self.calls.append((start, stop))
+        return _DATA[start:stop]
+
+
+@pytest.fixture(scope="function")
+def store() -> fs_ops.read_cache.SharedBlockStore:
+    return fs_ops.read_cache.SharedBlockStore(max_bytes=4096)
+
+
+def test_shared_cache_reused_across_opens(store):
+    fetcher = _CountingFetcher()
+    cache = fs_ops.read_cache.SharedBlockCache(1000, fetcher, len(_DATA), key="obj", store=store)
+    assert cache._fetch(10, 2500) == _DATA[10:2500]
+    assert fetcher.calls == [(0, 3000)]
+
+    # a second "open" of the same object reuses the blocks
+    other_fetcher = _CountingFetcher()
+    other_cache = fs_ops.read_cache.SharedBlockCache(1000, other_fetcher, len(_DATA), key="obj", store=store)
+    assert other_cache._fetch(1500, 3500) == _DATA[1500:3500]
+    assert other_fetcher.calls == [(3000, 4000)]
+
+
+def test_shared_cache_key_isolates_versions(store):
+    fetcher = _CountingFetcher()
+    fs_ops.read_cache.SharedBlockCache(1000, fetcher, len(_DATA), key="obj|v1", store=store)._fetch(0, 10)
+    fs_ops.read_cache.SharedBlockCache(1000, fetcher, len(_DATA), key="obj|v2", store=store)._fetch(0, 10)
+    assert len(fetcher.calls) == 2
+
+
+def test_shared_store_bounded(store):
+    fetcher = _CountingFetcher()
+    cache = fs_ops.read_cache.SharedBlockCache(1000, fetcher, len(_DATA), key="obj", store=store)
+    assert cache._fetch(0, len(_DATA)) == _DATA
+    assert store.num_bytes <= store.max_bytes
+
+
+def test_config_merge():
+    base = fs_ops.ReadCacheConfig(block_size=10, cache_type="readahead")
+    merged = base.merge(fs_ops.ReadCacheConfig(cache_type="shared"))
+    assert merged.block_size == 10
+    assert merged.cache_type == "shared"
+
+
+def test_local_open_with_cache_kwargs():
+    fp = fs_ops.FilePath.model_validate(Path(__file__).parent.joinpath("read_cache_file.bin"))
+    fp.write(_DATA)
+    try:
+        with fp.open("rb", block_size=1000, cache_type="shared") as f:
+            assert f.read() == _DATA
+    finally:
+        fp.delete()
+
+
+def test_open_missing_file_raises():
+    fp = fs_ops.FilePath.model_validate(Path(__file__).parent.joinpath("read_cache_missing.bin"))
+    with pytest.raises(fs_ops.exceptions.NonExistentPathException):
+        fp.open("rb")
+
+
+def test_shared_cache_key_isolates_block_sizes(store):
+    fetcher = _CountingFetcher()
+    fs_ops.read_cache.SharedBlockCache(1000, fetcher, len(_DATA), key="obj", store=store)._fetch(0, 10)
+    cache = fs_ops.read_cache.SharedBlockCache(2000, fetcher, len(_DATA), key="obj", store=store)
+    assert cache._fetch(0, 1500) == _DATA[0:1500]
+    assert fetcher.calls == [(0, 1000), (0, 2000)]
+
+
+def test_shared_open_mixed_block_sizes():
+    file_system = fs_ops.file_systems.FaultInjectingFileSystem(wrapped_protocol="memory")
+    path = fs_ops.path_strs.AbsoluteFilePathStr("/read-cache/mixed_block_sizes.bin")
+    data = bytes(range(256)) * 64
+    file_system.fsspec_obj.pipe_file(file_system.contextualize_abs_path(path), data)
+    try:
+        for block_size in (1024, 4096):
+            with file_system.open_file(path, "rb", block_size=block_size, cache_type="shared") as f:
+                assert f.read() == data
+
+        # rewritten at the same size, the new version's blocks are read
+        new_data = bytes(reversed(data))
+        file_system.fsspec_obj.pipe_file(file_system.contextualize_abs_path(path), new_data)
+        with file_system.open_file(path, "rb", block_size=4096, cache_type="shared") as f:
+            assert f.read() == new_data
+    finally:
+        file_system.fsspec_obj.rm_file(file_system.contextualize_abs_path(path))
@@ -0,0 +1,107 @@
+import datetime as dt
+import time
+import pytest
+import polars as pl
+
+from spice_rack import polars_service, fs_ops
+
+
+@pytest.fixture(scope="function")
+def input_path(tmp_path) -> str:
+    path = str(tmp_path.joinpath("input.parquet"))
+    pl.DataFrame({"group": [1, 1, 2], "val": [1.0, 2.0, 3.0]}).write_parquet(path)
+    return path
+
+
+@pytest.fixture(scope="function", params=["local", "memory"])
+def store(request, tmp_path) -> fs_ops.DirPath:
+    if request.param == "local":
+        store = fs_ops.DirPath.model_validate(str(tmp_path.joinpath("cache")) + "/")
+    else:
+        store = fs_ops.DirPath(
+            path=fs_ops.path_strs.AbsoluteDirPathStr(f"/cache_test_{time.time_ns()}/"),
+            file_system=fs_ops.file_systems.MemoryFileSystem(),
+        )
+    yield store
+    store.delete(recursive=True, if_non_existent="return")
+
+
+def _build_plan(input_path: str) -> pl.LazyFrame:
+    return pl.scan_parquet(input_path).group_by("group").agg(pl.col("val").sum()).sort("group")
+
+
+def _get_entries(store: fs_ops.DirPath) -> list:
+    return list(store.file_system.iter_file_stats(store.path, recursive=False))
+
+
+def test_hit_and_miss(input_path, store):
+    expected = _build_plan(input_path).collect()
+    missed = polars_service.cache_lazy(_build_plan(input_path), store)
+    assert missed.collect().equals(expected)
+
+    hit = polars_service.cache_lazy(_build_plan(input_path), store)
+    assert "input.parquet" not in hit.explain()
+    assert hit.collect().equals(expected)
+    assert len(_get_entries(store)) == 1
+
+    # a rewritten input is a new key
+    pl.DataFrame({"group": [3], "val": [4.0]}).write_parquet(input_path)
+    assert polars_service.cache_lazy(_build_plan(input_path), store).collect().rows() == [(3, 4.0)]
+    assert len(_get_entries(store)) == 2
+
+
+def test_plan_key(input_path):
+    assert polars_service.get_plan_key(_build_plan(input_path)) == polars_service.get_plan_key(_build_plan(input_path))
+    assert polars_service.get_plan_key(_build_plan(input_path)) != polars_service.get_plan_key(
+        _build_plan(input_path).limit(1)
+    )
+
+
+def test_eviction(input_path, store):
+    for i in range(3):
+        polars_service.cache_lazy(_build_plan(input_path).with_columns(pl.lit(i).alias("i")), store)
+    entries = _get_entries(store)
+    assert len(entries) == 3
+
+    max_bytes = sum(entry_i.size for entry_i in entries) - 1
+    assert polars_service.evict_cache(store, max_bytes=max_bytes) == 1
+    assert len(_get_entries(store)) == 2
+
+    assert polars_service.evict_cache(store, ttl=dt.timedelta(days=1)) == 0
+    assert polars_service.evict_cache(store, ttl=dt.timedelta(0)) == 2
+
+
+def test_written_atomically(input_path, store, monkeypatch):
+    file_system_cls = type(store.file_system)
+    move_file = file_system_cls.move_file
+    moved = []
+
+    def _move_file(self, source_path, dest_path):
+        # the entry only appears once it is complete
+        assert not self.exists(dest_path)
+        assert source_path.get_file_ext() == "tmp"
+        moved.append(dest_path)
+        return move_file(self, source_path, dest_path)
+
+    monkeypatch.setattr(file_system_cls, "move_file", _move_file)
+    polars_service.cache_lazy(_build_plan(input_path), store)
+    assert [entry_i.path for entry_i in _get_entries(store)] == moved
+
+    def _write_parquet(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(fs_ops.FilePath, "write_parquet", _write_parquet)
+    with pytest.raises(OSError):
+        polars_service.cache_lazy(_build_plan(input_path).limit(1), store)
+    assert [entry_i.path for entry_i in _get_entries(store)] == moved
+
+
+def test_input_file_system(input_path, store, monkeypatch):
+    def _infer_file_system(_raw_path):
+        raise AssertionError("the input file system should not be inferred")
+
+    monkeypatch.setattr(fs_ops.file_systems, "infer_file_system", _infer_file_system)
+    file_system = fs_ops.file_systems.LocalFileSystem()
+    key = polars_service.get_plan_key(_build_plan(input_path), file_system=file_system)
+    polars_service.cache_lazy(_build_plan(input_path), store, file_system=file_system)
+    assert [entry_i.path.get_name(include_suffixes=True) for entry_i in _get_entries(store)] == [f"{key}.parquet"]
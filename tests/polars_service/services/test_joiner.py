@@ -0,0 +1,112 @@
+import datetime as dt
+import pytest
+import polars as pl
+
+from spice_rack import polars_service
+
+
+@pytest.fixture(scope="module")
+def feature_dfs() -> list:
+    return [
+        pl.DataFrame({"id": [1, 2, 3], "day": [1, 1, 2], "value": [10, 20, 30]}),
+        pl.DataFrame({"id": [1, 2, 4], "day": [1, 1, 2], "value": [100, 200, 400]}).lazy(),
+        pl.DataFrame({"id": [1, 3], "day": [1, 2], "value": [1000, 3000]}),
+    ]
+
+
+def test_join_is_lazy(feature_dfs):
+    joined = polars_service.join_dfs(feature_dfs, join_on=["id", "day"], suffix=["_b", "_c"])
+    assert isinstance(joined, pl.LazyFrame)
+    assert joined.collect().to_dicts() == [
+        {"id": 1, "day": 1, "value": 10, "value_b": 100, "value_c": 1000}
+    ]
+
+
+def test_join_pushes_down_projections(feature_dfs):
+    joined = polars_service.join_dfs(feature_dfs, join_on="id", how="left", suffix=["_b", "_c"])
+    plan = joined.select("id", "value_b").explain()
+    # the inputs are only read for the columns we need
+    assert "PROJECT 1/3 COLUMNS" in plan
+
+
+def test_join_left_on_right_on(feature_dfs):
+    renamed = [feature_dfs[0], feature_dfs[1].rename({"id": "other_id"})]
+    joined = polars_service.join_dfs(renamed, left_on="id", right_on="other_id", how="left").collect()
+    assert joined.get_column("value_right").to_list() == [100, 200, None]
+
+
+def test_join_cross_and_asof():
+    left = pl.DataFrame({"ts": [dt.datetime(2024, 1, 1, h) for h in (1, 3, 5)], "x": [1, 2, 3]}).set_sorted("ts")
+    right = pl.DataFrame({"ts": [dt.datetime(2024, 1, 1, h) for h in (0, 4)], "y": ["a", "b"]}).set_sorted("ts")
+
+    assert polars_service.join_dfs([left, right], how="cross").collect().height == 6
+
+    asof_joined = polars_service.join_dfs([left, right], join_on="ts", how="asof", asof_tolerance="2h")
+    assert asof_joined.collect().get_column("y").to_list() == ["a", None, "b"]
+
+    asof_joined = polars_service.join_dfs([left, right], join_on=["ts"], how="asof", asof_tolerance="2h")
+    assert asof_joined.collect().get_column("y").to_list() == ["a", None, "b"]
+    with pytest.raises(ValueError):
+        polars_service.join_dfs([left, right], join_on=["ts", "x"], how="asof")
+    with pytest.raises(ValueError):
+        polars_service.join_dfs([left, right], left_on=["ts", "x"], right_on="ts", how="asof")
+
+
+def test_join_invalid_args(feature_dfs):
+    with pytest.raises(ValueError):
+        polars_service.join_dfs(feature_dfs)
+    with pytest.raises(ValueError):
+        polars_service.join_dfs(feature_dfs, join_on="id", suffix=["_b"])
+    with pytest.raises(ValueError):
+        polars_service.join_dfs(feature_dfs, join_on="id", how="cross")
+
+
+def test_collect_all(feature_dfs):
+    plans = [df_i.lazy().filter(pl.col("id") < 3) for df_i in feature_dfs] + [feature_dfs[0]]
+    collected = polars_service.collect_all(plans, streaming=True)
+    assert [df_i.height for df_i in collected] == [2, 2, 1, 3]
+    assert all(isinstance(df_i, pl.DataFrame) for df_i in collected)
+
+
+@pytest.fixture(scope="module")
+def partition_dfs() -> list:
+    return [
+        pl.DataFrame({"id": [1, 2], "value": [1, 2]}, schema={"id": pl.Int64, "value": pl.Int32}),
+        pl.DataFrame({"value": [3.5], "id": [3]}).lazy(),
+        pl.DataFrame({"id": [4], "extra": ["x"]}),
+    ]
+
+
+def test_stack_strict(partition_dfs):
+    stacked = polars_service.stack_dfs(partition_dfs[:2]).collect()
+    assert stacked.schema == {"id": pl.Int64, "value": pl.Int32}
+    assert stacked.get_column("value").to_list() == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        polars_service.stack_dfs(partition_dfs)
+
+
+def test_stack_supertype(partition_dfs):
+    dfs = [partition_dfs[0], partition_dfs[1].select("id", "value")]
+    stacked = polars_service.stack_dfs(dfs, how="supertype").collect()
+    assert stacked.get_column("value").to_list() == [1.0, 2.0, 3.5]
+
+
+def test_stack_diagonal(partition_dfs):
+    stacked = polars_service.stack_dfs(
+        partition_dfs, how="diagonal_supertype", source_col="day", source_tags=["d1", "d2", "d3"]
+    ).collect()
+    assert stacked.columns == ["id", "value", "day", "extra"]
+    assert stacked.get_column("extra").to_list() == [None, None, None, "x"]
+    assert stacked.get_column("day").to_list() == ["d1", "d1", "d2", "d3"]
+
+
+def test_stack_in_memory(partition_dfs):
+    dfs = [partition_dfs[0]] * 3
+    stacked = polars_service.stack_dfs(dfs, how="diagonal", source_col="part")
+    assert isinstance(stacked, pl.LazyFrame)
+    collected = stacked.collect()
+    assert collected.get_column("part").to_list() == [0, 0, 1, 1, 2, 2]
+    assert collected.n_chunks() == 3
+
+    assert polars_service.stack_dfs(dfs, rechunk=True).collect().n_chunks() == 1
@@ -0,0 +1,52 @@
+import io
+import json
+from pathlib import Path
+import pytest
+import polars as pl
+
+from spice_rack import polars_service
+
+
+@pytest.fixture(scope="module")
+def df() -> pl.DataFrame:
+    return pl.DataFrame({"a": list(range(25)), "b": [f"row_{i}" for i in range(25)]})
+
+
+def test_write_ndjson_batched(df):
+    buffer = io.BytesIO()
+    assert polars_service.write_ndjson(df, buffer, batch_size=10) == 25
+
+    lines = buffer.getvalue().decode().splitlines()
+    assert [json.loads(line_i) for line_i in lines] == df.to_dicts()
+
+
+def test_write_ndjson_lazy_to_path(df):
+    file_path = Path(__file__).parent.joinpath("ndjson_test_file.ndjson")
+    try:
+        assert polars_service.write_ndjson(df.lazy().filter(pl.col("a") < 5), file_path) == 5
+        assert pl.read_ndjson(file_path).to_dicts() == df.head(5).to_dicts()
+    finally:
+        file_path.unlink(missing_ok=True)
+
+
+def test_write_ndjson_lazy_sunk(df, tmp_path, monkeypatch):
+    def _collect(*_args, **_kwargs):
+        raise AssertionError("the LazyFrame should be sunk, not collected")
+
+    monkeypatch.setattr(pl.LazyFrame, "collect", _collect)
+    file_path = tmp_path.joinpath("sunk.ndjson")
+    assert polars_service.write_ndjson(df.lazy().filter(pl.col("a") >= 20), file_path) == 5
+    monkeypatch.undo()
+    assert pl.read_ndjson(file_path).to_dicts() == df.tail(5).to_dicts()
+
+
+def test_write_ndjson_lazy_batched(df, tmp_path):
+    buffer = io.BytesIO()
+    assert polars_service.write_ndjson(df.lazy(), buffer, batch_size=10) == 25
+    assert [json.loads(line_i) for line_i in buffer.getvalue().decode().splitlines()] == df.to_dicts()
+
+    # the streaming engine can't sink a cumulative sum, so it is written in batches
+    file_path = tmp_path.joinpath("batched.ndjson")
+    lazy_df = df.lazy().with_columns(pl.col("a").cum_sum())
+    assert polars_service.write_ndjson(lazy_df, file_path, batch_size=10) == 25
+    assert pl.read_ndjson(file_path).to_dicts() == lazy_df.collect().to_dicts()
@@ -0,0 +1,111 @@
+import enum
+import datetime as dt
+import typing as t
+import pytest
+import pydantic
+import polars as pl
+
+import spice_rack
+from spice_rack import polars_service, bases, ts_service, guid_service
+
+
+class _Side(str, enum.Enum):
+    BUY = "buy"
+    SELL = "sell"
+
+
+class _Key(bases.special_str.SpecialStrBase):
+    @classmethod
+    def _format_str_val(cls, root_data: str) -> str:
+        return root_data.lower()
+
+
+class _Record(bases.ValueModelBase):
+    guid: spice_rack.GuidT
+    key: _Key
+    side: _Side
+    ts: ts_service.Timestamp
+    day: dt.date
+    qty: int
+    note: t.Optional[str] = None
+
+
+@pytest.fixture(scope="function")
+def records() -> t.List[_Record]:
+    return [
+        _Record(
+            guid=guid_service.gen_guid(),
+            key=f"KEY_{i % 2}",
+            side=_Side.BUY if i % 2 else _Side.SELL,
+            ts=ts_service.Timestamp(microseconds=1_700_000_000_000_000 + i, tz="America/New_York"),
+            day=dt.date(2024, 1, 1 + i),
+            qty=i,
+            note=None if i else "first",
+        )
+        for i in range(3)
+    ]
+
+
+def test_models_to_df(records):
+    df = polars_service.models_to_df(records)
+    assert df.schema == {
+        "guid": pl.Utf8,
+        "key": pl.Categorical,
+        "side": pl.Utf8,
+        "ts": pl.Datetime("us", "America/New_York"),
+        "day": pl.Date,
+        "qty": pl.Int64,
+        "note": pl.Utf8,
+    }
+    assert df.get_column("key").cast(pl.Utf8).to_list() == ["key_0", "key_1", "key_0"]
+    assert df.get_column("ts").dt.epoch("us").to_list() == [record_i.ts.microseconds for record_i in records]
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_roundtrip(records, trusted):
+    loaded = polars_service.df_to_models(polars_service.models_to_df(records), _Record, trusted=trusted)
+    assert loaded == records
+    assert all(isinstance(record_i.key, _Key) for record_i in loaded)
+    assert all(isinstance(record_i.ts.tz, ts_service.TimeZoneKey) for record_i in loaded)
+
+
+def test_validated_unless_trusted(records):
+    df = polars_service.models_to_df(records).with_columns(pl.lit("hold").alias("side"))
+    with pytest.raises(pydantic.ValidationError):
+        polars_service.df_to_models(df, _Record)
+
+
+def test_mixed_timezones(records):
+    records[0] = records[0].model_copy(update={"ts": records[0].ts.as_utc()})
+    df = polars_service.models_to_df(records)
+    assert df.schema["ts"] == pl.Datetime("us", "UTC")
+    loaded = polars_service.df_to_models(df, _Record, trusted=True)
+    assert [record_i.ts.microseconds for record_i in loaded] == [record_i.ts.microseconds for record_i in records]
+
+
+def test_missing_columns_defaulted(records):
+    df = polars_service.models_to_df(records).drop("note")
+    loaded = polars_service.df_to_models(df, _Record, trusted=True)
+    assert [record_i.note for record_i in loaded] == [None] * 3
+
+
+class _Event(bases.ValueModelBase):
+    at: t.Optional[dt.datetime] = None
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+@pytest.mark.parametrize("aware", [True, False])
+def test_datetime_roundtrip(trusted, aware):
+    tz = dt.timezone(dt.timedelta(hours=5)) if aware else None
+    events = [_Event(at=dt.datetime(2024, 1, 1, 12, tzinfo=tz)), _Event(at=dt.datetime(2024, 6, 1, 8, 30, tzinfo=tz))]
+    df = polars_service.models_to_df(events)
+    assert df.schema["at"] == (pl.Datetime("us", "UTC") if aware else pl.Datetime("us"))
+    loaded = polars_service.df_to_models(df, _Event, trusted=trusted)
+    assert loaded == events
+    assert all((event_i.at.tzinfo is not None) == aware for event_i in loaded)
+
+
+def test_mixed_naive_and_aware_datetimes():
+    events = [_Event(at=dt.datetime(2024, 1, 1, 12)), _Event(at=dt.datetime(2024, 1, 1, 12, tzinfo=dt.timezone.utc))]
+    with pytest.raises(ValueError):
+        polars_service.models_to_df(events)
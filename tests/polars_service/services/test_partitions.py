@@ -0,0 +1,48 @@
+import os
+import pytest
+import polars as pl
+
+from spice_rack import polars_service
+
+
+def _add_pid(df: pl.DataFrame) -> pl.DataFrame:
+    return df.with_columns(
+        (pl.col("x") * 2).alias("doubled"),
+        pl.lit(os.getpid()).alias("pid"),
+    )
+
+
+def _count_groups(df: pl.DataFrame) -> pl.LazyFrame:
+    return df.lazy().group_by("group").agg(pl.len().alias("count"))
+
+
+@pytest.fixture(scope="module")
+def sample_df() -> pl.DataFrame:
+    return pl.DataFrame({"x": list(range(100)), "group": [i % 3 for i in range(100)]})
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_chunks(sample_df, executor):
+    res = polars_service.map_partitions(sample_df, _add_pid, n_chunks=4, executor=executor, max_workers=2)
+    assert isinstance(res, pl.LazyFrame)
+    collected = res.collect()
+    assert collected.get_column("doubled").to_list() == [i * 2 for i in range(100)]
+    if executor == "process":
+        assert os.getpid() not in collected.get_column("pid").to_list()
+    else:
+        assert collected.get_column("pid").unique().to_list() == [os.getpid()]
+
+
+def test_partition_by(sample_df):
+    res = polars_service.map_partitions(sample_df.lazy(), _count_groups, partition_by="group", executor="thread")
+    assert res.collect().rows() == [(0, 34), (1, 33), (2, 33)]
+
+
+def test_empty(sample_df):
+    res = polars_service.map_partitions(sample_df.clear(), _count_groups, partition_by="group", executor="thread")
+    assert res.collect().columns == ["group", "count"]
+
+
+def test_invalid_args(sample_df):
+    with pytest.raises(ValueError):
+        polars_service.map_partitions(sample_df, _add_pid, partition_by="group", n_chunks=2)
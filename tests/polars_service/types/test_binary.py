@@ -0,0 +1,85 @@
+import datetime as dt
+import typing as t
+import pytest
+import polars as pl
+import pydantic
+
+from spice_rack import polars_service, bases
+
+
+@pytest.fixture(scope="module")
+def typed_df() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "small_int": pl.Series([1, 2, None], dtype=pl.Int8),
+            "category": pl.Series(["a", "b", "a"], dtype=pl.Categorical),
+            "ts": pl.Series([dt.datetime(2024, 1, 1)] * 3, dtype=pl.Datetime("ms", "UTC")),
+            "amount": pl.Series([1.5, None, 2.25], dtype=pl.Float32),
+            "day": pl.Series([dt.date(2024, 1, 1)] * 3, dtype=pl.Date),
+            "nested": [[1, 2], [], None],
+        }
+    )
+
+
+class _CacheModel(bases.ValueModelBase):
+    name: str
+    ipc_df: polars_service.types.PolarsDfIpcT
+    parquet_df: polars_service.types.PolarsDfParquetT
+    lazy_df: polars_service.types.PolarsLazyDfIpcT
+    lz4_df: t.Annotated[pl.DataFrame, polars_service.types.PolarsBinarySerialization("ipc", compression="lz4")]
+
+
+@pytest.fixture(scope="module")
+def cache_model(typed_df) -> _CacheModel:
+    return _CacheModel(name="x", ipc_df=typed_df, parquet_df=typed_df, lazy_df=typed_df, lz4_df=typed_df)
+
+
+def _assert_same(model: _CacheModel, typed_df: pl.DataFrame) -> None:
+    for df_i in [model.ipc_df, model.parquet_df, model.lazy_df.collect(), model.lz4_df]:
+        assert df_i.schema == typed_df.schema
+        assert df_i.equals(typed_df)
+
+
+def test_python_roundtrip(cache_model, typed_df):
+    dumped = cache_model.model_dump()
+    assert isinstance(dumped["ipc_df"], bytes)
+    assert dumped["parquet_df"][:4] == b"PAR1"
+    _assert_same(_CacheModel.model_validate(dumped), typed_df)
+
+
+def test_json_roundtrip(cache_model, typed_df):
+    assert isinstance(cache_model.model_dump(mode="json")["ipc_df"], str)
+    _assert_same(_CacheModel.model_validate_json(cache_model.model_dump_json()), typed_df)
+    _assert_same(_CacheModel.model_validate(cache_model.model_dump(mode="json")), typed_df)
+
+
+def test_accepts_df_inputs(typed_df):
+    lazy_df = polars_service.types.PolarsLazyDfIpcTypeAdapter.validate_python(typed_df)
+    assert isinstance(lazy_df, pl.LazyFrame)
+
+    df = polars_service.types.PolarsDfParquetTypeAdapter.validate_python([{"a": 1}, {"a": 2}])
+    assert df.to_dicts() == [{"a": 1}, {"a": 2}]
+
+    with pytest.raises(pydantic.ValidationError):
+        polars_service.types.PolarsDfIpcTypeAdapter.validate_python("not base64!")
+
+
+def test_accepts_json_df_inputs():
+    for adapter_i in [
+        polars_service.types.PolarsDfIpcTypeAdapter,
+        polars_service.types.PolarsLazyDfParquetTypeAdapter,
+    ]:
+        for raw_json_i in ['[{"a": 1}, {"a": 2}]', '{"a": [1, 2]}']:
+            df = adapter_i.validate_json(raw_json_i)
+            if isinstance(df, pl.LazyFrame):
+                df = df.collect()
+            assert df.to_dicts() == [{"a": 1}, {"a": 2}]
+
+    with pytest.raises(pydantic.ValidationError):
+        polars_service.types.PolarsDfIpcTypeAdapter.validate_json('"not base64!"')
+
+
+def test_json_schema():
+    json_schema = polars_service.types.PolarsDfParquetTypeAdapter.json_schema()
+    assert json_schema["contentEncoding"] == "base64"
+    assert json_schema["contentMediaType"] == "application/vnd.apache.parquet"
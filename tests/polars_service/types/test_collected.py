@@ -1,3 +1,5 @@
+import json
+import typing as t
 import polars as pl
 
 from spice_rack import polars_service, bases
@@ -45,3 +47,21 @@ def test_model_dump_json(sample_df, sample_df_json_dumped):
     dumped = obj.model_dump(mode="json")
     assert isinstance(dumped, list)
     assert dumped == sample_df_json_dumped
+
+
+def test_model_dump_json_str(sample_df, sample_df_json_dumped):
+    obj = _FakeModel.model_validate(sample_df)
+    assert json.loads(obj.model_dump_json()) == sample_df_json_dumped
+
+
+def test_model_dump_json_str_nested(sample_df, sample_df_json_dumped):
+    class _Outer(bases.ValueModelBase):
+        name: str
+        dfs: t.List[polars_service.types.PolarsDfT]
+
+    obj = _Outer(name="__spice_rack_raw_json_", dfs=[sample_df, sample_df.head(1)])
+    assert json.loads(obj.model_dump_json(indent=2)) == {
+        "name": "__spice_rack_raw_json_",
+        "dfs": [sample_df_json_dumped, sample_df_json_dumped[:1]],
+    }
+    assert obj.model_dump(mode="json")["dfs"][0] == sample_df_json_dumped
@@ -1,3 +1,6 @@
+import json
+import typing as t
+import pydantic
 import polars as pl
 
 from spice_rack import polars_service, bases
@@ -45,3 +48,55 @@ def test_model_dump_json(sample_df, sample_df_json_dumped):
     dumped = obj.model_dump(mode="json")
     assert isinstance(dumped, list)
     assert dumped[:3] == sample_df_json_dumped[:3]
+
+
+class _CountingPlan:
+    """a LazyFrame whose plan counts how often it runs"""
+    def __init__(self, sample_df: pl.DataFrame):
+        self.num_runs = 0
+        self.lazy_df = sample_df.lazy().map_batches(self._count)
+
+    def _count(self, df: pl.DataFrame) -> pl.DataFrame:
+        self.num_runs += 1
+        return df
+
+
+def test_peek_runs_plan_once(sample_df, sample_df_json_dumped):
+    plan = _CountingPlan(sample_df)
+    obj = _FakeModel.model_validate(plan.lazy_df)
+    for _ in range(3):
+        assert obj.model_dump(mode="json") == sample_df_json_dumped[:3]
+    assert plan.num_runs == 1
+
+
+def test_configured_strategies(sample_df, sample_df_json_dumped):
+    class _Job(bases.ValueModelBase):
+        preview: t.Annotated[
+            polars_service.types.PolarsLazyDfT, polars_service.types.LazyDfSerialization("peek", num_rows=1)
+        ]
+        columns: t.Annotated[
+            polars_service.types.PolarsLazyDfT, polars_service.types.LazyDfSerialization("schema")
+        ]
+        query: t.Annotated[
+            polars_service.types.PolarsLazyDfT, polars_service.types.LazyDfSerialization("plan")
+        ]
+
+    plan = _CountingPlan(sample_df)
+    job = _Job(preview=sample_df, columns=plan.lazy_df, query=sample_df.lazy().filter(pl.col("a") > 1))
+    dumped = job.model_dump(mode="json")
+    assert dumped["preview"] == sample_df_json_dumped[:1]
+    assert dumped["columns"] == {
+        "a": "Int64",
+        "b": "String",
+        "c": "List(Int64)",
+        "d": "Datetime(time_unit='us', time_zone=None)",
+    }
+    assert plan.num_runs == 0
+
+    # only the plan strategy roundtrips, the peek and schema are lossy
+    query_adapter = pydantic.TypeAdapter(_Job.model_fields["query"].rebuild_annotation())
+    for loaded_i in [
+        query_adapter.validate_python(dumped["query"]),
+        query_adapter.validate_json(json.dumps(json.loads(job.model_dump_json())["query"])),
+    ]:
+        assert loaded_i.collect().get_column("a").to_list() == [2, 3]
@@ -0,0 +1,131 @@
+import datetime as dt
+import typing as t
+import pytest
+import pydantic
+import polars as pl
+
+from spice_rack import polars_service, bases
+
+
+class _Trade(bases.ValueModelBase):
+    symbol: str = pydantic.Field(max_length=4)
+    price: float = pydantic.Field(gt=0)
+    side: t.Literal["buy", "sell"] = "buy"
+    ts: dt.datetime
+    tags: t.Optional[t.List[str]] = None
+
+
+class _Batch(bases.ValueModelBase):
+    trades: polars_service.types.PolarsSchemaDfT[_Trade]
+
+
+_TS = dt.datetime(2024, 1, 2, 3, 4, 5, 600_000)
+
+
+@pytest.fixture(scope="function")
+def rows() -> t.List[t.Dict[str, t.Any]]:
+    return [
+        {"symbol": "ABC", "price": 1.5, "side": "sell", "ts": _TS, "tags": ["x"]},
+        {"symbol": "DE", "price": 2.0, "ts": _TS, "extra": 1},
+    ]
+
+
+def test_schema_derived():
+    annotation = polars_service.types.PolarsDfSchema(_Trade)
+    assert annotation.get_polars_schema() == {
+        "symbol": pl.Utf8,
+        "price": pl.Float64,
+        "side": pl.Utf8,
+        "ts": pl.Datetime("us"),
+        "tags": pl.List(pl.Utf8),
+    }
+
+
+def test_parse_rows(rows):
+    df = _Batch(trades=rows).trades
+    assert df.schema == polars_service.types.PolarsDfSchema(_Trade).get_polars_schema()
+    assert df.get_column("side").to_list() == ["sell", "buy"]
+    assert df.get_column("ts").to_list() == [_TS, _TS]
+    assert df.get_column("tags").to_list() == [["x"], None]
+
+
+def test_parse_columnar_and_df(rows):
+    columns = {"symbol": ["ABC"], "price": [1], "ts": [_TS]}
+    from_columns = _Batch(trades=columns).trades
+    assert from_columns.get_column("price").dtype == pl.Float64
+    assert from_columns.get_column("side").to_list() == ["buy"]
+
+    from_df = _Batch(trades=pl.DataFrame(columns).lazy()).trades
+    assert from_df.equals(from_columns)
+
+
+def test_json_roundtrip(rows):
+    batch = _Batch(trades=rows)
+    loaded = _Batch.model_validate_json(batch.model_dump_json())
+    assert loaded.trades.equals(batch.trades)
+    assert _Batch.model_validate(batch.model_dump(mode="json")).trades.equals(batch.trades)
+
+
+@pytest.mark.parametrize(
+    "override, issue",
+    [
+        ({"price": -1.0}, "'price' must be > 0"),
+        ({"symbol": "TOOLONG"}, "'symbol' must be at most 4 long"),
+        ({"side": "hold"}, "'side' must be one of"),
+        ({"symbol": None}, "'symbol' must be not null"),
+        ({"price": "x"}, "unable to build"),
+    ]
+)
+def test_invalid_rows(rows, override, issue):
+    rows[1].update(override)
+    with pytest.raises(pydantic.ValidationError, match=issue) as exc_info:
+        _Batch(trades=rows)
+    if "must be" in issue:
+        assert "1 of 2 rows aren't, the first is row 1" in str(exc_info.value)
+
+
+def test_missing_required_column():
+    with pytest.raises(pydantic.ValidationError, match="column 'ts' is required"):
+        _Batch(trades={"symbol": ["A"], "price": [1.0]})
+
+
+def test_unsupported_field():
+    class _Unsupported(bases.ValueModelBase):
+        payload: t.Dict[str, int]
+
+    with pytest.raises(TypeError, match="_Unsupported.payload"):
+        pydantic.TypeAdapter(polars_service.types.PolarsSchemaDfT[_Unsupported])
+
+
+def test_json_schema():
+    schema = _Batch.model_json_schema()
+    assert schema["properties"]["trades"]["type"] == "array"
+
+
+def test_temporal_columns():
+    class _Event(bases.ValueModelBase):
+        day: t.Optional[dt.date]
+        ts: dt.datetime
+
+    adapter = pydantic.TypeAdapter(polars_service.types.PolarsSchemaDfT[_Event])
+    aware = _TS.replace(tzinfo=dt.timezone(dt.timedelta(hours=1)))
+    df = adapter.validate_python({"day": [dt.date(2024, 1, 2), None], "ts": [aware, aware]})
+    assert df.get_column("day").to_list() == [dt.date(2024, 1, 2), None]
+    assert df.get_column("ts").to_list() == [_TS - dt.timedelta(hours=1)] * 2
+
+    df = adapter.validate_python([{"day": "2024-01-02", "ts": "2024-01-02T03:04:05.6"}])
+    assert df.row(0) == (dt.date(2024, 1, 2), _TS)
+
+
+def test_optional_annotations():
+    class _Optionals(bases.ValueModelBase):
+        plain: int
+        typing_optional: t.Optional[int] = None
+        typing_union: t.Union[None, str] = None
+
+    assert polars_service.types.PolarsDfSchema(_Optionals).get_polars_schema() == {
+        "plain": pl.Int64, "typing_optional": pl.Int64, "typing_union": pl.Utf8
+    }
+    assert [col_i.nullable for col_i in polars_service.types.PolarsDfSchema(_Optionals).columns] == [
+        False, True, True
+    ]